@@ -1,11 +1,16 @@
 """Apply merge decisions and generate the final merged dataset."""
 
+import argparse
 import json
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 
+from columnar import check_parquet, export_merged_parquet
+from frames import CODECS, FramedWriter, check_codec
+from models import load_entry
+
 
 @dataclass
 class MergedWord:
@@ -25,14 +30,22 @@ class MergedWord:
 class MergeApplier:
     """Applies merge decisions to create the final merged dataset."""
 
-    def __init__(self, data_dir: str = "../data"):
+    def __init__(self, data_dir: str = "../data", compression: tuple[str, ...] = (),
+                 parquet: bool = False):
         self.data_dir = Path(data_dir)
+        for codec in compression:
+            check_codec(codec)
+        if parquet:
+            check_parquet()
+        self.compression = compression  # Also write the JSONL exports compressed in frames
+        self.parquet = parquet  # Also export dictionary_merged.parquet
         self.raw_dir = self.data_dir / "raw"
         self.merged_dir = self.data_dir / "merged"
         self.processing_dir = self.data_dir / "processing"
         self.entries: list[dict] = []
         self.decisions: dict = {}
         self.merged_words: list[MergedWord] = []
+        self.group_keys: dict[str, str] = {}  # Word id -> normalized key its group is sorted by
 
     def load_entries(self, filename: str = "dictionary.jsonl"):
         """Load all dictionary entries."""
@@ -41,7 +54,7 @@ class MergeApplier:
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 if line.strip():
-                    self.entries.append(json.loads(line))
+                    self.entries.append(load_entry(line))
         print(f"Loaded {len(self.entries)} entries")
 
     def load_decisions(self, filename: str = "merge_decisions.json"):
@@ -160,16 +173,34 @@ class MergeApplier:
                 entries=entries
             )
             self.merged_words.append(merged)
+            self.group_keys[merged.id] = norm_key
             word_id += 1
 
         print(f"Created {len(self.merged_words)} merged word groups")
 
+    def write_jsonl(self, filepath: Path):
+        """Write the merged words to `filepath`, and to its framed compressed copies.
+
+        Frames are keyed by the first letter of the normalized key the words
+        are sorted by, so each letter's words are contiguous. The canonical
+        spelling's letter is not: 'ya' sorts with 'ga', and 'ãs' with 'âr'.
+        """
+        framed = [FramedWriter(filepath.with_name(filepath.name + CODECS[codec]), codec)
+                  for codec in self.compression]
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for word in self.merged_words:
+                line = word.to_json() + '\n'
+                f.write(line)
+                for writer in framed:
+                    writer.write(line, self.group_keys[word.id][:1])
+        for writer in framed:
+            writer.close()
+            print(f"Compressed to {writer.path} ({len(writer.frames)} frames)")
+
     def export_jsonl(self, filename: str = "dictionary_merged.jsonl"):
         """Export merged words to JSONL."""
         filepath = self.merged_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for word in self.merged_words:
-                f.write(word.to_json() + '\n')
+        self.write_jsonl(filepath)
         print(f"Exported {len(self.merged_words)} merged words to {filepath}")
 
     def export_json(self, filename: str = "dictionary_merged.json"):
@@ -195,12 +226,16 @@ class MergeApplier:
 
         print(f"Exported to {filepath}")
 
+    def export_parquet(self, filename: str = "dictionary_merged.parquet"):
+        """Export merged words to Parquet, with list columns for variants and entries."""
+        filepath = self.merged_dir / filename
+        count = export_merged_parquet(self.merged_words, filepath)
+        print(f"Exported {count} merged words to {filepath}")
+
     def export_final(self, filename: str = "aromanian_dictionary.jsonl"):
         """Export final dictionary to data root for easy access."""
         filepath = self.data_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for word in self.merged_words:
-                f.write(word.to_json() + '\n')
+        self.write_jsonl(filepath)
         print(f"Exported final dictionary to {filepath}")
 
     def print_stats(self):
@@ -226,12 +261,24 @@ class MergeApplier:
 
 def main():
     """Apply merges and generate final dataset."""
-    applier = MergeApplier()
+    parser = argparse.ArgumentParser(description="Apply merge decisions and export the merged dictionary")
+    parser.add_argument('--compress', nargs='+', choices=CODECS, default=[],
+                        help='Also write the JSONL exports compressed in seekable frames (frames.py)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also export dictionary_merged.parquet for columnar analytics (columnar.py)')
+    args = parser.parse_args()
+
+    try:
+        applier = MergeApplier(compression=tuple(args.compress), parquet=args.parquet)
+    except ValueError as e:
+        parser.error(str(e))
     applier.load_entries()
     applier.load_decisions()
     applier.apply_merges()
     applier.export_jsonl()
     applier.export_json()
+    if applier.parquet:
+        applier.export_parquet()
     applier.export_final()
     applier.print_stats()
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the entry loaders.
+
+Writes a synthetic dictionary.jsonl of each requested size, then loads it
+in a fresh process per loader and reports how much the process grew (peak
+RSS after loading minus before):
+
+    json.loads              one json.loads per line, what the loaders used to do
+    models.loads            one models.loads per line: orjson if installed,
+                            else json.loads, without interning
+    DictionaryMerger        merger.py's load_entries
+    MergeApplier            apply_merges.py's load_entries
+    MergeReviewer           review_merges.py's load_entries (indexed by headword)
+
+The three loaders parse with models.loads and intern the strings entries
+repeat (headword, part of speech, context, source, source_url). Growth is
+reported relative to models.loads, so the loaders' figure is what interning
+saves on its own, and the json.loads one is what the parser accounts for.
+The entries mimic a crawl: one to three articles per results page sharing
+its source_url, each headword defined by one or two sources.
+
+Usage:
+    python bench_memory.py                     # 50k and 1M entries
+    python bench_memory.py --entries 200000
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from apply_merges import MergeApplier
+from merger import DictionaryMerger
+from models import ORJSON_AVAILABLE, DictionaryEntry, loads
+from parser import source_url
+from review_merges import MergeReviewer
+from standin_server import PARTS_OF_SPEECH, SOURCES, SYLLABLES, TEXT_WORDS
+
+
+ENTRY_COUNTS = (50_000, 1_000_000)
+LOADERS = ("json.loads", "models.loads", "DictionaryMerger", "MergeApplier", "MergeReviewer")
+BASELINE_LOADER = "models.loads"
+
+
+def write_entries(path: Path, count: int, seed: int = 0):
+    """Write `count` crawl-like entries to `path`."""
+    rng = random.Random(seed)
+
+    def text(n: int) -> str:
+        return ' '.join(rng.choice(TEXT_WORDS) for _ in range(n))
+
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < count:
+            query = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) + str(written)
+            url = source_url(query)
+            for headword in [query] * rng.randint(1, 2) + [f"{query}i"] * rng.randint(0, 1):
+                entry = DictionaryEntry(
+                    headword=headword, pronunciation=f"({headword}-{rng.choice(SYLLABLES)})",
+                    part_of_speech=rng.choice(PARTS_OF_SPEECH), definition=text(rng.randint(5, 15)),
+                    translation_ro=text(2), translation_en=text(2), translation_fr=text(2),
+                    context=rng.choice([None, "arhit.", "fig.", "bot."]),
+                    examples=[text(4) for _ in range(rng.randint(0, 3))],
+                    expressions=[text(3)] if rng.random() < 0.5 else [],
+                    source=rng.choice(SOURCES), source_url=url)
+                f.write(entry.to_json() + '\n')
+                written += 1
+
+
+def load(loader: str, data_dir: Path) -> int:
+    """Load the entries in `data_dir` with `loader`; returns the growth in KiB."""
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if loader in ("json.loads", "models.loads"):
+        parse = json.loads if loader == "json.loads" else loads
+        with open(data_dir / "raw" / "dictionary.jsonl", 'r', encoding='utf-8') as f:
+            entries = [parse(line) for line in f if line.strip()]
+    else:
+        loader_class = {"DictionaryMerger": DictionaryMerger, "MergeApplier": MergeApplier,
+                        "MergeReviewer": MergeReviewer}[loader]
+        instance = loader_class(str(data_dir))
+        instance.load_entries()
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RSS of loading the dictionary with each loader")
+    parser.add_argument('--entries', type=int, nargs='+', default=ENTRY_COUNTS,
+                        help='Dictionary sizes to measure (default: 50000 1000000)')
+    parser.add_argument('--load', nargs=2, metavar=('LOADER', 'DATA_DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load:
+        # Measurement subprocess: report on the last line of stdout
+        print(load(args.load[0], Path(args.load[1])))
+        return
+
+    print(f"models.loads parses with {'orjson' if ORJSON_AVAILABLE else 'json.loads (orjson is not installed)'}")
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        (data_dir / "raw").mkdir()
+        for count in args.entries:
+            path = data_dir / "raw" / "dictionary.jsonl"
+            write_entries(path, count)
+            print(f"\n{count} entries ({path.stat().st_size / 1e6:.0f} MB of JSONL), "
+                  f"growth relative to {BASELINE_LOADER}")
+            grown = {}
+            for loader in LOADERS:
+                result = subprocess.run([sys.executable, __file__, '--load', loader, str(data_dir)],
+                                        capture_output=True, text=True, check=True)
+                grown[loader] = int(result.stdout.split()[-1])
+            for loader, kib in grown.items():
+                print(f"  {loader:<18} {kib / 1024:>8.1f} MiB  {kib * 1024 / count:>6.0f} B/entry"
+                      f"  {kib / grown[BASELINE_LOADER] - 1:>+6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the parser functions, over a recorded HTML corpus.
+
+Benchmarks parse_letter_index, get_word_count_from_index,
+parse_search_results, split_on_semicolon_outside_parens and clean_text on:
+
+1. The recorded corpus in bench_corpus/: letter index pages in index/ and
+   search results pages in results/, one file per page, named after the
+   letter or the query word. The text functions get the text of every
+   article paragraph in the result pages.
+2. Synthetic pages larger than any in the corpus (a letter index of
+   --large-words words, a results page of --large-articles articles), so
+   that anything worse than linear in page size stands out.
+
+For each benchmark it reports pages (or calls) per second, taking the best
+of --repeat runs, and the memory allocated per page: the peak traced by
+tracemalloc while parsing it, on top of the page itself. That is Python
+objects only; tracemalloc doesn't see the C trees lxml builds.
+
+The results are compared with bench_parser_baseline.json. A benchmark that
+got slower, or allocates more, by more than --tolerance (20% by default)
+fails the run with exit status 1. Timings depend on the machine, so save a
+baseline on the machine you compare on before changing the parser:
+
+    python bench_parser.py --save-baseline     # Before the change
+    python bench_parser.py                     # After it
+
+--record rebuilds the corpus from a crawl's response cache, falling back to
+the stand-in site for the page types the cache has none of. verify_parser.py
+checks the parser against expected output recorded for these pages, so
+record that for the new pages too (verify_parser.py --update).
+
+Usage:
+    python bench_parser.py                     # Run and compare with the baseline
+    python bench_parser.py --only parse_search_results --repeat 10
+    python bench_parser.py --save-baseline
+    python bench_parser.py --record --cache-dir ../data/cache
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from lxml import etree
+
+from cache import CACHE_DIR, ResponseCache
+from parser import (clean_text, get_word_count_from_index, parse_letter_index,
+                    parse_search_results, split_on_semicolon_outside_parens)
+from standin_server import SyntheticSite
+
+
+CORPUS_DIR = Path(__file__).with_name("bench_corpus")
+BASELINE_FILE = Path(__file__).with_name("bench_parser_baseline.json")
+REPEAT = 5
+MIN_RUN_TIME = 0.2  # Seconds
+TOLERANCE = 0.2  # Allowed slowdown or allocation growth before a benchmark fails
+LARGE_WORDS = 5000  # About the size of the biggest real letter index
+LARGE_ARTICLES = 200
+RECORD_INDEX_PAGES = 3
+RECORD_RESULT_PAGES = 60
+
+
+def load_corpus(corpus_dir: Path = CORPUS_DIR) -> tuple[list[str], list[tuple[str, str]]]:
+    """Index pages and (results page, query word) pairs of the recorded corpus."""
+    index = [path.read_text(encoding='utf-8') for path in sorted((corpus_dir / "index").glob("*.html"))]
+    results = [(path.read_text(encoding='utf-8'), unquote(path.stem))
+               for path in sorted((corpus_dir / "results").glob("*.html"))]
+    return index, results
+
+
+def paragraph_texts(pages: list[tuple[str, str]]) -> list[str]:
+    """The text of every article paragraph in the results pages."""
+    texts = []
+    for html, _ in pages:
+        tree = etree.HTML(html)
+        if tree is not None:
+            texts.extend(''.join(p.itertext()) for p in tree.iterfind('.//article//p'))
+    return texts
+
+
+def large_index_page(words: int) -> str:
+    site = SyntheticSite(words_per_letter=words, letters='a')
+    return site.index_page('a')
+
+
+def large_results_page(articles: int) -> tuple[str, str]:
+    """A results page listing `articles` articles, with the query word."""
+    site = SyntheticSite(words_per_letter=articles, letters='a')
+    headwords = site.words['a']
+    body = '\n'.join(site.articles(headword)[0] for headword in headwords)
+    return site._page(headwords[0], f"Rezultate ti: {headwords[0]}", body), headwords[0]
+
+
+def benchmarks(corpus_dir: Path, large_words: int, large_articles: int) -> list[tuple[str, str, Callable, list]]:
+    """(name, unit, function, argument tuples) of every benchmark."""
+    index, results = load_corpus(corpus_dir)
+    if not index or not results:
+        sys.exit(f"No corpus in {corpus_dir}, create one with --record")
+    texts = paragraph_texts(results)
+    large_index = large_index_page(large_words)
+    large_results = large_results_page(large_articles)
+    return [
+        ("parse_letter_index", "pages", parse_letter_index, [(html,) for html in index]),
+        ("get_word_count_from_index", "pages", get_word_count_from_index, [(html,) for html in index]),
+        ("parse_search_results", "pages", parse_search_results, results),
+        ("split_on_semicolon_outside_parens", "calls", split_on_semicolon_outside_parens,
+         [(text,) for text in texts]),
+        ("clean_text", "calls", clean_text, [(text,) for text in texts]),
+        (f"parse_letter_index ({large_words} words)", "pages", parse_letter_index, [(large_index,)]),
+        (f"parse_search_results ({large_articles} articles)", "pages", parse_search_results,
+         [large_results]),
+    ]
+
+
+def measure(func, calls: list, repeat: int) -> dict:
+    """Throughput (best of `repeat` runs) and mean peak allocation per call."""
+    # Fast benchmarks are timed over enough rounds to take about MIN_RUN_TIME
+    start = time.perf_counter()
+    for args in calls:
+        func(*args)
+    rounds = max(1, round(MIN_RUN_TIME / (time.perf_counter() - start)))
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for args in calls:
+                func(*args)
+        best = min(best, (time.perf_counter() - start) / rounds)
+
+    peak = 0
+    tracemalloc.start()
+    for args in calls:
+        gc.collect()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        func(*args)
+        peak += tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+
+    return {
+        "items": len(calls),
+        "per_second": len(calls) / best,
+        "us_per_item": 1e6 * best / len(calls),
+        "alloc_kb_per_item": peak / len(calls) / 1024,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names of the benchmarks that regressed beyond `tolerance`."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        slower = base["per_second"] / result["per_second"] - 1
+        more_memory = result["alloc_kb_per_item"] / base["alloc_kb_per_item"] - 1 \
+            if base["alloc_kb_per_item"] else 0.0
+        if slower > tolerance or more_memory > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def record_corpus(corpus_dir: Path, cache_dir: str, index_pages: int, result_pages: int):
+    """Write a fresh corpus from the response cache, or the stand-in site."""
+    index: dict[str, str] = {}
+    results: dict[str, str] = {}
+    if (Path(cache_dir) / "index.jsonl").exists():
+        cache = ResponseCache(cache_dir)
+        for url in cache.urls():
+            query = parse_qs(urlsplit(url).query)
+            if 'l' in query and len(index) < index_pages:
+                index[query['l'][0]] = cache.get(url)
+            elif 'inputWord' in query and len(results) < result_pages:
+                results[query['inputWord'][0]] = cache.get(url)
+    sources = {"index": "the cache", "results": "the cache"}
+    site = SyntheticSite()
+    if not index:
+        index = {letter: site.index_page(letter) for letter in site.letters[:index_pages]}
+        sources["index"] = "the stand-in site"
+    if not results:
+        words = [word for letter in site.letters for word in site.words[letter][:3]]
+        results = {word: site.search_page(word) for word in words[:result_pages]}
+        sources["results"] = "the stand-in site"
+
+    for kind, pages in (("index", index), ("results", results)):
+        directory = corpus_dir / kind
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in directory.glob("*.html"):
+            path.unlink()
+        for name, html in pages.items():
+            (directory / f"{quote(name, safe='')}.html").write_text(html, encoding='utf-8')
+    print(f"Recorded {len(index)} index pages from {sources['index']} and {len(results)} "
+          f"results pages from {sources['results']} into {corpus_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parser on a recorded HTML corpus")
+    parser.add_argument('--corpus-dir', type=Path, default=CORPUS_DIR,
+                        help=f'Recorded pages to benchmark on (default: {CORPUS_DIR.name})')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE,
+                        help=f'Baseline results to compare with (default: {BASELINE_FILE.name})')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Save the results as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help=f'Slowdown or allocation growth that fails a benchmark (default: {TOLERANCE})')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help=f'Timed runs per benchmark, the best counts (default: {REPEAT})')
+    parser.add_argument('--only', help='Only run benchmarks whose name contains this')
+    parser.add_argument('--large-words', type=int, default=LARGE_WORDS,
+                        help=f'Words on the synthetic letter index (default: {LARGE_WORDS})')
+    parser.add_argument('--large-articles', type=int, default=LARGE_ARTICLES,
+                        help=f'Articles on the synthetic results page (default: {LARGE_ARTICLES})')
+    parser.add_argument('--record', action='store_true',
+                        help='Rebuild the corpus from --cache-dir (or the stand-in site) and exit')
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help=f'Response cache to record the corpus from (default: {CACHE_DIR})')
+    args = parser.parse_args()
+
+    if args.record:
+        record_corpus(args.corpus_dir, args.cache_dir, RECORD_INDEX_PAGES, RECORD_RESULT_PAGES)
+        return
+
+    baseline = {}
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+
+    print(f"{'Benchmark':<36} {'Items':>6} {'Per second':>16} {'us/item':>10} "
+          f"{'KiB/item':>9} {'vs baseline':>12}")
+    results = {}
+    for name, unit, func, calls in benchmarks(args.corpus_dir, args.large_words, args.large_articles):
+        if args.only and args.only not in name:
+            continue
+        result = results[name] = measure(func, calls, args.repeat)
+        change = ""
+        if name in baseline:
+            change = f"{result['per_second'] / baseline[name]['per_second'] - 1:+.0%}"
+        print(f"{name:<36} {result['items']:>6} {result['per_second']:>10.0f} {unit:<5} "
+              f"{result['us_per_item']:>10.1f} {result['alloc_kb_per_item']:>9.1f} {change:>12}")
+
+    if args.save_baseline:
+        saved = json.loads(args.baseline.read_text(encoding='utf-8')) if args.baseline.exists() else {}
+        saved.update(results)
+        args.baseline.write_text(json.dumps(saved, indent=2) + '\n', encoding='utf-8')
+        print(f"\nSaved the baseline to {args.baseline}")
+        return
+
+    if not baseline:
+        print(f"\nNo baseline in {args.baseline}, save one with --save-baseline")
+        return
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressed by more than {args.tolerance:.0%} (speed or allocations):")
+        for name in regressions:
+            print(f"  {name}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the scraper against the local stand-in site.
+
+Starts standin_server.py in a subprocess, crawls it with DictionaryScraper
+into a temporary data directory, and reports:
+
+- words/s and entries scraped
+- p50/p99 request latency, as seen by the HTTP client
+- CPU time of the scraper and its parser processes
+- peak RSS of the scraper and of its largest parser process
+- connections opened and time spent setting them up (TCP + TLS)
+- bytes sent by the server, i.e. on the wire after compression
+- per-stage timings from the scraper's own metrics (parse, write, checkpoint)
+
+--plain-client swaps in an unconfigured httpx.AsyncClient, the way the
+scraper used to build it, to compare against the transport.py profile.
+
+Usage:
+    python benchmark.py                          # 3 letters x 200 words, no throttling
+    python benchmark.py --letters a b --words-per-letter 1000 --concurrency 16
+    python benchmark.py --latency 0.05 --jitter 0.02 --error-rate 0.01
+    python benchmark.py --rate 20 --server-rate 15   # Exercise adaptive rate control
+    python benchmark.py --plain-client           # Baseline without transport.py
+    python benchmark.py --no-compression         # Stand-in sends uncompressed pages
+    python benchmark.py --json results.json      # Also save the results
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from scraper import DictionaryScraper, MAX_CONCURRENT, PARSE_WORKERS
+from standin_server import add_server_arguments, server_argv
+
+
+SERVER_SCRIPT = Path(__file__).with_name("standin_server.py")
+
+
+class LatencyRecorder:
+    """httpx event hooks timing each request up to its response headers,
+    plus a trace of the connections opened along the way."""
+
+    def __init__(self):
+        self.started: dict[int, float] = {}
+        self.latencies: list[float] = []
+        self.statuses: Counter = Counter()
+        self.http_versions: Counter = Counter()
+        self.connections = 0
+        self.connect_time = 0.0
+
+    def tracer(self):
+        setup_started = {}
+
+        async def trace(event: str, info: dict):
+            if event in ("connection.connect_tcp.started", "connection.start_tls.started"):
+                setup_started[event] = time.perf_counter()
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                started = setup_started.pop(event.replace(".complete", ".started"), None)
+                if started is not None:
+                    self.connect_time += time.perf_counter() - started
+                if event == "connection.connect_tcp.complete":
+                    self.connections += 1
+
+        return trace
+
+    async def on_request(self, request: httpx.Request):
+        request.extensions["trace"] = self.tracer()
+        self.started[id(request)] = time.perf_counter()
+
+    async def on_response(self, response: httpx.Response):
+        start = self.started.pop(id(response.request), None)
+        if start is not None:
+            self.latencies.append(time.perf_counter() - start)
+        self.statuses[response.status_code] += 1
+        self.http_versions[response.http_version] += 1
+
+    def install(self, client: httpx.AsyncClient):
+        client.event_hooks['request'].append(self.on_request)
+        client.event_hooks['response'].append(self.on_response)
+
+
+def percentile(values: list[float], pct: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1]
+
+
+def start_server(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    """Launch the stand-in server and return (process, base_url)."""
+    process = subprocess.Popen(
+        [sys.executable, str(SERVER_SCRIPT), '--port', '0', *server_argv(args)],
+        stdout=subprocess.PIPE, text=True, cwd=SERVER_SCRIPT.parent,
+    )
+    line = process.stdout.readline()
+    if not line.startswith("Serving"):
+        process.kill()
+        raise RuntimeError(f"Stand-in server failed to start: {line!r}")
+    return process, line.split()[-1]
+
+
+async def run_crawl(base_url: str, data_dir: str, args: argparse.Namespace) -> dict:
+    recorder = LatencyRecorder()
+    cache_dir = str(Path(data_dir) / "cache") if args.cache else None
+
+    async with DictionaryScraper(concurrency=args.concurrency, rate=args.rate, burst=args.burst,
+                                 cache_dir=cache_dir, parse_workers=args.parse_workers,
+                                 adaptive=not args.fixed_rate, base_url=base_url,
+                                 data_dir=data_dir) as scraper:
+        if args.plain_client:
+            await scraper.client.aclose()
+            scraper.client = httpx.AsyncClient(timeout=30, follow_redirects=True)
+        recorder.install(scraper.client)
+        start = time.perf_counter()
+        await scraper.scrape_letters(args.letters)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "words": len(scraper.scraped_words),
+        "failed": len(scraper.failed_words),
+        "entries": scraper.entries_count,
+        "requests": len(recorder.latencies),
+        "statuses": dict(recorder.statuses),
+        "http_versions": dict(recorder.http_versions),
+        "connections": recorder.connections,
+        "connect_time": recorder.connect_time,
+        "latency_p50": percentile(recorder.latencies, 50),
+        "latency_p99": percentile(recorder.latencies, 99),
+        "rate": scraper.rate.report(),
+        "metrics": scraper.metrics.snapshot(),
+    }
+
+
+def server_stats(base_url: str) -> dict:
+    try:
+        return httpx.get(f"{base_url}/__stats", timeout=5).json()
+    except httpx.HTTPError:
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper against a local stand-in site")
+    parser.add_argument('--letters', nargs='+', default=['a', 'b', 'c'],
+                        help='Letters to crawl (default: a b c)')
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENT,
+                        help=f'Concurrent fetch workers (default: {MAX_CONCURRENT})')
+    parser.add_argument('--parse-workers', type=int, default=PARSE_WORKERS,
+                        help=f'Parser processes (default: {PARSE_WORKERS})')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Starting request rate, 0 = unlimited (default: 0)')
+    parser.add_argument('--burst', type=int, default=5, help='Request burst (default: 5)')
+    parser.add_argument('--fixed-rate', action='store_true', help='Disable adaptive rate control')
+    parser.add_argument('--cache', action='store_true',
+                        help='Write responses to a (temporary) response cache, as real crawls do')
+    parser.add_argument('--plain-client', action='store_true',
+                        help='Use a default httpx.AsyncClient instead of transport.create_client')
+    parser.add_argument('--json', metavar='PATH', help='Also write the results to a JSON file')
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    args.letters = [l.lower() for l in args.letters]
+
+    process, base_url = start_server(args)
+    try:
+        cpu_before = time.process_time()
+        with tempfile.TemporaryDirectory(prefix="scraper-bench-") as data_dir:
+            results = asyncio.run(run_crawl(base_url, data_dir, args))
+        results["cpu_scraper"] = time.process_time() - cpu_before
+        # Parser processes have been joined by now, so they show up here
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        results["cpu_parsers"] = children.ru_utime + children.ru_stime
+        results["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        results["peak_rss_parser_mb"] = children.ru_maxrss / 1024
+        results["server"] = server_stats(base_url)
+    finally:
+        process.terminate()
+        process.wait()
+
+    words_per_second = results["words"] / results["elapsed"] if results["elapsed"] else 0.0
+    results["words_per_second"] = words_per_second
+    server = results["server"]
+
+    print("\n" + "=" * 60)
+    print("Benchmark results")
+    print("=" * 60)
+    print(f"Words scraped:     {results['words']} ({results['failed']} failed), {results['entries']} entries")
+    print(f"Elapsed:           {results['elapsed']:.2f}s")
+    print(f"Throughput:        {words_per_second:.1f} words/s")
+    print(f"Requests:          {results['requests']} {results['statuses']} {results['http_versions']}")
+    print(f"Latency:           p50 {results['latency_p50'] * 1000:.1f} ms, "
+          f"p99 {results['latency_p99'] * 1000:.1f} ms")
+    print(f"Connections:       {results['connections']} opened, "
+          f"{results['connect_time'] * 1000:.1f} ms spent connecting")
+    print(f"CPU time:          {results['cpu_scraper']:.2f}s scraper, {results['cpu_parsers']:.2f}s parsers")
+    print(f"Peak RSS:          {results['peak_rss_mb']:.1f} MB scraper, "
+          f"{results['peak_rss_parser_mb']:.1f} MB largest parser")
+    if server:
+        print(f"Server:            {server['connections']} connections accepted, "
+              f"{server['bytes_sent'] / 1e6:.2f} MB on the wire, {server['throttled']} throttled, "
+              f"{server['errors']} errors injected")
+    histograms = results["metrics"]["histograms"]
+    for name, label in (("parse_seconds", "Parse"), ("write_seconds", "Write"),
+                        ("checkpoint_seconds", "Checkpoint"), ("rate_wait_seconds", "Rate wait")):
+        stats = histograms[name]
+        print(f"{label + ':':<19}{stats['count']} x, mean {stats['mean'] * 1000:.2f} ms, "
+              f"p99 {stats['p99'] * 1000:.2f} ms, total {stats['sum']:.2f}s")
+    print(results["rate"])
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Content-addressed on-disk cache of fetched HTML pages.
+
+Layout of the cache directory:
+
+    index.jsonl            one {"url", "sha256", "fetched_at"} record per fetch,
+                           plus "etag"/"last_modified" when the server sent
+                           them; the last record for a URL wins
+    objects/ab/abcdef...gz gzip-compressed page bodies, named by the sha256
+                           of the uncompressed body
+    baseline.jsonl         snapshot of the index taken when an incremental
+                           crawl starts (same record format)
+
+Identical pages are stored once, and a re-fetch that returns the same body
+only appends an index record. The stored validators let incremental crawls
+send conditional requests.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+
+CACHE_DIR = "../data/cache"
+VALIDATORS = ('etag', 'last_modified')
+INDEX_FILE = "index.jsonl"
+BASELINE_FILE = "baseline.jsonl"
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a URL is not in the cache."""
+
+
+class ResponseCache:
+    """Persistent HTML response cache keyed by URL."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, index_file: str = INDEX_FILE):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / index_file
+        self.index: dict[str, str] = {}
+        self.validators: dict[str, dict[str, str]] = {}
+        self._index_file = None
+        self.load_index()
+
+    def load_index(self):
+        """Read the URL index, keeping the latest digest for each URL."""
+        self.index = {}
+        self.validators = {}
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final line from an interrupted run
+                        continue
+                    self.index[record['url']] = record['sha256']
+                    validators = {key: record[key] for key in VALIDATORS if record.get(key)}
+                    if validators:
+                        self.validators[record['url']] = validators
+                    else:
+                        self.validators.pop(record['url'], None)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def urls(self) -> list[str]:
+        """Return all cached URLs."""
+        return list(self.index)
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.gz"
+
+    def get(self, url: str) -> str | None:
+        """Return the cached body for `url`, or None if it was never fetched."""
+        digest = self.index.get(url)
+        if digest is None:
+            return None
+        return self.read_object(digest)
+
+    def read_object(self, digest: str) -> str:
+        """Return the body stored under `digest`."""
+        with open(self.object_path(digest), 'rb') as f:
+            return gzip.decompress(f.read()).decode('utf-8')
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """If-None-Match/If-Modified-Since headers for re-fetching `url`."""
+        validators = self.validators.get(url, {})
+        headers = {}
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def put(self, url: str, body: str, etag: str | None = None,
+            last_modified: str | None = None) -> str:
+        """Store `body` as the latest response for `url` and return its digest.
+
+        `etag` and `last_modified` are the response's validators, if any.
+        """
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(data, mtime=0))
+            os.replace(tmp_path, path)
+
+        validators = {key: value for key, value in
+                      (('etag', etag), ('last_modified', last_modified)) if value}
+        if self.index.get(url) != digest or self.validators.get(url, {}) != validators:
+            self.index[url] = digest
+            record = {
+                "url": url,
+                "sha256": digest,
+                "fetched_at": datetime.utcnow().isoformat(),
+            }
+            if validators:
+                self.validators[url] = validators
+                record.update(validators)
+            else:
+                self.validators.pop(url, None)
+            self._append_index(record)
+
+        return digest
+
+    def snapshot(self, index_file: str = BASELINE_FILE) -> "ResponseCache":
+        """Freeze the current index (one record per URL) under `index_file`.
+
+        Returns the snapshot as a read-only cache sharing this cache's objects.
+        """
+        path = self.cache_dir / index_file
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for url, digest in self.index.items():
+                record = {"url": url, "sha256": digest, **self.validators.get(url, {})}
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, path)
+        return ResponseCache(self.cache_dir, index_file)
+
+    def _append_index(self, record: dict):
+        if self._index_file is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._index_file = open(self.index_path, 'a', encoding='utf-8')
+        self._index_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._index_file.flush()
+
+    def close(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
@@ -125,9 +125,7 @@ def main():
 
     # Export
     exporter = DictionaryExporter()
-    exporter.export_json(entry_objects, 'dictionary_clean.json')
-    exporter.export_jsonl(entry_objects, 'dictionary_clean.jsonl')
-    exporter.export_csv(entry_objects, 'dictionary_clean.csv')
+    exporter.export_all(entry_objects, 'dictionary_clean')
 
     print(f"\nDone! Final count: {len(entry_objects)} entries")
 
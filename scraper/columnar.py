@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Columnar (Parquet) exports of the dictionary, and analytics over them.
+
+Two tables, written in row groups of ROW_GROUP_SIZE so memory stays flat:
+
+    dictionary.parquet          one row per DictionaryEntry; examples,
+                                expressions and related_terms are list<string>
+    dictionary_merged.parquet   one row per MergedWord: id, canonical,
+                                variants (list<string>) and entries
+                                (list<struct> of the entry columns)
+
+Empty strings are stored as nulls and empty lists as empty lists, which is
+what the JSONL's omitted fields mean.
+
+Field coverage, part-of-speech distribution and source overlap then come
+from whole-column Arrow compute kernels instead of json.loads'ing every
+line into a dict, and a query reads only the columns it uses from disk.
+
+With --jsonl, the Parquet file is checked against the JSONL export it was
+written with: every row must read back as the same record, and the stats
+must come out the same computed either way (both are timed). A mismatch
+makes the script exit with status 1.
+
+    python columnar.py ../data/dictionary.parquet
+    python columnar.py ../data/dictionary.parquet --jsonl ../data/dictionary.jsonl
+    python columnar.py ../data/merged/dictionary_merged.parquet --jsonl ../data/merged/dictionary_merged.jsonl
+
+Needs the pyarrow package; everything else works without it.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+from models import FIELDS, LIST_FIELDS, DictionaryEntry, loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+ROW_GROUP_SIZE = 50_000
+READ_BATCH_SIZE = 4096  # Rows converted to Python records at a time
+PARQUET_COMPRESSION = 'zstd'
+
+
+def check_parquet():
+    """Raise ValueError if Parquet can't be written in this environment."""
+    if not PARQUET_AVAILABLE:
+        raise ValueError("Parquet export needs the pyarrow package")
+
+
+def entry_fields() -> list["pa.Field"]:
+    """Arrow fields of an entry: strings, and list<string> for the list fields."""
+    return [pa.field(name, pa.list_(pa.string()) if name in LIST_FIELDS else pa.string())
+            for name in FIELDS]
+
+
+def entry_schema() -> "pa.Schema":
+    return pa.schema(entry_fields())
+
+
+def merged_schema() -> "pa.Schema":
+    return pa.schema([
+        pa.field('id', pa.string()),
+        pa.field('canonical', pa.string()),
+        pa.field('variants', pa.list_(pa.string())),
+        pa.field('entries', pa.list_(pa.struct(entry_fields()))),
+    ])
+
+
+def entry_row(entry: dict) -> dict:
+    """Column values of an entry dict (as loaded from JSONL or held by a MergedWord)."""
+    row = {}
+    for name in FIELDS:
+        value = entry.get(name)
+        if name in LIST_FIELDS:
+            row[name] = value or []
+        else:
+            row[name] = value if value != "" else None
+    return row
+
+
+class ParquetFile:
+    """A Parquet file written a row group at a time."""
+
+    def __init__(self, path: str | Path, schema: "pa.Schema", row_group_size: int = ROW_GROUP_SIZE):
+        check_parquet()
+        self.path = Path(path)
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._columns: dict[str, list] = {name: [] for name in schema.names}
+        self._buffered = 0
+        self._writer = pq.ParquetWriter(str(self.path), schema, compression=PARQUET_COMPRESSION)
+
+    def write(self, row: dict):
+        for name, column in self._columns.items():
+            column.append(row[name])
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffered:
+            self._writer.write_table(pa.Table.from_pydict(self._columns, schema=self.schema))
+            self.count += self._buffered
+            self._columns = {name: [] for name in self.schema.names}
+            self._buffered = 0
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+class EntryParquetFile(ParquetFile):
+    """dictionary.parquet: one row per DictionaryEntry."""
+
+    def __init__(self, path: str | Path, row_group_size: int = ROW_GROUP_SIZE):
+        super().__init__(path, entry_schema(), row_group_size)
+
+    def write_entry(self, entry: DictionaryEntry):
+        self.write(entry_row(entry.to_dict()))
+
+
+def export_merged_parquet(words: Iterable, path: str | Path, row_group_size: int = ROW_GROUP_SIZE) -> int:
+    """Write MergedWord groups to `path`; returns the number of words."""
+    parquet_file = ParquetFile(path, merged_schema(), row_group_size)
+    try:
+        for word in words:
+            parquet_file.write({
+                'id': word.id,
+                'canonical': word.canonical,
+                'variants': list(word.variants),
+                'entries': [entry_row(entry) for entry in word.entries],
+            })
+    finally:
+        parquet_file.close()
+    return parquet_file.count
+
+
+def entry_record(row: dict) -> dict:
+    """The entry dict a row was written from: entry_row's inverse."""
+    return {name: value for name, value in row.items() if value is not None and value != []}
+
+
+def read_records(path: str | Path) -> Iterable[dict]:
+    """The records of a Parquet export, as they appear in its JSONL counterpart."""
+    parquet_file = pq.ParquetFile(str(path))
+    merged = 'canonical' in parquet_file.schema_arrow.names
+    for batch in parquet_file.iter_batches(batch_size=READ_BATCH_SIZE):
+        for row in batch.to_pylist():
+            if merged:
+                row['entries'] = [entry_record(entry) for entry in row['entries']]
+                yield row
+            else:
+                yield entry_record(row)
+
+
+def jsonl_records(path: str | Path) -> Iterable[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def compare_records(path: str | Path, jsonl_path: str | Path) -> int:
+    """Count the records of a Parquet export that differ from the JSONL's.
+
+    Both files are streamed side by side; the first difference is printed.
+    """
+    mismatches = 0
+    missing = object()
+    pairs = itertools.zip_longest(read_records(path), jsonl_records(jsonl_path), fillvalue=missing)
+    for index, (record, expected) in enumerate(pairs):
+        if record == expected:
+            continue
+        mismatches += 1
+        if mismatches > 1:
+            continue
+        if record is missing:
+            print(f"Row {index} and after are missing from {path}")
+        elif expected is missing:
+            print(f"Row {index} and after are missing from {jsonl_path}")
+        else:
+            print(f"Row {index} differs:\n  jsonl:   {expected}\n  parquet: {record}")
+    return mismatches
+
+
+def _percent(count: int, total: int) -> str:
+    return f"{count} ({100 * count / total:.1f}%)" if total else "0"
+
+
+def _non_empty(column) -> int:
+    """Rows of a column holding a value: non-null, and non-empty for lists."""
+    if pa.types.is_list(column.type):
+        return pc.sum(pc.greater(pc.list_value_length(column), 0)).as_py() or 0
+    return len(column) - column.null_count
+
+
+def entry_stats(path: str | Path) -> dict:
+    """Coverage of every field, part-of-speech and source counts, and source overlap."""
+    table = pq.read_table(str(path))
+    stats = {
+        "entries": table.num_rows,
+        "coverage": {name: _non_empty(table[name]) for name in FIELDS},
+        "part_of_speech": {row['values']: row['counts']
+                           for row in pc.value_counts(table['part_of_speech']).to_pylist()},
+        "sources": {row['values']: row['counts'] for row in pc.value_counts(table['source']).to_pylist()},
+    }
+    per_headword = table.select(['headword', 'source']).group_by('headword').aggregate(
+        [('source', 'count_distinct')])
+    stats["headwords"] = per_headword.num_rows
+    stats["multi_source_headwords"] = pc.sum(
+        pc.greater(per_headword['source_count_distinct'], 1)).as_py() or 0
+    return stats
+
+
+def jsonl_entry_stats(path: str | Path) -> dict:
+    """entry_stats computed row by row from a JSONL export, for comparison."""
+    coverage = Counter()
+    part_of_speech = Counter()
+    sources = Counter()
+    headword_sources: dict[str, set] = {}
+    entries = 0
+    for entry in jsonl_records(path):
+        entries += 1
+        coverage.update(name for name in FIELDS if entry.get(name))
+        part_of_speech[entry.get('part_of_speech')] += 1
+        sources[entry.get('source')] += 1
+        headword_sources.setdefault(entry.get('headword'), set()).add(entry.get('source'))
+    return {
+        "entries": entries,
+        "coverage": {name: coverage[name] for name in FIELDS},
+        "part_of_speech": dict(part_of_speech),
+        "sources": dict(sources),
+        "headwords": len(headword_sources),
+        # count_distinct skips nulls
+        "multi_source_headwords": sum(1 for s in headword_sources.values() if len(s - {None}) > 1),
+    }
+
+
+def jsonl_merged_stats(path: str | Path) -> dict:
+    """merged_stats computed row by row from a JSONL export, for comparison."""
+    stats = {"words": 0, "entries": 0, "multi_entry_words": 0, "multi_variant_words": 0}
+    for word in jsonl_records(path):
+        stats["words"] += 1
+        stats["entries"] += len(word['entries'])
+        stats["multi_entry_words"] += len(word['entries']) > 1
+        stats["multi_variant_words"] += len(word['variants']) > 1
+    return stats
+
+
+def merged_stats(path: str | Path) -> dict:
+    """Group sizes of a merged export, reading only the list columns."""
+    table = pq.read_table(str(path), columns=['variants', 'entries'])
+    entry_counts = pc.list_value_length(table['entries'])
+    return {
+        "words": table.num_rows,
+        "entries": pc.sum(entry_counts).as_py() or 0,
+        "multi_entry_words": pc.sum(pc.greater(entry_counts, 1)).as_py() or 0,
+        "multi_variant_words": pc.sum(pc.greater(pc.list_value_length(table['variants']), 1)).as_py() or 0,
+    }
+
+
+def print_entry_stats(stats: dict):
+    total = stats["entries"]
+    print(f"Entries: {total}, headwords: {stats['headwords']}")
+    print(f"Headwords defined by several sources: {_percent(stats['multi_source_headwords'], stats['headwords'])}")
+    print("\nField coverage:")
+    for name, count in stats["coverage"].items():
+        print(f"  {name:<16} {_percent(count, total)}")
+    print("\nParts of speech:")
+    for value, count in sorted(stats["part_of_speech"].items(), key=lambda item: -item[1])[:15]:
+        print(f"  {value or '(none)':<16} {_percent(count, total)}")
+    print("\nSources:")
+    for value, count in sorted(stats["sources"].items(), key=lambda item: -item[1]):
+        print(f"  {_percent(count, total):>16}  {value or '(none)'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dictionary statistics from a Parquet export")
+    parser.add_argument('path', help='dictionary.parquet or dictionary_merged.parquet')
+    parser.add_argument('--jsonl', help='Check the file against this JSONL export, and time the stats both ways')
+    args = parser.parse_args()
+
+    try:
+        check_parquet()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if 'canonical' in pq.read_schema(args.path).names:
+        compute_stats, compute_jsonl_stats = merged_stats, jsonl_merged_stats
+    else:
+        compute_stats, compute_jsonl_stats = entry_stats, jsonl_entry_stats
+
+    start = time.perf_counter()
+    stats = compute_stats(args.path)
+    parquet_elapsed = time.perf_counter() - start
+    if compute_stats is entry_stats:
+        print_entry_stats(stats)
+    else:
+        print(json.dumps(stats, indent=2))
+
+    if args.jsonl:
+        start = time.perf_counter()
+        expected = compute_jsonl_stats(args.jsonl)
+        jsonl_elapsed = time.perf_counter() - start
+        print(f"\nStats from Parquet: {parquet_elapsed:.3f}s, from JSONL: {jsonl_elapsed:.3f}s")
+
+        mismatches = compare_records(args.path, args.jsonl)
+        if expected != stats:
+            print("The stats computed from the JSONL differ from the Parquet ones")
+            mismatches += 1
+        if mismatches:
+            sys.exit(1)
+        print("Every record reads back as in the JSONL.")
+
+
+if __name__ == "__main__":
+    main()
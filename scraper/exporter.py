@@ -2,9 +2,144 @@
 
 import csv
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
-from models import DictionaryEntry
+from typing import Iterable, Iterator, Sized
+from columnar import EntryParquetFile, check_parquet
+from frames import CODECS, FramedWriter, check_codec, codec_of
+from models import FIELDS, DictionaryEntry, loads
+
+
+WRITE_BATCH_SIZE = 100  # Buffered lines before an incremental write
+FLUSH_INTERVAL = 5.0  # Seconds before buffered lines are written anyway
+FORMATS = ('json', 'jsonl', 'csv')
+JSON_ENTRY_MARGIN = '    '  # Indentation of entries inside dictionary.json
+TOTAL_ENTRIES_WIDTH = 20  # Room left for total_entries when it is filled in on close
+
+
+class JsonlWriter:
+    """Long-lived, buffered JSONL appender.
+
+    Lines are handed to the OS in batches of `batch_size`, or once
+    `flush_interval` seconds have passed since the last write. `sync()`
+    additionally fsyncs, and is called at checkpoint boundaries so the JSONL
+    is on disk before the checkpoint that refers to it.
+    """
+
+    def __init__(self, path: Path, batch_size: int = WRITE_BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer: list[str] = []
+        self.last_flush = time.monotonic()
+        self._file = None
+
+    def write(self, entry: DictionaryEntry):
+        self.buffer.append(entry.to_json() + '\n')
+        if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Hand buffered lines to the OS."""
+        if self.buffer:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.writelines(self.buffer)
+            self.buffer.clear()
+            self._file.flush()
+        self.last_flush = time.monotonic()
+
+    def sync(self):
+        """Flush and fsync, so everything written so far survives a crash."""
+        self.flush()
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class JsonArrayFile:
+    """dictionary.json written one entry at a time.
+
+    The layout is the same as json.dump({"metadata": ..., "entries": [...]},
+    indent=2). When the number of entries isn't known up front, the
+    metadata's total_entries is written as a blank field and filled in on
+    close (the padding is valid JSON whitespace).
+    """
+
+    def __init__(self, path: Path, total_entries: int | None = None):
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8')
+        metadata = json.dumps(export_metadata(total_entries or 0), ensure_ascii=False, indent=2)
+        self._file.write('{\n  "metadata": ')
+        self._total_at = None
+        if total_entries is None:
+            before, after = metadata.split('"total_entries": 0', 1)
+            self._file.write(before.replace('\n', '\n  ') + '"total_entries": ')
+            self._total_at = self._file.tell()
+            metadata = ' ' * TOTAL_ENTRIES_WIDTH + after
+        self._file.write(metadata.replace('\n', '\n  '))
+        self._file.write(',\n  "entries": [')
+
+    def write(self, indented_json: str):
+        """Append an entry, serialized by DictionaryEntry.to_indented_json(JSON_ENTRY_MARGIN)."""
+        self._file.write(',\n    ' if self.count else '\n    ')
+        self._file.write(indented_json)
+        self.count += 1
+
+    def close(self):
+        self._file.write('\n  ]\n}' if self.count else ']\n}')
+        if self._total_at is not None:
+            self._file.seek(self._total_at)
+            self._file.write(str(self.count).ljust(TOTAL_ENTRIES_WIDTH))
+        self._file.close()
+
+
+class CsvFile:
+    """dictionary.csv written one row at a time; created with the first row."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, row: dict):
+        if self._writer is None:
+            self._file = open(self.path, 'w', encoding='utf-8', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=FIELDS, extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def export_metadata(total_entries: int) -> dict:
+    """The metadata header of dictionary.json."""
+    return {
+        "source": "dixionline.net",
+        "source_url": "https://www.dixionline.net",
+        "scraped_at": datetime.utcnow().isoformat() + "Z",
+        "total_entries": total_entries,
+        "description": "Aromanian/Vlach dictionary with translations to Romanian, English, and French"
+    }
 
 
 class DictionaryExporter:
@@ -14,89 +149,140 @@ class DictionaryExporter:
     No merging step - preserves all fields including definition.
     """
 
-    def __init__(self, output_dir: str = "../data"):
+    def __init__(self, output_dir: str = "../data", batch_size: int = WRITE_BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL, compression: tuple[str, ...] = (),
+                 parquet: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.writers: dict[str, JsonlWriter] = {}
+        for codec in compression:
+            check_codec(codec)
+        if parquet:
+            check_parquet()
+        # Written by export_all besides JSON, JSONL and CSV: framed compressed
+        # copies of the JSONL (frames.py) and the Parquet table (columnar.py)
+        self.extra_formats = tuple(f"jsonl{CODECS[codec]}" for codec in compression)
+        if parquet:
+            self.extra_formats += ('parquet',)
 
-    def export_all(self, entries: list[DictionaryEntry], base_name: str = "dictionary"):
-        """Export entries to all formats."""
-        self.export_json(entries, f"{base_name}.json")
-        self.export_jsonl(entries, f"{base_name}.jsonl")
-        self.export_csv(entries, f"{base_name}.csv")
-
-    def export_json(self, entries: list[DictionaryEntry], filename: str = "dictionary.json"):
-        """Export entries to a single JSON file with metadata."""
-        output_path = self.output_dir / filename
-
-        # Build metadata
-        metadata = {
-            "source": "dixionline.net",
-            "source_url": "https://www.dixionline.net",
-            "scraped_at": datetime.utcnow().isoformat() + "Z",
-            "total_entries": len(entries),
-            "description": "Aromanian/Vlach dictionary with translations to Romanian, English, and French"
-        }
-
-        # Build output structure
-        output = {
-            "metadata": metadata,
-            "entries": [entry.to_dict() for entry in entries]
-        }
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
-
-        print(f"Exported {len(entries)} entries to {output_path}")
-
-    def export_jsonl(self, entries: list[DictionaryEntry], filename: str = "dictionary.jsonl"):
-        """Export entries to JSON Lines format (one JSON object per line)."""
-        output_path = self.output_dir / filename
+    def export_all(self, entries: Iterable[DictionaryEntry], base_name: str = "dictionary",
+                   total_entries: int | None = None, formats: tuple[str, ...] | None = None):
+        """Export entries to all `formats` in a single pass.
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for entry in entries:
-                f.write(entry.to_json() + '\n')
+        `formats` defaults to JSON, JSONL, CSV and the extra formats the
+        exporter was created with. `entries` can be a stream:
+        only one entry is held at a time, and it is encoded once for all
+        JSON formats.
+        """
+        if formats is None:
+            formats = FORMATS + self.extra_formats
+        self._export(entries, {fmt: f"{base_name}.{fmt}" for fmt in formats}, total_entries)
 
-        print(f"Exported {len(entries)} entries to {output_path}")
+    def export_json(self, entries: Iterable[DictionaryEntry], filename: str = "dictionary.json",
+                    total_entries: int | None = None):
+        """Export entries to a single JSON file with metadata.
 
-    def export_csv(self, entries: list[DictionaryEntry], filename: str = "dictionary.csv"):
-        """Export entries to CSV format."""
-        output_path = self.output_dir / filename
+        Entries are written one at a time. `total_entries` fills in the
+        metadata; when it isn't given and `entries` is a stream, the count is
+        filled in once the stream is exhausted.
+        """
+        self._export(entries, {'json': filename}, total_entries)
 
-        if not entries:
-            print("No entries to export")
-            return
+    def export_jsonl(self, entries: Iterable[DictionaryEntry], filename: str = "dictionary.jsonl"):
+        """Export entries to JSON Lines format (one JSON object per line)."""
+        self._export(entries, {'jsonl': filename})
 
-        # Define all possible fields
-        fieldnames = [
-            'headword',
-            'pronunciation',
-            'part_of_speech',
-            'inflections',
-            'definition',
-            'translation_ro',
-            'translation_en',
-            'translation_fr',
-            'etymology',
-            'context',
-            'examples',
-            'expressions',
-            'related_terms',
-            'source',
-            'source_url'
-        ]
-
-        with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
+    def export_csv(self, entries: Iterable[DictionaryEntry], filename: str = "dictionary.csv"):
+        """Export entries to CSV format."""
+        self._export(entries, {'csv': filename})
 
+    def _export(self, entries: Iterable[DictionaryEntry], filenames: dict[str, str],
+                total_entries: int | None = None):
+        """Stream entries into the files in `filenames`, keyed by format."""
+        if total_entries is None and isinstance(entries, Sized):
+            total_entries = len(entries)
+        json_file = jsonl_file = csv_file = parquet_file = None
+        # Framed JSONL, one frame per letter at most (entries are sorted by headword)
+        framed = [FramedWriter(self.output_dir / filename, codec_of(filename))
+                  for fmt, filename in filenames.items() if fmt.startswith('jsonl.')]
+        if 'json' in filenames:
+            json_file = JsonArrayFile(self.output_dir / filenames['json'], total_entries)
+        if 'jsonl' in filenames:
+            jsonl_file = open(self.output_dir / filenames['jsonl'], 'w', encoding='utf-8')
+        if 'csv' in filenames:
+            csv_file = CsvFile(self.output_dir / filenames['csv'])
+        if 'parquet' in filenames:
+            parquet_file = EntryParquetFile(self.output_dir / filenames['parquet'])
+
+        count = 0
+        try:
             for entry in entries:
-                writer.writerow(entry.to_csv_row())
+                if json_file is not None:
+                    if jsonl_file is not None or framed:
+                        line, indented = entry.to_json_pair(JSON_ENTRY_MARGIN)
+                    else:
+                        indented = entry.to_indented_json(JSON_ENTRY_MARGIN)
+                    json_file.write(indented)
+                elif jsonl_file is not None or framed:
+                    line = entry.to_json()
+                if jsonl_file is not None:
+                    jsonl_file.write(line + '\n')
+                if framed:
+                    letter = entry.headword[:1].lower()
+                    for writer in framed:
+                        writer.write(line + '\n', letter)
+                if csv_file is not None:
+                    csv_file.write(entry.to_csv_row())
+                if parquet_file is not None:
+                    parquet_file.write_entry(entry)
+                count += 1
+        finally:
+            for file in (json_file, jsonl_file, csv_file, parquet_file, *framed):
+                if file is not None:
+                    file.close()
+
+        for fmt in filenames:
+            if fmt == 'csv' and not count:
+                print("No entries to export")
+            else:
+                print(f"Exported {count} entries to {self.output_dir / filenames[fmt]}")
 
-        print(f"Exported {len(entries)} entries to {output_path}")
+    def incremental_writer(self, filename: str = "dictionary.jsonl") -> JsonlWriter:
+        """Return the long-lived appender for `filename`."""
+        if filename not in self.writers:
+            self.writers[filename] = JsonlWriter(self.output_dir / filename, self.batch_size, self.flush_interval)
+        return self.writers[filename]
 
     def export_incremental_jsonl(self, entry: DictionaryEntry, filename: str = "dictionary.jsonl"):
         """Append a single entry to JSONL file (for incremental saving)."""
-        output_path = self.output_dir / filename
+        self.incremental_writer(filename).write(entry)
+
+    def sync(self):
+        """Fsync all incremental JSONL files."""
+        for writer in self.writers.values():
+            writer.sync()
+
+    def close(self):
+        """Flush and close all incremental JSONL files."""
+        for writer in self.writers.values():
+            writer.close()
+        self.writers.clear()
+
+    def iter_headwords(self, filename: str = "dictionary.jsonl") -> Iterator[str]:
+        """Yield the headword of each entry in a JSONL export (empty if missing)."""
+        path = self.output_dir / filename
+        if not path.exists():
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line).get('headword', '')
 
-        with open(output_path, 'a', encoding='utf-8') as f:
-            f.write(entry.to_json() + '\n')
+    def iter_jsonl(self, filename: str = "dictionary.jsonl") -> Iterator[DictionaryEntry]:
+        """Stream entries back from a JSONL file in the output directory."""
+        with open(self.output_dir / filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield DictionaryEntry.from_json(line)
@@ -0,0 +1,173 @@
+"""External merge sort and streaming dedupe for dictionary JSONL files.
+
+Sorting happens in bounded runs spilled to temporary files, which are then
+k-way merged, so memory use depends on the run size rather than on the size
+of the dictionary. Files that are already sorted (e.g. shard outputs) can be
+k-way merged directly.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+
+RUN_SIZE = 20000  # Lines sorted in memory per run
+
+
+def headword_key(record: dict) -> str:
+    """Sort key used for all dictionary exports."""
+    return record.get('headword', '').lower()
+
+
+def tiebreak_key(record: dict) -> str:
+    """Orders records with the same headword key, so that which duplicate
+    is kept doesn't depend on the order pages were fetched in."""
+    return record.get('source_url') or ''
+
+
+def dedupe_key(record: dict) -> tuple[str, str]:
+    """Entries are duplicates when headword and source match."""
+    return record.get('headword', ''), record.get('source') or ''
+
+
+def _write_run(run: list[tuple[str, str, int, str]], tmp_dir: str) -> str:
+    run.sort()
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for key, tiebreak, seq, line in run:
+            f.write(json.dumps([key, tiebreak, seq], ensure_ascii=False) + '\t' + line + '\n')
+    return path
+
+
+def _read_run(path: str) -> Iterator[tuple[str, str, int, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in f:
+            sort_info, line = row.rstrip('\n').split('\t', 1)
+            key, tiebreak, seq = json.loads(sort_info)
+            yield key, tiebreak, seq, line
+
+
+def sorted_lines(paths: Iterable[str | Path], run_size: int = RUN_SIZE,
+                 tmp_dir: str | None = None) -> Iterator[tuple[str, str]]:
+    """Yield (sort_key, line) for every JSONL record in `paths`, sorted by headword.
+
+    Records with equal keys are ordered by source_url, then keep their input
+    order.
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        runs = []
+        run: list[tuple[str, str, int, str]] = []
+        seq = 0
+
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    run.append((headword_key(record), tiebreak_key(record), seq, line))
+                    seq += 1
+                    if len(run) >= run_size:
+                        runs.append(_write_run(run, run_dir))
+                        run = []
+
+        if not runs:
+            # Everything fit in one run; no need to touch the disk
+            run.sort()
+            for key, _, _, line in run:
+                yield key, line
+            return
+
+        if run:
+            runs.append(_write_run(run, run_dir))
+
+        for key, _, _, line in heapq.merge(*(_read_run(path) for path in runs)):
+            yield key, line
+
+
+def dedupe_sorted(rows: Iterable[tuple[str, str]],
+                  on_duplicate: Callable[[str], None] | None = None) -> Iterator[str]:
+    """Drop duplicate records from a stream sorted by headword.
+
+    Duplicates always share a sort key, so only the keys seen within the
+    current headword group need to be remembered. Dropped lines are passed
+    to `on_duplicate`, if given.
+    """
+    group_key = None
+    seen: set[tuple[str, str]] = set()
+
+    for key, line in rows:
+        if key != group_key:
+            group_key = key
+            seen.clear()
+        ident = dedupe_key(json.loads(line))
+        if ident not in seen:
+            seen.add(ident)
+            yield line
+        elif on_duplicate is not None:
+            on_duplicate(line)
+
+
+def _write_deduped(rows: Iterable[tuple[str, str]], output: Path,
+                   duplicates: Path | None) -> int:
+    tmp_path = output.with_suffix(output.suffix + '.tmp')
+    dup_file = None
+    count = 0
+
+    try:
+        if duplicates is not None:
+            dup_file = open(duplicates.with_suffix(duplicates.suffix + '.tmp'), 'w', encoding='utf-8')
+        on_duplicate = (lambda line: dup_file.write(line + '\n')) if dup_file else None
+
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            for line in dedupe_sorted(rows, on_duplicate):
+                out.write(line + '\n')
+                count += 1
+    finally:
+        if dup_file is not None:
+            dup_file.close()
+
+    os.replace(tmp_path, output)
+    if dup_file is not None:
+        os.replace(dup_file.name, duplicates)
+    return count
+
+
+def sort_dedupe_jsonl(sources: Iterable[str | Path], output: str | Path,
+                      run_size: int = RUN_SIZE, duplicates: str | Path | None = None) -> int:
+    """Sort and dedupe JSONL `sources` into `output`; returns the record count.
+
+    Dropped duplicates are written to `duplicates`, if given. Outputs are
+    written to temporary files and moved into place, so they may also be
+    sources.
+    """
+    output = Path(output)
+    rows = sorted_lines(sources, run_size=run_size, tmp_dir=str(output.parent))
+    return _write_deduped(rows, output, Path(duplicates) if duplicates is not None else None)
+
+
+def _keyed_lines(path: str | Path) -> Iterator[tuple[str, str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                yield headword_key(record), tiebreak_key(record), line
+
+
+def merge_sorted_jsonl(sources: Iterable[str | Path], output: str | Path,
+                       duplicates: str | Path | None = None) -> int:
+    """K-way merge JSONL files sorted by sort_dedupe_jsonl, deduping as it
+    does; returns the record count.
+
+    Records with equal keys are ordered by source_url, then keep the order
+    of `sources`.
+    """
+    output = Path(output)
+    rows = heapq.merge(*(_keyed_lines(path) for path in sources), key=lambda row: row[:2])
+    return _write_deduped(((key, line) for key, _, line in rows), output,
+                          Path(duplicates) if duplicates is not None else None)
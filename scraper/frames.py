@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Compressed JSONL written in independently decodable frames, with an index.
+
+A framed file is a sequence of complete gzip members (or zstd frames), each
+holding whole lines: about FRAME_BYTES of them, and never lines of two
+different keys. Concatenated members are still one valid gzip/zstd stream,
+so zcat, gzip.open and any other plain reader decode the file as usual.
+
+The dictionary exports are keyed by the first letter of the headword. The
+merged ones are keyed by the first letter of the normalized spelling they
+are sorted by, where ã, ă and â are all â, and y is g.
+
+Next to it, `<file>.idx.json` lists every frame's byte offset and length,
+its key, and its number of lines. With it, a reader can:
+
+- decompress the frames in parallel (zlib and zstd release the GIL, so
+  threads are enough), holding only as many frames as there are threads
+- read one letter by seeking to its frames, without inflating the rest
+
+zstd needs the zstandard package; gzip is always available.
+
+Usage:
+    python frames.py ../data/dictionary.jsonl.gz              # Print the frame index
+    python frames.py ../data/dictionary.jsonl.gz --key a      # Lines for headwords in 'a'
+    python frames.py ../data/dictionary.jsonl.zst --cat --workers 4
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CODECS = {'gzip': '.gz', 'zstd': '.zst'}  # Codec -> file suffix
+FRAME_BYTES = 1 << 20  # Uncompressed bytes per frame
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 9
+INDEX_SUFFIX = '.idx.json'
+
+
+def check_codec(codec: str):
+    """Raise ValueError if `codec` can't be used in this environment."""
+    if codec not in CODECS:
+        raise ValueError(f"Unknown compression {codec!r}, expected one of {', '.join(CODECS)}")
+    if codec == 'zstd' and not ZSTD_AVAILABLE:
+        raise ValueError("zstd compression needs the zstandard package")
+
+
+def codec_of(path: str | Path) -> str:
+    """The codec of a framed file, from its suffix."""
+    suffix = Path(path).suffix
+    for codec, codec_suffix in CODECS.items():
+        if suffix == codec_suffix:
+            return codec
+    raise ValueError(f"Not a compressed file: {path}")
+
+
+def index_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def compress(codec: str, data: bytes) -> bytes:
+    """One self-contained gzip member or zstd frame."""
+    if codec == 'gzip':
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    if codec == 'gzip':
+        return gzip.decompress(data)
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+class FramedWriter:
+    """Writes lines to a framed file and its index.
+
+    A frame is closed once it holds `frame_bytes` of lines, or before a
+    line whose key differs from the previous line's.
+    """
+
+    def __init__(self, path: str | Path, codec: str = 'gzip', frame_bytes: int = FRAME_BYTES):
+        check_codec(codec)
+        self.path = Path(path)
+        self.codec = codec
+        self.frame_bytes = frame_bytes
+        self.frames: list[dict] = []
+        self.lines = 0
+        self._offset = 0
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._key: str | None = None
+        self._file = open(self.path, 'wb')
+
+    def write(self, line: str, key: str | None = None):
+        """Add a line (ending in a newline)."""
+        if self._buffer and key != self._key:
+            self._flush()
+        data = line.encode('utf-8')
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self._key = key
+        if self._buffered >= self.frame_bytes:
+            self._flush()
+
+    def _flush(self):
+        raw = b''.join(self._buffer)
+        frame = compress(self.codec, raw)
+        self._file.write(frame)
+        self.frames.append({"offset": self._offset, "length": len(frame), "raw_length": len(raw),
+                            "first_line": self.lines, "lines": len(self._buffer), "key": self._key})
+        self._offset += len(frame)
+        self.lines += len(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+
+    def close(self):
+        """Write the last frame, then the index (atomically)."""
+        if self._buffer:
+            self._flush()
+        self._file.close()
+        index = {"codec": self.codec, "lines": self.lines, "frames": self.frames}
+        path = index_path(self.path)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def read_index(path: str | Path) -> dict | None:
+    """The frame index of a framed file, or None if it has none."""
+    path = index_path(path)
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_frame(path: str | Path, frame: dict, codec: str | None = None) -> bytes:
+    """The decompressed contents of one frame."""
+    with open(path, 'rb') as f:
+        f.seek(frame["offset"])
+        data = f.read(frame["length"])
+    return decompress(codec or codec_of(path), data)
+
+
+def iter_lines(path: str | Path, key: str | None = None, workers: int = 1) -> Iterator[str]:
+    """Lines of a framed file, in order.
+
+    With `key`, only the frames of that key are read. Frames are
+    decompressed by `workers` threads, at most `workers` frames ahead of the
+    one being yielded, so memory stays bounded however large the file.
+    Without an index the file is decompressed as a single stream (and `key`
+    can't be used).
+    """
+    codec = codec_of(path)
+    check_codec(codec)
+    index = read_index(path)
+    if index is None:
+        if key is not None:
+            raise ValueError(f"{path} has no frame index to look up keys in")
+        opener = gzip.open if codec == 'gzip' else zstandard.open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            yield from f
+        return
+
+    frames = (frame for frame in index["frames"] if key is None or frame["key"] == key)
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for frame in frames:
+            pending.append(pool.submit(read_frame, path, frame, codec))
+            if len(pending) >= workers:
+                yield from pending.popleft().result().decode('utf-8').splitlines(keepends=True)
+        while pending:
+            yield from pending.popleft().result().decode('utf-8').splitlines(keepends=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or read a framed compressed JSONL file")
+    parser.add_argument('path', help='Framed .jsonl.gz or .jsonl.zst file')
+    parser.add_argument('--key', help='Only print the lines of this key (e.g. a letter)')
+    parser.add_argument('--cat', action='store_true', help='Print all lines')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help=f'Threads decompressing frames (default: {os.cpu_count()})')
+    args = parser.parse_args()
+
+    if args.cat or args.key is not None:
+        sys.stdout.writelines(iter_lines(args.path, key=args.key, workers=args.workers))
+        return
+
+    index = read_index(args.path)
+    if index is None:
+        sys.exit(f"No frame index for {args.path}")
+    compressed = sum(frame["length"] for frame in index["frames"])
+    raw = sum(frame["raw_length"] for frame in index["frames"])
+    print(f"{args.path}: {index['codec']}, {index['lines']} lines in {len(index['frames'])} frames, "
+          f"{raw / 1e6:.1f} MB -> {compressed / 1e6:.1f} MB ({compressed / raw if raw else 0:.0%})")
+    keys: dict[str, list[int]] = {}
+    for frame in index["frames"]:
+        counts = keys.setdefault(frame["key"] or '', [0, 0])
+        counts[0] += 1
+        counts[1] += frame["lines"]
+    for key, (frames, lines) in keys.items():
+        print(f"  {key or '(none)':<8} {frames:>5} frames {lines:>8} lines")
+
+
+if __name__ == "__main__":
+    main()
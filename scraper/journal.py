@@ -0,0 +1,232 @@
+"""Append-only checkpoint journal for resumable scraping.
+
+Each line is one JSON record:
+
+    {"done": word, "headwords": [...]}
+                                word scraped and its entries exported; the
+                                headwords its page listed are optional
+    {"failed": word}            word could not be scraped
+    {"changed": word}           word's page changed in an incremental crawl
+    {"covered": word}           word skipped: an earlier page already listed it
+    {"harvested": [...]}        headwords listed by scraped pages (compaction)
+    {"position": [letter, i]}   resume position of the crawl
+
+Records are buffered and fsync'ed in batches, so a checkpoint costs the new
+records only, never a rewrite of everything scraped so far. Compaction
+rewrites the journal as one record per live word (atomically, through a
+temporary file) once stale records outnumber live ones.
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+
+JOURNAL_FILE = "../data/checkpoint.journal"
+SYNC_EVERY = 50  # fsync after this many buffered records
+HARVESTED_CHUNK = 1000  # Headwords per "harvested" record when compacting
+
+
+@dataclass
+class JournalState:
+    """Crawl progress rebuilt from the journal."""
+    done: set[str] = field(default_factory=set)
+    failed: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    covered: set[str] = field(default_factory=set)
+    harvested: set[str] = field(default_factory=set)
+    position: tuple[str, int] | None = None
+
+    @property
+    def live_records(self) -> int:
+        harvested_records = -(-len(self.harvested) // HARVESTED_CHUNK)
+        return (len(self.done) + len(self.failed) + len(self.changed) + len(self.covered)
+                + harvested_records + (1 if self.position else 0))
+
+
+class CheckpointJournal:
+    """Append-only, fsync-batched journal of completed and failed words."""
+
+    def __init__(self, path: str | Path = JOURNAL_FILE, sync_every: int = SYNC_EVERY,
+                 before_sync: Callable[[], None] | None = None):
+        self.path = Path(path)
+        self.sync_every = sync_every
+        # Called before records hit the disk, e.g. to fsync the data they describe
+        self.before_sync = before_sync
+        self.state = JournalState()
+        self.records = 0
+        self._pending: list[str] = []
+        self._file = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def reset(self):
+        """Discard the journal and start a fresh crawl state."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.state = JournalState()
+        self.records = 0
+
+    def replay(self) -> JournalState:
+        """Rebuild the crawl state in a single streaming pass over the journal."""
+        state = JournalState()
+        records = 0
+
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final line from a crash mid-write
+                        continue
+                    records += 1
+                    # A word is usually in several sets (done and harvested), and
+                    # in many records: interned, they all hold the same string
+                    if 'done' in record:
+                        word = sys.intern(record['done'])
+                        state.done.add(word)
+                        state.failed.discard(word)
+                        state.covered.discard(word)
+                        state.harvested.update(map(sys.intern, record.get('headwords', ())))
+                    elif 'failed' in record:
+                        if record['failed'] not in state.done:
+                            state.failed.add(sys.intern(record['failed']))
+                    elif 'changed' in record:
+                        state.changed.add(sys.intern(record['changed']))
+                    elif 'covered' in record:
+                        if record['covered'] not in state.done:
+                            state.covered.add(sys.intern(record['covered']))
+                    elif 'harvested' in record:
+                        state.harvested.update(map(sys.intern, record['harvested']))
+                    elif 'position' in record:
+                        letter, word_idx = record['position']
+                        state.position = (letter, word_idx)
+
+        self.state = state
+        self.records = records
+        return state
+
+    def mark_done(self, word: str, headwords: list[str] | None = None):
+        self.state.done.add(word)
+        self.state.failed.discard(word)
+        self.state.covered.discard(word)
+        record = {"done": word}
+        if headwords:
+            self.state.harvested.update(headwords)
+            record["headwords"] = headwords
+        self._append(record)
+
+    def mark_failed(self, word: str):
+        self.state.failed.add(word)
+        self._append({"failed": word})
+
+    def mark_covered(self, word: str):
+        self.state.covered.add(word)
+        self._append({"covered": word})
+
+    def mark_changed(self, word: str):
+        self.state.changed.add(word)
+        self._append({"changed": word})
+
+    def set_position(self, letter: str, word_idx: int):
+        self.state.position = (letter, word_idx)
+        self._append({"position": [letter, word_idx]})
+
+    def _append(self, record: dict):
+        self._pending.append(json.dumps(record, ensure_ascii=False) + '\n')
+        self.records += 1
+        if len(self._pending) >= self.sync_every:
+            self.sync()
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        # Start on a fresh line if the last run died halfway through a record
+        if self._file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+
+    def sync(self):
+        """Write buffered records and fsync them to disk."""
+        if not self._pending:
+            return
+        if self.before_sync is not None:
+            self.before_sync()
+        if self._file is None:
+            self._open()
+        self._file.writelines(self._pending)
+        self._pending.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def needs_compaction(self) -> bool:
+        return self.records > 2 * self.state.live_records
+
+    def compact(self):
+        """Rewrite the journal with one record per live word."""
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        state = self.state
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for word in state.done:
+                f.write(json.dumps({"done": word}, ensure_ascii=False) + '\n')
+            for word in state.failed:
+                f.write(json.dumps({"failed": word}, ensure_ascii=False) + '\n')
+            for word in state.changed:
+                f.write(json.dumps({"changed": word}, ensure_ascii=False) + '\n')
+            for word in state.covered:
+                f.write(json.dumps({"covered": word}, ensure_ascii=False) + '\n')
+            harvested = sorted(state.harvested)
+            for i in range(0, len(harvested), HARVESTED_CHUNK):
+                chunk = harvested[i:i + HARVESTED_CHUNK]
+                f.write(json.dumps({"harvested": chunk}, ensure_ascii=False) + '\n')
+            if state.position:
+                f.write(json.dumps({"position": list(state.position)}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.records = state.live_records
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_legacy_checkpoint(checkpoint_path: str | Path) -> JournalState:
+    """Read a checkpoint.json written before the journal existed."""
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+
+    state = JournalState()
+    state.done = set(checkpoint.get('scraped_words', []))
+    state.failed = set(checkpoint.get('failed_words', [])) - state.done
+    if 'current_letter' in checkpoint:
+        state.position = (checkpoint['current_letter'], checkpoint.get('current_word_idx', 0))
+    return state
+
+
+def load_journal_state(journal_path: str | Path = JOURNAL_FILE,
+                       legacy_checkpoint: str | Path | None = None) -> JournalState:
+    """Read crawl progress, falling back to a legacy checkpoint.json."""
+    journal = CheckpointJournal(journal_path)
+    if journal.exists():
+        return journal.replay()
+    if legacy_checkpoint and Path(legacy_checkpoint).exists():
+        return read_legacy_checkpoint(legacy_checkpoint)
+    return JournalState()
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional
 from difflib import SequenceMatcher
 
+from models import load_entry
+
 
 @dataclass
 class MergedWord:
@@ -43,7 +45,7 @@ class DictionaryMerger:
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 if line.strip():
-                    self.entries.append(json.loads(line))
+                    self.entries.append(load_entry(line))
         print(f"Loaded {len(self.entries)} entries")
 
     def normalize_diacritics(self, word: str) -> str:
@@ -0,0 +1,263 @@
+"""Runtime metrics of a crawl: counters, gauges and histograms.
+
+The scraper records what each pipeline stage spends its time on (fetch
+latency and bytes, parse time, JSONL writes, checkpoints) and how full the
+queues between stages are. Comparing them while a crawl runs shows what it
+is bound by: a full word queue and empty parse queue with high fetch latency
+means the network, a full parse queue means the parsers (CPU), and a full
+result queue or slow checkpoints mean the disk.
+
+Metrics are exposed two ways:
+
+    data/metrics.json      snapshot rewritten every few seconds (atomically)
+    --metrics-port PORT    Prometheus text format at http://127.0.0.1:PORT/metrics
+
+Recording is a dict lookup and an addition (plus a bisect for histograms),
+cheap enough for the per-request hot path.
+"""
+
+import asyncio
+import bisect
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+
+METRICS_FILE = "metrics.json"
+STATS_INTERVAL = 10.0  # Seconds between metrics.json snapshots
+PREFIX = "scraper_"  # Prometheus metric name prefix
+
+# Histogram bucket upper bounds
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Counter:
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+
+class Gauge:
+    """Current value of something, read from `func` when sampled."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, func: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.func = func
+
+    @property
+    def value(self) -> float:
+        return self.func()
+
+    def snapshot(self):
+        return self.value
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets.
+
+    Quantiles are estimated by interpolating within a bucket, which is what
+    Prometheus' histogram_quantile does too.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple[float, ...] = SECONDS_BUCKETS):
+        self.name = name
+        self.help = help
+        self.bounds = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the duration of its block in seconds."""
+        return _Timer(self)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class Metrics:
+    """Registry of a crawl's metrics, keyed by name."""
+
+    def __init__(self):
+        self.metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self.started = time.monotonic()
+
+    def _register(self, metric):
+        existing = self.metrics.get(metric.name)
+        if existing is not None and not isinstance(metric, Gauge):
+            return existing
+        # Gauges are re-registered when their source changes (e.g. a new pipeline's queues)
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter(name, help))
+
+    def gauge(self, name: str, help: str, func: Callable[[], float]) -> Gauge:
+        return self._register(Gauge(name, help, func))
+
+    def histogram(self, name: str, help: str,
+                  buckets: tuple[float, ...] = SECONDS_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, buckets))
+
+    def snapshot(self) -> dict:
+        """All metrics as plain JSON-serializable values."""
+        snapshot = {"uptime_seconds": time.monotonic() - self.started,
+                    "counters": {}, "gauges": {}, "histograms": {}}
+        for name, metric in self.metrics.items():
+            snapshot[f"{metric.kind}s"][name] = metric.snapshot()
+        return snapshot
+
+    def write_json(self, path: str | Path):
+        """Write a snapshot to `path`, replacing it atomically."""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in self.metrics.items():
+            name = PREFIX + name
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                cumulative = 0
+                for bound, count in zip((*metric.bounds, math.inf), metric.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else f"{bound:g}"
+                    lines.append(f'{name}_bucket{{le="{le}"}} {cumulative}')
+                lines.append(f"{name}_sum {metric.sum:g}")
+                lines.append(f"{name}_count {metric.count}")
+            else:
+                lines.append(f"{name} {metric.value:g}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsReporter:
+    """Writes metrics.json periodically and optionally serves /metrics."""
+
+    def __init__(self, metrics: Metrics, stats_file: str | Path | None,
+                 interval: float = STATS_INTERVAL, port: int | None = None,
+                 host: str = "127.0.0.1"):
+        self.metrics = metrics
+        self.stats_file = Path(stats_file) if stats_file else None
+        self.interval = interval
+        self.port = port
+        self.host = host
+        self._task: asyncio.Task | None = None
+        self._server: asyncio.Server | None = None
+
+    async def start(self):
+        if self.stats_file and self.interval > 0:
+            self._task = asyncio.create_task(self._write_periodically())
+        if self.port is not None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            port = self._server.sockets[0].getsockname()[1]
+            print(f"Serving metrics on http://{self.host}:{port}/metrics")
+
+    async def stop(self):
+        """Stop reporting and write the final snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self.stats_file:
+            self.metrics.write_json(self.stats_file)
+
+    async def _write_periodically(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.metrics.write_json(self.stats_file)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            # Skip the request headers
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] in ("/", "/metrics"):
+                status = "200 OK"
+                body = self.metrics.to_prometheus().encode('utf-8')
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status = "404 Not Found"
+                body = b"Not found\n"
+                content_type = "text/plain; charset=utf-8"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+            writer.write(body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
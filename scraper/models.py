@@ -1,11 +1,58 @@
-"""Data models for dictionary entries."""
+"""Data models for dictionary entries.
 
-from dataclasses import dataclass, field, asdict
+Entries are slotted dataclasses: without a per-instance __dict__ an entry
+takes 152 bytes instead of 352, not counting the strings it holds, which
+adds up when a whole dictionary is loaded. They serialize by
+walking their fields directly instead of going through dataclasses.asdict,
+which deep-copies every list, so an entry is never copied to be exported.
+The output is exactly what json.dumps(entry.to_dict(), ensure_ascii=False)
+produces.
+
+Loading uses orjson when it is installed; it parses the same JSON several
+times faster. It is not used for writing, since its output is formatted
+differently (no spaces after separators).
+
+Loaded entries share their repeated strings: there are a handful of
+sources and parts of speech, and every article on a results page has the
+same source_url, so load_entry interns them instead of keeping a copy per
+entry.
+"""
+
+from dataclasses import dataclass, field, fields
+from json.encoder import encode_basestring
 from typing import Optional
 import json
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+LIST_FIELDS = ('examples', 'expressions', 'related_terms')
+# Strings that repeat across entries, shared between them once loaded
+INTERNED_FIELDS = ('headword', 'part_of_speech', 'context', 'source', 'source_url')
+
+loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def intern_fields(entry: dict) -> dict:
+    """Intern the repeated strings of an entry dict, in place."""
+    for name in INTERNED_FIELDS:
+        value = entry.get(name)
+        if type(value) is str:
+            entry[name] = sys.intern(value)
+    return entry
+
+
+def load_entry(line: str) -> dict:
+    """Parse an entry dict from a JSONL line, sharing its repeated strings."""
+    return intern_fields(loads(line))
 
 
-@dataclass
+@dataclass(slots=True)
 class DictionaryEntry:
     """Represents a single dictionary entry."""
 
@@ -25,23 +72,92 @@ class DictionaryEntry:
     source: Optional[str] = None
     source_url: Optional[str] = None
 
+    @classmethod
+    def from_json(cls, line: str) -> "DictionaryEntry":
+        """Parse an entry from a JSON object (a JSONL line)."""
+        return cls(**load_entry(line))
+
     def to_dict(self) -> dict:
-        """Convert to dictionary, excluding None values."""
+        """Convert to dictionary, excluding None values.
+
+        Lists are the entry's own, not copies.
+        """
         result = {}
-        for key, value in asdict(self).items():
+        for name in FIELDS:
+            value = getattr(self, name)
             if value is not None and value != [] and value != "":
-                result[key] = value
+                result[name] = value
         return result
 
+    def _encoded_fields(self) -> list:
+        """(name, JSON key, encoded value) of each non-empty field.
+
+        Lists of strings are encoded item by item; anything else that isn't
+        a string is left to json.dumps (encoded value None).
+        """
+        encoded = []
+        for name, key in JSON_KEYS:
+            value = getattr(self, name)
+            if value is None or value == [] or value == "":
+                continue
+            if type(value) is str:
+                encoded.append((name, key, encode_basestring(value)))
+            elif type(value) is list and all(type(item) is str for item in value):
+                encoded.append((name, key, [encode_basestring(item) for item in value]))
+            else:
+                encoded.append((name, key, None))
+        return encoded
+
+    def _json(self, encoded: list) -> str:
+        parts = []
+        for name, key, value in encoded:
+            if value is None:
+                value = json.dumps(getattr(self, name), ensure_ascii=False)
+            elif type(value) is list:
+                value = '[' + ', '.join(value) + ']'
+            parts.append(f'{key}: {value}')
+        return '{' + ', '.join(parts) + '}'
+
+    def _indented_json(self, encoded: list, margin: str) -> str:
+        inner = '\n' + margin + '  '
+        parts = []
+        for name, key, value in encoded:
+            if value is None:
+                value = json.dumps(getattr(self, name), ensure_ascii=False,
+                                   indent=2).replace('\n', inner)
+            elif type(value) is list:
+                value = '[' + inner + '  ' + (',' + inner + '  ').join(value) + inner + ']'
+            parts.append(f'{key}: {value}')
+        if not parts:
+            return '{}'
+        return '{' + inner + (',' + inner).join(parts) + '\n' + margin + '}'
+
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        return self._json(self._encoded_fields())
+
+    def to_indented_json(self, margin: str = '') -> str:
+        """Convert to JSON indented by 2, with `margin` before every line but the first.
+
+        Same as json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+        with newlines replaced by newline + margin.
+        """
+        return self._indented_json(self._encoded_fields(), margin)
+
+    def to_json_pair(self, margin: str = '') -> tuple[str, str]:
+        """(to_json(), to_indented_json(margin)), encoding the fields once."""
+        encoded = self._encoded_fields()
+        return self._json(encoded), self._indented_json(encoded, margin)
 
     def to_csv_row(self) -> dict:
         """Convert to flat dictionary for CSV export."""
         d = self.to_dict()
         # Flatten lists to semicolon-separated strings
-        for key in ['examples', 'expressions', 'related_terms']:
+        for key in LIST_FIELDS:
             if key in d and isinstance(d[key], list):
                 d[key] = '; '.join(d[key])
         return d
+
+
+FIELDS = tuple(f.name for f in fields(DictionaryEntry))
+JSON_KEYS = tuple((name, encode_basestring(name)) for name in FIELDS)
@@ -1,17 +1,43 @@
-"""HTML parser for dixionline.net dictionary entries."""
+"""HTML parser for dixionline.net dictionary entries.
+
+Search results pages are parsed with lxml directly (parse_search_results):
+no BeautifulSoup tree is built. parse_search_results_soup parses with
+BeautifulSoup instead, with the same output. verify_parser.py checks the
+output against entries recorded from the original parser.
+
+Either way, an article is wrapped in an ArticleView, which extracts its
+paragraph text and indexes its spans and links once. The entry fields are
+then filled in by a table of rules (TRANSLATION_RULES, FIELD_RULES), each a
+precompiled pattern applied to text the view provides. Adding a field means
+adding a rule, not another traversal of the article.
+
+Inside `with profiling() as profile:`, every step (building the tree and
+the views, each rule) is timed and its hits and misses counted;
+profile_parser.py prints the ranked report over a corpus.
+"""
 
 import re
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
 from models import DictionaryEntry
 
+# BeautifulSoup's get_text() leaves out strings inside these elements
+SKIPPED_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
 
-def parse_letter_index(html: str) -> list[str]:
-    """
-    Parse a letter index page and extract all word links.
+WHITESPACE_RE = re.compile(r'\s+')
+TEST_HEADWORD_RE = re.compile(r'^[a-z]{4,}\d+$')
 
-    Returns a list of words (inputWord values) found on the page.
-    """
-    soup = BeautifulSoup(html, 'lxml')
+
+def source_url(query: str) -> str:
+    """The source_url recorded on entries parsed from the results for `query`."""
+    return f"https://www.dixionline.net/index.php?inputWord={query}"
+
+
+def _index_words(soup: BeautifulSoup) -> list[str]:
+    """Extract the inputWord values linked from a parsed letter index page."""
     words = []
 
     # Find the div containing word links
@@ -32,10 +58,8 @@ def parse_letter_index(html: str) -> list[str]:
     return words
 
 
-def get_word_count_from_index(html: str) -> int:
-    """Extract the total word count from a letter index page."""
-    soup = BeautifulSoup(html, 'lxml')
-
+def _index_count(soup: BeautifulSoup) -> int:
+    """Extract the reported word count from a parsed letter index page."""
     for div in soup.find_all('div', id='my_text'):
         text = div.get_text()
         # Look for pattern like "Zboarã cari ahurhescu cu 'A' : 5016"
@@ -46,12 +70,37 @@ def get_word_count_from_index(html: str) -> int:
     return 0
 
 
+def parse_letter_index(html: str) -> list[str]:
+    """
+    Parse a letter index page and extract all word links.
+
+    Returns a list of words (inputWord values) found on the page.
+    """
+    return _index_words(BeautifulSoup(html, 'lxml'))
+
+
+def get_word_count_from_index(html: str) -> int:
+    """Extract the total word count from a letter index page."""
+    return _index_count(BeautifulSoup(html, 'lxml'))
+
+
+def parse_letter_index_page(html: str) -> tuple[list[str], int]:
+    """
+    Parse a letter index page once and return (words, reported_count).
+
+    Equivalent to calling parse_letter_index and get_word_count_from_index,
+    without building the document tree twice.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    return _index_words(soup), _index_count(soup)
+
+
 def clean_text(text: str | None) -> str | None:
     """Clean and normalize text."""
     if text is None:
         return None
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_RE.sub(' ', text).strip()
     # Remove common artifacts
     text = text.replace('\u2026', '...')  # ellipsis
     text = text.replace('\u00a0', ' ')  # non-breaking space
@@ -101,7 +150,31 @@ def parse_search_results(html: str, query_word: str) -> list[DictionaryEntry]:
     The search results contain multiple <article class="article"> elements,
     each representing a dictionary entry.
     """
+    profile = _profile
+    start = time.perf_counter() if profile else 0.0
+    root = etree.HTML(html) if html.strip() else None
+    if profile:
+        profile.record("html tree (lxml)", time.perf_counter() - start)
+    if root is None:
+        return []
+
+    entries = []
+    for article in root.iter('article'):
+        if 'article' in (article.get('class') or '').split():
+            entry = parse_article_lxml(article, query_word)
+            if entry:
+                entries.append(entry)
+
+    return entries
+
+
+def parse_search_results_soup(html: str, query_word: str) -> list[DictionaryEntry]:
+    """BeautifulSoup version of parse_search_results (slower, same output)."""
+    profile = _profile
+    start = time.perf_counter() if profile else 0.0
     soup = BeautifulSoup(html, 'lxml')
+    if profile:
+        profile.record("html tree (BeautifulSoup)", time.perf_counter() - start)
     entries = []
 
     articles = soup.find_all('article', class_='article')
@@ -117,7 +190,7 @@ def parse_search_results(html: str, query_word: str) -> list[DictionaryEntry]:
 def is_test_entry(headword: str, translations: dict) -> bool:
     """Check if an entry appears to be test data."""
     # Check for obvious test headwords
-    if headword and re.match(r'^[a-z]{4,}\d+$', headword.lower()):
+    if headword and TEST_HEADWORD_RE.match(headword.lower()):
         # Pattern like "aaaa1", "test1", etc.
         test_patterns = ['aaaa', 'bbbb', 'cccc', 'test', 'asdf']
         if any(headword.lower().startswith(p) for p in test_patterns):
@@ -132,209 +205,490 @@ def is_test_entry(headword: str, translations: dict) -> bool:
     return False
 
 
-def parse_article(article: Tag, source_query: str) -> DictionaryEntry | None:
-    """Parse a single article element into a DictionaryEntry."""
-    try:
-        # Extract headword from h2 > a
+# A view gives the extraction rules everything they read from one article:
+# its headword, the text of its paragraph and an index of the paragraph's
+# spans and links, built in a single traversal. The text of any other node
+# is extracted at most once, however many rules or spans ask for it.
+
+
+class ArticleView(ABC):
+    """Cached access to the parts of an article the rules read."""
+
+    def __init__(self):
+        self.headword: str | None = None
+        self.paragraph = None
+        self.text = ''  # Text of the paragraph
+        self.spans: dict[str, list] = {}  # Paragraph spans by class, in document order
+        self.more_links: list = []  # Paragraph <a class="more"> links
+        self._texts: dict = {}  # Node text cache, keyed as the backend needs
+
+    def _index(self, nodes):
+        """Index (tag, classes, node) of the paragraph's spans and links."""
+        for tag, classes, node in nodes:
+            if tag == 'span':
+                for cls in classes:
+                    self.spans.setdefault(cls, []).append(node)
+            elif 'more' in classes:
+                self.more_links.append(node)
+
+    def find(self, cls: str):
+        """First paragraph span with class `cls`, or None."""
+        spans = self.spans.get(cls)
+        return spans[0] if spans else None
+
+    def find_all(self, cls: str) -> list:
+        return self.spans.get(cls, [])
+
+    @abstractmethod
+    def text_of(self, node) -> str:
+        """Text of `node`, extracted once."""
+
+    @abstractmethod
+    def parent(self, node):
+        """The element containing `node`."""
+
+    @abstractmethod
+    def next_sibling(self, node):
+        """The string after `node`, or the node after it, or None.
+
+        Comments count as strings, and empty strings are returned as None.
+        """
+
+
+class SoupArticleView(ArticleView):
+    """ArticleView of a BeautifulSoup <article> Tag."""
+
+    def __init__(self, article: Tag):
+        super().__init__()
         h2 = article.find('h2')
         if not h2:
-            return None
+            return
 
         headword_link = h2.find('a')
-        headword = clean_text(headword_link.get_text() if headword_link else h2.get_text())
-
-        if not headword:
-            return None
-
-        # Get the paragraph containing all data
-        p = article.find('p')
-        if not p:
-            return DictionaryEntry(headword=headword)
-
-        p_text = p.get_text()
-        p_html = str(p)
-
-        # Initialize entry
-        entry = DictionaryEntry(headword=headword, source_url=f"https://www.dixionline.net/index.php?inputWord={source_query}")
-
-        # Extract translations - first try curly brace format: {ro: ...} {fr: ...} {en: ...}
-        # This is the most reliable as it's in the text content itself
-        ro_match = re.search(r'\{ro:\s*([^}]+)\}', p_text)
-        if ro_match:
-            entry.translation_ro = clean_text(ro_match.group(1))
-
-        fr_match = re.search(r'\{fr:\s*([^}]+)\}', p_text)
-        if fr_match:
-            entry.translation_fr = clean_text(fr_match.group(1))
-
-        en_match = re.search(r'\{en:\s*([^}]+)\}', p_text)
-        if en_match:
-            entry.translation_en = clean_text(en_match.group(1))
-
-        # If curly brace format not found, try the simpler RO:/EN:/FR: format
-        # For "Mariana Bara" dictionary entries
-        if not entry.translation_ro:
-            # Look for "RO:" prefix followed by span
-            ro_span = p.find('span', class_='highlight_ro')
-            if ro_span:
-                # Make sure it's preceded by "RO:" and not inside a {fr:} pattern
-                ro_text = ro_span.get_text()
-                if not ro_text.startswith('{'):
-                    entry.translation_ro = clean_text(ro_text)
-
-        if not entry.translation_en:
-            en_span = p.find('span', class_='highlight_eng')
-            if en_span:
-                en_text = en_span.get_text()
-                # Filter out the § symbol which uses the same class
-                if en_text.strip() != '§' and not en_text.startswith('{'):
-                    entry.translation_en = clean_text(en_text)
-
-        if not entry.translation_fr:
-            fr_span = p.find('span', class_='highlight_fran')
-            if fr_span:
-                fr_text = fr_span.get_text()
-                if not fr_text.startswith('{'):
-                    entry.translation_fr = clean_text(fr_text)
-
-        # Check if this is test data and skip it
-        translations = {
-            'ro': entry.translation_ro,
-            'en': entry.translation_en,
-            'fr': entry.translation_fr
-        }
-        if is_test_entry(headword, translations):
-            return None
-
-        # Extract etymology
-        et_match = re.search(r'Et:\s*([^<\n]+)', p_text)
-        if et_match:
-            et = clean_text(et_match.group(1))
-            if et and et not in ['', 'Et:']:
-                entry.etymology = et
-
-        # Extract context
-        context_match = re.search(r'Context:\s*([^<\n]+)', p_text)
-        if context_match:
-            ctx = clean_text(context_match.group(1))
-            if ctx:
-                entry.context = ctx
-
-        # Extract pronunciation - usually in parentheses after headword
-        # Format: headword (pronunciation) sf/sm/vb
-        pvorb_span = p.find('span', class_='highlight_pvorb')
-        if pvorb_span:
-            # Get text after the headword span
-            next_text = pvorb_span.next_sibling
-            if next_text and isinstance(next_text, str):
-                # Look for pronunciation in parentheses
-                pron_match = re.search(r'\(([^)]+)\)', next_text)
-                if pron_match:
-                    entry.pronunciation = pron_match.group(1)
-
-                # Look for part of speech
-                pos_match = re.search(r'\b(sf|sm|sn|vb|adg|adv|prep|conj|interj|pron|articul)\b', next_text, re.IGNORECASE)
-                if pos_match:
-                    entry.part_of_speech = pos_match.group(1).lower()
-
-        # Also check for part of speech in expr spans
-        expr_span = p.find('span', class_='highlight_expr')
-        if expr_span:
-            expr_text = expr_span.get_text()
-            pos_match = re.search(r'\b(sf|sm|sn|vb|adg|adv|prep|conj|interj|pron|articul)\b', expr_text, re.IGNORECASE)
-            if pos_match and not entry.part_of_speech:
-                entry.part_of_speech = pos_match.group(1).lower()
-
-        # Extract examples (ex: prefix)
-        similar_span = p.find('span', class_='highlight_similar')
-        if similar_span and 'ex:' in similar_span.get_text():
-            # Get text after ex:
-            next_sib = similar_span.next_sibling
-            if next_sib:
-                example_text = str(next_sib) if isinstance(next_sib, str) else next_sib.get_text() if hasattr(next_sib, 'get_text') else ''
-                example_text = clean_text(example_text)
-                if example_text:
-                    # Split on semicolons for multiple examples
-                    examples = split_on_semicolon_outside_parens(example_text)
-                    entry.examples = examples[:10]  # Limit to 10 examples
-
-        # Extract source from the "more" link
-        source_links = p.find_all('a', class_='more')
-        for link in source_links:
-            link_text = link.get_text()
-            if 'Dictsiunar' in link_text or 'T.Cunia' in link_text or 'Mariana Bara' in link_text:
-                # Clean up source name
-                source = clean_text(link_text)
-                if source:
-                    # Remove DB reference
-                    source = re.sub(r'\s*Data DB:\d+>[\d\-\s:\.]+\s*', '', source)
-                    source = re.sub(r'\s*»\s*$', '', source)
-                    entry.source = source.strip()
-                    break
-
-        # Extract related terms (marked with §)
-        related = []
-        eng_spans = p.find_all('span', class_='highlight_eng')
-        for span in eng_spans:
-            if span.get_text().strip() == '§':
-                # Next sibling should contain the related term
-                next_sib = span.next_sibling
-                if next_sib:
-                    related_text = str(next_sib) if isinstance(next_sib, str) else ''
-                    # Extract the term (usually up to parenthesis or span)
-                    term_match = re.search(r'([a-zA-ZãâîșțşçăĂÂÎȘŢÇ\-/]+)', related_text)
-                    if term_match:
-                        related.append(term_match.group(1))
-
-        if related:
-            entry.related_terms = list(set(related))[:20]  # Dedupe and limit
-
-        # Extract definition (main Aromanian text after " – " and before translations)
-        # The definition appears as plain text between inflection info and {ro:}/{en:}/{fr:} markers
-        # Pattern: "headword (pron) sf inflections – DEFINITION HERE {ro: translation}"
-        dash_match = re.search(r'\s–\s(.+?)(?:\s*\{(?:ro|en|fr):|$)', p_text, re.DOTALL)
-        if dash_match:
-            def_text = clean_text(dash_match.group(1))
-            # Clean up: remove trailing related terms after semicolon if they look like word lists
-            if def_text:
-                # Check if there's meaningful definition text (not just "vedz tu X" references)
-                if not re.match(r'^vedz\s+tu\s+', def_text, re.IGNORECASE):
-                    # Remove trailing examples (ex:...) if captured
-                    def_text = re.split(r'\s*ex:', def_text, flags=re.IGNORECASE)[0]
-                    def_text = clean_text(def_text)
-                    if def_text and len(def_text) > 3:
-                        entry.definition = def_text
-
-        # Fallback: check highlight_arm span if no definition found
-        if not entry.definition:
-            arm_span = p.find('span', class_='highlight_arm')
-            if arm_span:
-                def_text = clean_text(arm_span.get_text())
-                # Skip if it's just the Romanian translation in curly braces
-                if def_text and not def_text.startswith('{ro:'):
-                    entry.definition = def_text
-
-        # Extract expressions (expr: markers)
-        expr_spans = p.find_all('span', class_='highlight_ex')
-        expressions = []
-        for span in expr_spans:
-            if 'expr:' in span.get_text().lower():
-                # Get surrounding text for context
-                parent_text = span.parent.get_text() if span.parent else ''
-                expr_match = re.search(r'expr:\s*([^;]+)', parent_text, re.IGNORECASE)
-                if expr_match:
-                    expressions.append(clean_text(expr_match.group(1)))
-
-        if expressions:
-            entry.expressions = list(set(expressions))[:10]
-
-        return entry
+        self.headword = clean_text(headword_link.get_text() if headword_link else h2.get_text())
+        if not self.headword:
+            return
+
+        self.paragraph = article.find('p')
+        if not self.paragraph:
+            return
+        self.text = self.text_of(self.paragraph)
+        self._index((node.name, node.get('class') or [], node)
+                    for node in self.paragraph.find_all(['span', 'a']))
+
+    def text_of(self, node) -> str:
+        # Tags hash (and compare) by their markup, which is expensive
+        key = id(node)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = node.get_text()
+        return text
+
+    def parent(self, node):
+        return node.parent
+
+    def next_sibling(self, node):
+        sibling = node.next_sibling
+        if isinstance(sibling, str):
+            return str(sibling) or None
+        return sibling
+
+
+class LxmlArticleView(ArticleView):
+    """ArticleView of an lxml <article> element."""
+
+    def __init__(self, article):
+        super().__init__()
+        # Without script/style/... elements, text extraction needs no checks
+        self.has_skipped = next(article.iter(*SKIPPED_TEXT_TAGS), None) is not None
+
+        h2 = next(article.iter('h2'), None)
+        if h2 is None:
+            return
+
+        headword_link = next(h2.iter('a'), None)
+        self.headword = clean_text(self.text_of(headword_link if headword_link is not None else h2))
+        if not self.headword:
+            return
+
+        self.paragraph = next(article.iter('p'), None)
+        if self.paragraph is None:
+            return
+        self.text = self.text_of(self.paragraph)
+        self._index((node.tag, (node.get('class') or '').split(), node)
+                    for node in self.paragraph.iter('span', 'a'))
+
+    def text_of(self, node) -> str:
+        # lxml elements hash by identity, so they key the cache directly
+        text = self._texts.get(node)
+        if text is None:
+            text = self._texts[node] = _text(node, self.has_skipped)
+        return text
+
+    def parent(self, node):
+        return node.getparent()
+
+    def next_sibling(self, node):
+        return _next_sibling(node)
+
+
+def _text(element, check_skipped: bool = True) -> str:
+    """Text of an lxml element, as BeautifulSoup's get_text() returns it.
+
+    With `check_skipped=False` the caller guarantees there are no script,
+    style, template, rt or rp elements below, so lxml can do it all in C.
+    """
+    if not check_skipped or next(element.iter(*SKIPPED_TEXT_TAGS), element) is element:
+        return ''.join(element.itertext())
+
+    parts = [element.text or '']
+    for child in element:
+        # Comments (non-string tags) contribute only their tail
+        if isinstance(child.tag, str) and child.tag not in SKIPPED_TEXT_TAGS:
+            parts.append(_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def _next_sibling(element):
+    """What BeautifulSoup's next_sibling is for an lxml element.
+
+    The text after an element is its tail; without one, the next node is
+    an element, or a comment (which BeautifulSoup treats as a string). An
+    empty string is returned as None, since the callers only test truth.
+    """
+    if element.tail:
+        return element.tail
+    sibling = element.getnext()
+    if sibling is not None and not isinstance(sibling.tag, str):
+        return sibling.text or None
+    return sibling
+
+
+# A source returns the candidate texts a rule looks at, in order.
+
 
+class Paragraph:
+    """The whole paragraph text."""
+
+    def __str__(self):
+        return "paragraph"
+
+    def candidates(self, view: ArticleView) -> tuple[str, ...]:
+        return (view.text,)
+
+
+class Span:
+    """Text of the first span with class `cls`."""
+
+    def __init__(self, cls: str):
+        self.cls = cls
+
+    def __str__(self):
+        return f"span.{self.cls}"
+
+    def candidates(self, view: ArticleView) -> tuple[str, ...]:
+        span = view.find(self.cls)
+        return () if span is None else (view.text_of(span),)
+
+
+class After:
+    """The string following the first span with class `cls` (or every such
+    span, with `every`) whose text passes `marker`.
+
+    With `elements`, a following element counts too, through its text.
+    """
+
+    def __init__(self, cls: str, marker=None, every: bool = False, elements: bool = False):
+        self.cls = cls
+        self.marker = marker
+        self.every = every
+        self.elements = elements
+
+    def __str__(self):
+        return f"after span.{self.cls}"
+
+    def candidates(self, view: ArticleView) -> list[str]:
+        texts = []
+        spans = view.find_all(self.cls) if self.every else view.find_all(self.cls)[:1]
+        for span in spans:
+            if self.marker and not self.marker(view.text_of(span)):
+                continue
+            sibling = view.next_sibling(span)
+            if isinstance(sibling, str):
+                texts.append(sibling)
+            elif sibling is not None and self.elements:
+                texts.append(view.text_of(sibling))
+        return texts
+
+
+class ParentOf:
+    """Text of the parent of every span with class `cls` whose text passes `marker`."""
+
+    def __init__(self, cls: str, marker):
+        self.cls = cls
+        self.marker = marker
+
+    def __str__(self):
+        return f"parent of span.{self.cls}"
+
+    def candidates(self, view: ArticleView) -> list[str]:
+        texts = []
+        for span in view.find_all(self.cls):
+            if self.marker(view.text_of(span)):
+                parent = view.parent(span)
+                texts.append(view.text_of(parent) if parent is not None else '')
+        return texts
+
+
+class MoreLinks:
+    """Text of each "more" link of the paragraph."""
+
+    def __str__(self):
+        return "a.more"
+
+    def candidates(self, view: ArticleView) -> list[str]:
+        return [view.text_of(link) for link in view.more_links]
+
+
+class Rule:
+    """How one entry field is extracted.
+
+    For each candidate text from `source` that passes `when`: search
+    `pattern` and take its first group (or the whole text without a
+    pattern), then `clean_text` it if `clean`, then apply `transform`. The
+    first truthy value sets the field, unless an earlier rule already set
+    it. With `many`, the values of all candidates are collected instead,
+    deduplicated (keeping the first of each) and cut to `limit`.
+    """
+
+    def __init__(self, field: str, source, pattern: re.Pattern | None = None, when=None,
+                 clean: bool = True, transform=None, many: bool = False, limit: int | None = None):
+        self.field = field
+        self.source = source
+        self.pattern = pattern
+        self.when = when
+        self.clean = clean
+        self.transform = transform
+        self.many = many
+        self.limit = limit
+        self.name = f"{field} <- {source}"
+
+    def extract(self, view: ArticleView):
+        values = []
+        for text in self.source.candidates(view):
+            if self.when is not None and not self.when(text):
+                continue
+            if self.pattern is not None:
+                match = self.pattern.search(text)
+                if not match:
+                    continue
+                text = match.group(1)
+            value = clean_text(text) if self.clean else text
+            if self.transform is not None and value:
+                value = self.transform(value)
+            if self.many:
+                values.append(value)
+            elif value:
+                return value
+
+        if values:
+            # Not list(set(...)): its order changes with every process's hash seed
+            return list(dict.fromkeys(values))[:self.limit]
+        return None
+
+
+PART_OF_SPEECH_RE = re.compile(r'\b(sf|sm|sn|vb|adg|adv|prep|conj|interj|pron|articul)\b', re.IGNORECASE)
+VEDZ_TU_RE = re.compile(r'^vedz\s+tu\s+', re.IGNORECASE)
+EXAMPLES_MARKER_RE = re.compile(r'\s*ex:', re.IGNORECASE)
+DB_REFERENCE_RE = re.compile(r'\s*Data DB:\d+>[\d\-\s:\.]+\s*')
+SOURCE_SUFFIX_RE = re.compile(r'\s*»\s*$')
+SOURCE_MARKERS = ('Dictsiunar', 'T.Cunia', 'Mariana Bara')
+
+
+def _not_braced(text: str) -> bool:
+    return not text.startswith('{')
+
+
+def _examples(text: str) -> list[str]:
+    # Split on semicolons for multiple examples; at most 10
+    return split_on_semicolon_outside_parens(text)[:10]
+
+
+def _source_name(text: str) -> str:
+    # Remove the DB reference and the trailing link arrow
+    text = DB_REFERENCE_RE.sub('', text)
+    return SOURCE_SUFFIX_RE.sub('', text).strip()
+
+
+def _definition(text: str) -> str | None:
+    # "vedz tu X" only points to another headword
+    if VEDZ_TU_RE.match(text):
+        return None
+    # Remove trailing examples (ex:...) if captured
+    text = clean_text(EXAMPLES_MARKER_RE.split(text)[0])
+    return text if text and len(text) > 3 else None
+
+
+# Translations come first: test data is recognised by them, and skipped
+# before the other fields are extracted.
+TRANSLATION_RULES = (
+    # Curly brace format in the text itself: {ro: ...} {fr: ...} {en: ...}
+    Rule('translation_ro', Paragraph(), re.compile(r'\{ro:\s*([^}]+)\}')),
+    Rule('translation_fr', Paragraph(), re.compile(r'\{fr:\s*([^}]+)\}')),
+    Rule('translation_en', Paragraph(), re.compile(r'\{en:\s*([^}]+)\}')),
+    # "RO: <span>" format of the Mariana Bara dictionary
+    Rule('translation_ro', Span('highlight_ro'), when=_not_braced),
+    # The § of related terms uses the same class as English translations
+    Rule('translation_en', Span('highlight_eng'), when=lambda t: t.strip() != '§' and _not_braced(t)),
+    Rule('translation_fr', Span('highlight_fran'), when=_not_braced),
+)
+
+FIELD_RULES = (
+    Rule('etymology', Paragraph(), re.compile(r'Et:\s*([^<\n]+)'), transform=lambda v: v if v != 'Et:' else None),
+    Rule('context', Paragraph(), re.compile(r'Context:\s*([^<\n]+)')),
+    # "headword (pronunciation) sf ..." right after the headword span
+    Rule('pronunciation', After('highlight_pvorb'), re.compile(r'\(([^)]+)\)'), clean=False),
+    Rule('part_of_speech', After('highlight_pvorb'), PART_OF_SPEECH_RE, clean=False, transform=str.lower),
+    Rule('part_of_speech', Span('highlight_expr'), PART_OF_SPEECH_RE, clean=False, transform=str.lower),
+    Rule('examples', After('highlight_similar', marker=lambda t: 'ex:' in t, elements=True),
+         transform=_examples),
+    Rule('source', MoreLinks(), when=lambda t: any(marker in t for marker in SOURCE_MARKERS),
+         transform=_source_name),
+    # Related terms follow a § marker
+    Rule('related_terms', After('highlight_eng', marker=lambda t: t.strip() == '§', every=True),
+         re.compile(r'([a-zA-ZãâîșțşçăĂÂÎȘŢÇ\-/]+)'), clean=False, many=True, limit=20),
+    # Main Aromanian text between " – " and the translations
+    Rule('definition', Paragraph(), re.compile(r'\s–\s(.+?)(?:\s*\{(?:ro|en|fr):|$)', re.DOTALL),
+         transform=_definition),
+    Rule('definition', Span('highlight_arm'), transform=lambda v: v if not v.startswith('{ro:') else None),
+    Rule('expressions', ParentOf('highlight_ex', marker=lambda t: 'expr:' in t.lower()),
+         re.compile(r'expr:\s*([^;]+)', re.IGNORECASE), many=True, limit=10),
+)
+
+
+def apply_rules(entry: DictionaryEntry, view: ArticleView, rules) -> DictionaryEntry:
+    """Set the fields of `entry` that `rules` find in the article."""
+    profile = _profile
+    for rule in rules:
+        if getattr(entry, rule.field):
+            if profile:
+                profile.skip(rule.name)
+            continue
+        if profile:
+            start = time.perf_counter()
+            value = rule.extract(view)
+            profile.record(rule.name, time.perf_counter() - start, hit=value is not None)
+        else:
+            value = rule.extract(view)
+        if value is not None:
+            setattr(entry, rule.field, value)
+    return entry
+
+
+def extract_entry(view: ArticleView, source_query: str) -> DictionaryEntry | None:
+    """Build the DictionaryEntry of an article from its view."""
+    if not view.headword:
+        return None
+    if view.paragraph is None:
+        return DictionaryEntry(headword=view.headword)
+
+    entry = DictionaryEntry(headword=view.headword, source_url=source_url(source_query))
+    apply_rules(entry, view, TRANSLATION_RULES)
+
+    translations = {
+        'ro': entry.translation_ro,
+        'en': entry.translation_en,
+        'fr': entry.translation_fr
+    }
+    if is_test_entry(view.headword, translations):
+        return None
+
+    return apply_rules(entry, view, FIELD_RULES)
+
+
+def _article_view(view_class, article) -> ArticleView:
+    if not _profile:
+        return view_class(article)
+    start = time.perf_counter()
+    view = view_class(article)
+    _profile.record("article view", time.perf_counter() - start)
+    return view
+
+
+def parse_article(article: Tag, source_query: str) -> DictionaryEntry | None:
+    """Parse a single article element into a DictionaryEntry."""
+    try:
+        return extract_entry(_article_view(SoupArticleView, article), source_query)
+    except Exception as e:
+        print(f"Error parsing article: {e}")
+        return None
+
+
+def parse_article_lxml(article, source_query: str) -> DictionaryEntry | None:
+    """Parse a single lxml article element into a DictionaryEntry."""
+    try:
+        return extract_entry(_article_view(LxmlArticleView, article), source_query)
     except Exception as e:
         print(f"Error parsing article: {e}")
         return None
 
 
+class ParserProfile:
+    """Time spent in each parsing step, and how often each rule found its field.
+
+    A rule scores a hit when it sets its field, a miss when it finds
+    nothing, and a skip when an earlier rule already set the field (so it
+    did not run; fallbacks show up as rules with many skips).
+    """
+
+    def __init__(self):
+        # step -> [seconds, calls, hits, misses, skips]
+        self.steps: dict[str, list] = {}
+
+    def record(self, step: str, seconds: float, hit: bool | None = None):
+        stats = self.steps.setdefault(step, [0.0, 0, 0, 0, 0])
+        stats[0] += seconds
+        stats[1] += 1
+        if hit is not None:
+            stats[2 if hit else 3] += 1
+
+    def skip(self, step: str):
+        self.steps.setdefault(step, [0.0, 0, 0, 0, 0])[4] += 1
+
+    def report(self) -> str:
+        """Steps ranked by total time, with their hit rates."""
+        total = sum(stats[0] for stats in self.steps.values()) or 1.0
+        width = max(map(len, self.steps), default=4)
+        lines = [f"{'Step':<{width}} {'Calls':>8} {'Hits':>8} {'Misses':>8} {'Skips':>8} "
+                 f"{'Hit %':>6} {'Total ms':>10} {'us/call':>8} {'Time %':>6}"]
+        for step, (seconds, calls, hits, misses, skips) in sorted(
+                self.steps.items(), key=lambda item: item[1][0], reverse=True):
+            if hits + misses + skips:
+                hit_rate = f"{100 * hits / (hits + misses):.1f}" if hits + misses else "-"
+                outcome = f"{hits:>8} {misses:>8} {skips:>8} {hit_rate:>6}"
+            else:
+                outcome = f"{'':>8} {'':>8} {'':>8} {'':>6}"
+            per_call = 1e6 * seconds / calls if calls else 0.0
+            lines.append(f"{step:<{width}} {calls:>8} {outcome} {1000 * seconds:>10.1f} "
+                         f"{per_call:>8.1f} {100 * seconds / total:>6.1f}")
+        return '\n'.join(lines)
+
+
+_profile: ParserProfile | None = None
+
+
+@contextmanager
+def profiling():
+    """Profile all parsing done inside the block; yields the ParserProfile."""
+    global _profile
+    previous, _profile = _profile, ParserProfile()
+    try:
+        yield _profile
+    finally:
+        _profile = previous
+
+
 def parse_all_letters() -> list[str]:
     """Return all letters in the alphabet for iteration."""
     return list('abcdefghijklmnopqrstuvwxyz')
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Profile the search results parser over a corpus of pages.
+
+Parses every page of the corpus with profiling on and prints each parsing
+step ranked by the time it took: building the HTML tree, building the
+article views, and every field rule. For the rules it also shows how often
+they found their field, missed, or were skipped because an earlier rule had
+already set it. That is how often each fallback (the highlight_ro/eng/fran
+translation spans, the highlight_arm definition, ...) actually fires.
+
+The corpus is the response cache if it holds search results pages, else
+(or with --synthetic) pages of the synthetic stand-in site.
+
+Usage:
+    python profile_parser.py                       # Pages from ../data/cache
+    python profile_parser.py --limit 2000 --parser soup
+    python profile_parser.py --synthetic --words-per-letter 100
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from cache import CACHE_DIR, ResponseCache
+from parser import parse_search_results, parse_search_results_soup, profiling
+from standin_server import SyntheticSite
+
+
+PARSERS = {'lxml': parse_search_results, 'soup': parse_search_results_soup}
+
+
+def synthetic_pages(words_per_letter: int):
+    site = SyntheticSite(words_per_letter=words_per_letter)
+    for words in site.words.values():
+        for word in words:
+            yield f"synthetic {word}", site.search_page(word), word
+
+
+def cached_pages(cache_dir: str, limit: int | None):
+    if not (Path(cache_dir) / "index.jsonl").exists():
+        return
+    cache = ResponseCache(cache_dir)
+    count = 0
+    for url in cache.urls():
+        query = parse_qs(urlsplit(url).query).get('inputWord')
+        if not query:
+            continue
+        yield f"cached {url}", cache.get(url), query[0]
+        count += 1
+        if limit and count >= limit:
+            break
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-step timing and hit rates of the result parser")
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help=f'Response cache to take pages from (default: {CACHE_DIR})')
+    parser.add_argument('--limit', type=int, help='Profile at most this many cached pages')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='Use synthetic stand-in pages even if the cache has pages')
+    parser.add_argument('--words-per-letter', type=int, default=40,
+                        help='Size of the synthetic site (default: 40)')
+    parser.add_argument('--parser', choices=PARSERS, default='lxml',
+                        help='Parser to profile (default: lxml)')
+    args = parser.parse_args()
+
+    corpus = [] if args.synthetic else list(cached_pages(args.cache_dir, args.limit))
+    source = f"cached pages from {args.cache_dir}"
+    if not corpus:
+        corpus = list(synthetic_pages(args.words_per_letter))
+        source = "synthetic pages"
+
+    parse = PARSERS[args.parser]
+    entries = 0
+    # Per-article error messages would drown the report
+    with profiling() as profile, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _, html, query in corpus:
+            entries += len(parse(html, query))
+        elapsed = time.perf_counter() - start
+
+    print(f"Profiled the {args.parser} parser on {len(corpus)} {source}: {entries} entries "
+          f"in {elapsed:.2f}s ({len(corpus) / elapsed:.0f} pages/s, with profiling overhead)\n")
+    print(profile.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Request rate limiting shared by all scraper workers."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `burst`.
+
+    Waiters are served in FIFO order, so one slow consumer cannot starve
+    the others.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def set_rate(self, rate: float):
+        """Change the rate; tokens earned at the old rate are kept."""
+        self._refill()
+        self.rate = rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a request token is available and consume it."""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """One token bucket per host, shared by every worker of a crawl."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for the host of `url`."""
+        host = urlsplit(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.buckets[host]
+
+    async def acquire(self, url: str):
+        """Wait for a request slot on the host of `url`."""
+        await self.bucket(url).acquire()
+
+    def set_rate(self, rate: float):
+        """Change the rate of every host's bucket."""
+        self.rate = rate
+        for bucket in self.buckets.values():
+            bucket.set_rate(rate)
+
+
+class AdaptiveRateController:
+    """AIMD control of the request rate, driven by how the server responds.
+
+    Every `window` healthy responses (fast enough, no errors) the rate grows
+    by `increase_step`. A 429, a 5xx, a timeout or a window with slow
+    responses cuts it by `decrease_factor`, at most once per window so one
+    burst of in-flight failures is not counted many times. `Retry-After` pauses
+    all requests, and `breaker_threshold` consecutive failures open a
+    circuit breaker that pauses the crawl for `breaker_cooldown` seconds and
+    restarts it at the minimum rate.
+    """
+
+    def __init__(self, limiter: RateLimiter, min_rate: float = 0.5, max_rate: float = 20.0,
+                 increase_step: float = 0.5, decrease_factor: float = 0.5,
+                 latency_target: float = 2.0, window: int = 20,
+                 breaker_threshold: int = 10, breaker_cooldown: float = 60.0,
+                 adaptive: bool = True):
+        self.limiter = limiter
+        self.rate = limiter.rate
+        self.min_rate = min(min_rate, self.rate) if self.rate > 0 else min_rate
+        self.max_rate = max(max_rate, self.rate)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.window = window
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        # A non-positive rate means "unlimited", which there is nothing to adapt
+        self.adaptive = adaptive and self.rate > 0
+
+        self.paused_until = 0.0
+        self.window_count = 0
+        self.window_latency = 0.0
+        self.responses_since_decrease = window
+        self.consecutive_failures = 0
+        self.breaker_trips = 0
+        self.increases = 0
+        self.decreases = 0
+        self.peak_rate = self.rate
+
+    def _set_rate(self, rate: float):
+        self.rate = max(self.min_rate, min(self.max_rate, rate))
+        self.peak_rate = max(self.peak_rate, self.rate)
+        self.limiter.set_rate(self.rate)
+
+    def pause(self, seconds: float):
+        """Hold back all requests for `seconds`."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def acquire(self, url: str):
+        """Wait out any pause, then take a token from the host's bucket."""
+        while True:
+            delay = self.paused_until - time.monotonic()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        await self.limiter.acquire(url)
+
+    def record_success(self, latency: float):
+        """Feed back a completed, non-error response."""
+        self.consecutive_failures = 0
+        self.responses_since_decrease += 1
+        if not self.adaptive:
+            return
+
+        self.window_count += 1
+        self.window_latency += latency
+        if self.window_count < self.window:
+            return
+
+        mean_latency = self.window_latency / self.window_count
+        self.window_count = 0
+        self.window_latency = 0.0
+
+        if mean_latency > self.latency_target:
+            # Slow responses are the server queueing up: back off before errors
+            self._decrease()
+        else:
+            self._set_rate(self.rate + self.increase_step)
+            self.increases += 1
+
+    def record_failure(self, retry_after: float | None = None):
+        """Feed back a 429/5xx response or a timeout/connection error."""
+        self.consecutive_failures += 1
+        self.window_count = 0
+        self.window_latency = 0.0
+
+        if retry_after:
+            self.pause(retry_after)
+
+        if self.consecutive_failures >= self.breaker_threshold:
+            self.breaker_trips += 1
+            self.consecutive_failures = 0
+            self.pause(self.breaker_cooldown)
+            if self.adaptive:
+                self._set_rate(self.min_rate)
+                self.responses_since_decrease = 0
+            print(f"  Circuit breaker open: pausing requests for {self.breaker_cooldown:.0f}s")
+        elif self.adaptive:
+            self._decrease()
+
+    def _decrease(self):
+        if self.responses_since_decrease < self.window:
+            return
+        self._set_rate(self.rate * self.decrease_factor)
+        self.decreases += 1
+        self.responses_since_decrease = 0
+
+    def report(self) -> str:
+        """Summary of where the controller settled."""
+        if self.rate <= 0:
+            return "Request rate: unlimited"
+        summary = f"Request rate settled at {self.rate:.2f} req/s (peak {self.peak_rate:.2f})"
+        if self.adaptive:
+            summary += f", {self.increases} increases, {self.decreases} decreases"
+        if self.breaker_trips:
+            summary += f", circuit breaker tripped {self.breaker_trips}x"
+        return summary
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
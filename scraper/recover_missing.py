@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Recover the 2 missing words from the scrape."""
+"""Recover the 2 missing words from the scrape.
+
+For words that failed during a crawl, prefer `python scraper.py --retry-failed`,
+which re-scrapes everything in data/failed_words.jsonl.
+"""
 
 import asyncio
 import json
@@ -11,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import httpx
 from parser import parse_search_results
+from transport import create_client
 from urllib.parse import quote
 
 MISSING_WORDS = ['marlu']
@@ -32,7 +37,7 @@ async def scrape_word(client: httpx.AsyncClient, word: str):
 async def main():
     print("Recovering missing words...")
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with create_client() as client:
         all_entries = []
 
         for word in MISSING_WORDS:
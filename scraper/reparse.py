@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Regenerate dictionary.jsonl by re-parsing every page in the response cache.
+
+After a parser fix, this applies the fix to the whole dataset without
+touching the network (and without one-off repair scripts such as
+fix_split_examples.py). Every cached search results page is parsed again
+with parse_search_results across all cores; the entries are then sorted
+and deduplicated exactly like a crawl's export, and JSON and CSV are
+exported from the result.
+
+The output is deterministic: pages are parsed in URL order, results are
+written in that order, and the sort is stable.
+
+Unlike `scraper.py --replay`, this needs neither the index pages nor the
+checkpoint journal: it works from whatever pages the cache holds, which is
+every page a crawl fetched.
+
+Usage:
+    python reparse.py                          # Cache in ../data/cache -> ../data/
+    python reparse.py --workers 8
+    python reparse.py --output-dir /tmp/reparsed --jsonl-only
+    python reparse.py --compress gzip          # Also write a framed dictionary.jsonl.gz
+    python reparse.py --parquet                # Also write dictionary.parquet (needs pyarrow)
+"""
+
+import argparse
+import gzip
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from urllib.parse import unquote
+
+from tqdm import tqdm
+
+from cache import CACHE_DIR, ResponseCache
+from columnar import check_parquet
+from exporter import DictionaryExporter
+from extsort import sort_dedupe_jsonl
+from frames import CODECS, check_codec
+from parser import parse_search_results
+from scraper import DATA_DIR, DUPLICATES_FILE, JSONL_FILE, export_formats
+
+
+CHUNK_SIZE = 32  # Pages handed to a worker at a time
+
+
+def query_word(url: str) -> str | None:
+    """The word a cached search results URL was fetched for, or None."""
+    _, sep, value = url.partition('inputWord=')
+    if not sep:
+        return None
+    return unquote(value.split('&', 1)[0])
+
+
+def parse_cached_page(item: tuple[str, str]) -> tuple[list[str], int]:
+    """Parse one cached page; returns (JSONL lines, page size in bytes).
+
+    Runs in the worker processes, which read and decompress the page
+    themselves, so only a path goes in and only JSON lines come back.
+    """
+    path, query = item
+    with open(path, 'rb') as f:
+        data = gzip.decompress(f.read())
+    entries = parse_search_results(data.decode('utf-8'), query)
+    return [entry.to_json() for entry in entries], len(data)
+
+
+def reparse(cache_dir: str = CACHE_DIR, output_dir: str = DATA_DIR,
+            workers: int | None = None, chunk_size: int = CHUNK_SIZE) -> int:
+    """Re-parse all cached search results pages into `output_dir`/dictionary.jsonl.
+
+    Returns the number of unique entries written.
+    """
+    cache = ResponseCache(cache_dir)
+    pages = sorted((url, query_word(url)) for url in cache.urls())
+    items = [(str(cache.object_path(cache.index[url])), query)
+             for url, query in pages if query is not None]
+    if not items:
+        print(f"No cached search results pages in {cache_dir}")
+        return 0
+
+    output = Path(output_dir) / JSONL_FILE
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix('.reparse.tmp')
+    workers = workers or os.cpu_count() or 1
+
+    print(f"Re-parsing {len(items)} cached pages with {workers} workers...")
+    entries = 0
+    page_bytes = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool, \
+            open(tmp_path, 'w', encoding='utf-8') as out:
+        results = pool.map(parse_cached_page, items, chunksize=chunk_size)
+        for lines, size in tqdm(results, total=len(items), desc="Pages"):
+            for line in lines:
+                out.write(line + '\n')
+            entries += len(lines)
+            page_bytes += size
+    parse_elapsed = time.perf_counter() - start
+
+    sort_start = time.perf_counter()
+    unique_count = sort_dedupe_jsonl([tmp_path], output,
+                                     duplicates=output.with_name(DUPLICATES_FILE))
+    tmp_path.unlink()
+    sort_elapsed = time.perf_counter() - sort_start
+
+    print(f"\nParsed {len(items)} pages ({page_bytes / 1e6:.1f} MB) into {entries} entries "
+          f"in {parse_elapsed:.1f}s: {len(items) / parse_elapsed:.0f} pages/s, "
+          f"{page_bytes / 1e6 / parse_elapsed:.1f} MB/s")
+    print(f"Sorted and deduplicated in {sort_elapsed:.1f}s")
+    print(f"Unique entries after deduplication: {unique_count}")
+    print(f"Exported {unique_count} entries to {output}")
+    return unique_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate dictionary.jsonl from the response cache")
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help=f'Response cache to re-parse (default: {CACHE_DIR})')
+    parser.add_argument('--output-dir', default=DATA_DIR,
+                        help=f'Directory to write {JSONL_FILE} and the other exports to (default: {DATA_DIR})')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help=f'Parser processes (default: {os.cpu_count()})')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'Pages sent to a worker at a time (default: {CHUNK_SIZE})')
+    parser.add_argument('--jsonl-only', action='store_true',
+                        help='Only write the JSONL, not the JSON and CSV exports')
+    parser.add_argument('--compress', nargs='+', choices=CODECS, default=[],
+                        help='Also export the JSONL compressed in seekable frames (frames.py)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also export dictionary.parquet for columnar analytics (columnar.py)')
+    args = parser.parse_args()
+    try:
+        for codec in args.compress:
+            check_codec(codec)
+        if args.parquet:
+            check_parquet()
+    except ValueError as e:
+        parser.error(str(e))
+
+    unique_count = reparse(args.cache_dir, args.output_dir, workers=args.workers,
+                           chunk_size=args.chunk_size)
+    if unique_count and not args.jsonl_only:
+        exporter = DictionaryExporter(args.output_dir, compression=tuple(args.compress),
+                                      parquet=args.parquet)
+        export_formats(exporter, unique_count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Deferred retries and dead-lettering for failed scraper requests."""
+
+import asyncio
+import heapq
+import itertools
+import json
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+RETRY_ATTEMPTS = 3  # Total attempts per request, including the first
+RETRY_BASE_DELAY = 4.0  # Backoff before the second attempt (seconds)
+RETRY_MAX_DELAY = 60.0
+DEAD_LETTER_FILE = "../data/failed_words.jsonl"
+
+
+class RetryQueue:
+    """Delayed queue of failed requests with exponential backoff.
+
+    A failed item waits here until its backoff expires instead of sleeping
+    in the worker that fetched it, so other words keep flowing meanwhile.
+    """
+
+    def __init__(self, max_attempts: int = RETRY_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._heap: list[tuple[float, int, object]] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay after failed attempt number `attempt` (1-based), with jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def schedule(self, item, attempt: int, delay: float | None = None) -> bool:
+        """Queue `item` for another try after failed attempt `attempt`.
+
+        Returns False when the item has used up its attempts.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if delay is None:
+            delay = self.backoff(attempt)
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), item))
+        self._wakeup.set()
+        return True
+
+    async def get(self):
+        """Wait for the next item whose backoff has expired."""
+        while True:
+            timeout = None
+            if self._heap:
+                timeout = self._heap[0][0] - time.monotonic()
+                if timeout <= 0:
+                    return heapq.heappop(self._heap)[2]
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+class DeadLetterFile:
+    """JSONL file of words that exhausted their retries."""
+
+    def __init__(self, path: str | Path = DEAD_LETTER_FILE):
+        self.path = Path(path)
+
+    def append(self, word: str, letter: str | None, error: str, attempts: int):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "word": word,
+            "letter": letter,
+            "error": error,
+            "attempts": attempts,
+            "failed_at": datetime.utcnow().isoformat(),
+        }
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def read(self) -> list[dict]:
+        """Return the latest record for each dead-lettered word."""
+        if not self.path.exists():
+            return []
+
+        records = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    records[record['word']] = record
+        return list(records.values())
+
+    def rewrite(self, records: list[dict]):
+        """Replace the file with `records` (removing it when empty)."""
+        if not records:
+            self.path.unlink(missing_ok=True)
+            return
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        tmp_path.replace(self.path)
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
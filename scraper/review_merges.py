@@ -5,6 +5,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from models import load_entry
+
 
 class MergeReviewer:
     """Interactive CLI for reviewing dictionary merge candidates."""
@@ -32,7 +34,7 @@ class MergeReviewer:
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 if line.strip():
-                    entry = json.loads(line)
+                    entry = load_entry(line)
                     hw = entry['headword']
                     if hw not in self.entries_by_headword:
                         self.entries_by_headword[hw] = []
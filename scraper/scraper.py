@@ -8,161 +8,444 @@ This scraper:
 3. Parses the HTML and extracts structured data
 4. Exports to JSON, JSONL, and CSV formats
 
+Steps 2-3 run as a fetch -> parse -> write pipeline: async fetch workers feed
+a process pool of parsers through bounded queues, and a single writer appends
+the results, so network I/O and parsing overlap.
+
 Usage:
     python scraper.py                    # Scrape all letters
     python scraper.py --letters a b c    # Scrape specific letters
-    python scraper.py --resume           # Resume from last checkpoint
+    python scraper.py --resume           # Resume from the checkpoint journal
     python scraper.py --test             # Test with first 10 words only
+    python scraper.py --concurrency 8 --rate 10 --burst 10
+    python scraper.py --max-rate 10      # Cap the adaptive request rate
+    python scraper.py --fixed-rate       # Disable adaptive rate control
+    python scraper.py --parse-workers 4  # Parser processes (0 = parse inline)
+    python scraper.py --replay           # Re-extract from cached HTML, no network
+    python scraper.py --retry-failed     # Re-scrape only dead-lettered words
+    python scraper.py --incremental      # Refresh: re-export only pages that changed
+    python scraper.py --no-skip-covered  # Fetch every index word, even covered ones
+    python scraper.py --shard 2/4        # Crawl one quarter of the words into data/shards/
+    python scraper.py --merge-shards     # Merge finished shards into the data/ exports
+    python scraper.py --metrics-port 9100  # Serve Prometheus metrics while crawling
+    python scraper.py --compress gzip zstd  # Also export framed dictionary.jsonl.gz/.zst
+    python scraper.py --parquet          # Also export dictionary.parquet (needs pyarrow)
+
+The request rate starts at --rate and adapts (AIMD) to observed latency,
+429/5xx responses and Retry-After, within --min-rate/--max-rate; sustained
+failures trip a circuit breaker that pauses the crawl.
+
+Failed requests are retried from a delayed retry queue with exponential
+backoff while other words keep flowing. Words that exhaust their retries are
+written to data/failed_words.jsonl, which --retry-failed drains.
+
+A search results page usually lists articles for several headwords. Index
+words whose headword already appeared on a scraped page are not fetched
+again; they are journaled as "covered", and verify_completeness.py counts
+them alongside scraped words.
+
+A crawl can be split over several processes or machines with --shard i/N:
+each shard owns a contiguous, equally sized slice of the words of all letter
+indexes (see sharding.py) and keeps its own JSONL, journal and dead letters.
+Once every shard is done (and its directory copied into data/shards/),
+--merge-shards k-way merges their sorted outputs into data/.
+
+An incremental crawl compares every page with the response cache as it was
+when the crawl started: conditional requests (If-None-Match/If-Modified-Since)
+let the server answer 304, and otherwise the body hash is compared. Only
+changed pages are parsed; their entries go to dictionary.delta.jsonl and
+replace the old entries of the same query when the export is finalized.
+
+While it runs, the crawl records fetch, parse, write and checkpoint metrics
+and queue depths (see metrics.py) to data/metrics.json every
+--stats-interval seconds, and with --metrics-port serves them to Prometheus.
 """
 
 import argparse
 import asyncio
+import heapq
 import json
-import random
+import os
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from urllib.parse import quote, unquote
+from urllib.parse import quote
 
 import httpx
 from tqdm import tqdm
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from cache import BASELINE_FILE, CACHE_DIR, CacheMiss, ResponseCache
 from models import DictionaryEntry
-from parser import parse_letter_index, parse_search_results, get_word_count_from_index
+from parser import parse_letter_index_page, parse_search_results, source_url
+from columnar import check_parquet
 from exporter import DictionaryExporter
+from frames import CODECS, check_codec
+from extsort import merge_sorted_jsonl, sort_dedupe_jsonl
+from journal import JOURNAL_FILE, CheckpointJournal, JournalState, read_legacy_checkpoint
+from metrics import BYTES_BUCKETS, COUNT_BUCKETS, METRICS_FILE, STATS_INTERVAL, Metrics, MetricsReporter
+from ratelimit import AdaptiveRateController, RateLimiter, parse_retry_after
+from retry_queue import DEAD_LETTER_FILE, DeadLetterFile, RetryQueue
+from sharding import SHARDS_DIR, find_shards, parse_shard, shard_dir, shard_ranges
+from transport import create_client
 
 
 # Configuration
 BASE_URL = "https://www.dixionline.net"
-REQUEST_DELAY_MIN = 0.1  # Minimum delay between requests (seconds)
-REQUEST_DELAY_MAX = 0.3  # Maximum delay
-TIMEOUT = 30.0
-MAX_CONCURRENT = 1  # Keep it at 1 for politeness
-CHECKPOINT_FILE = "../data/checkpoint.json"
-USER_AGENT = "Mozilla/5.0 (compatible; AromanianDictBot/1.0; +https://github.com/your-repo)"
+DATA_DIR = "../data"  # Exports, journal and dead letters
+REQUESTS_PER_SECOND = 5.0  # Starting request budget shared by all workers
+MIN_REQUESTS_PER_SECOND = 0.5  # Adaptive rate control never goes below this...
+MAX_REQUESTS_PER_SECOND = 20.0  # ...or above this
+REQUEST_BURST = 5  # Requests allowed back-to-back after an idle period
+MAX_CONCURRENT = 4  # Number of concurrent fetch workers
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)  # Parser processes
+CHECKPOINT_EVERY = 50  # Save a checkpoint every N completed words
+CHECKPOINT_FILE = "../data/checkpoint.json"  # Pre-journal checkpoints, migrated on resume
+JSONL_FILE = "dictionary.jsonl"
+DELTA_FILE = "dictionary.delta.jsonl"  # Entries of pages changed in an incremental crawl
+DUPLICATES_FILE = "dictionary.duplicates.jsonl"  # Entries dropped by dedupe, kept for incremental merges
+
+# Pipeline results that have no entries to write
+UNCHANGED = "unchanged"  # Incremental crawl: page identical to the baseline
+COVERED = "covered"  # Headword already harvested from another page; not fetched
+RETRYABLE_ERRORS = (httpx.HTTPError,)  # Includes timeouts and HTTP status errors
+
+
+class CrawlProgress:
+    """Tracks the resume position of a crawl whose words finish out of order.
+
+    Each letter holds the position at its first word until its index has
+    been fetched and all its words submitted. The position is the earliest
+    letter or word still in flight, so everything before it is finished.
+    """
+
+    LETTER, WORD = 0, 1
+
+    def __init__(self, letters: list[str]):
+        self.letters = list(letters)
+        self.letter_order = {letter: i for i, letter in enumerate(letters)}
+        self.in_flight: list[tuple[int, int, int]] = []
+        self.finished: set[tuple[int, int, int]] = set()
+        self.furthest: tuple[int, int] | None = None
+
+    def _push(self, item: tuple[int, int, int]):
+        heapq.heappush(self.in_flight, item)
+
+    def _finish(self, item: tuple[int, int, int]):
+        self.finished.add(item)
+        while self.in_flight and self.in_flight[0] in self.finished:
+            self.finished.discard(heapq.heappop(self.in_flight))
+
+    def open_letter(self, letter: str, start_idx: int):
+        self._push((self.letter_order[letter], start_idx, self.LETTER))
+
+    def close_letter(self, letter: str, start_idx: int):
+        self._finish((self.letter_order[letter], start_idx, self.LETTER))
+
+    def submit(self, letter: str, word_idx: int):
+        self._push((self.letter_order[letter], word_idx, self.WORD))
+        after = (self.letter_order[letter], word_idx + 1)
+        if self.furthest is None or after > self.furthest:
+            self.furthest = after
+
+    def complete(self, letter: str, word_idx: int):
+        self._finish((self.letter_order[letter], word_idx, self.WORD))
+
+    def position(self) -> tuple[str, int]:
+        """Return (letter, word_idx) from which a resumed crawl should start."""
+        if self.in_flight:
+            letter_idx, word_idx, _ = self.in_flight[0]
+            return self.letters[letter_idx], word_idx
+        if self.furthest:
+            letter_idx, word_idx = self.furthest
+            return self.letters[letter_idx], word_idx
+        return (self.letters[0] if self.letters else 'a'), 0
 
 
 class DictionaryScraper:
     """Scrapes the dixionline.net dictionary."""
 
-    def __init__(self, delay_min: float = REQUEST_DELAY_MIN, delay_max: float = REQUEST_DELAY_MAX):
-        self.delay_min = delay_min
-        self.delay_max = delay_max
+    def __init__(self, concurrency: int = MAX_CONCURRENT, rate: float = REQUESTS_PER_SECOND,
+                 burst: int = REQUEST_BURST, cache_dir: str | None = CACHE_DIR, replay: bool = False,
+                 parse_workers: int = PARSE_WORKERS, adaptive: bool = True,
+                 min_rate: float = MIN_REQUESTS_PER_SECOND, max_rate: float = MAX_REQUESTS_PER_SECOND,
+                 base_url: str | None = None, data_dir: str = DATA_DIR, incremental: bool = False,
+                 skip_covered: bool = True, shard: tuple[int, int] | None = None,
+                 stats_interval: float = STATS_INTERVAL, metrics_port: int | None = None,
+                 compression: tuple[str, ...] = (), parquet: bool = False):
+        self.base_url = (base_url or BASE_URL).rstrip('/')
+        self.concurrency = max(1, concurrency)
+        self.parse_workers = max(0, parse_workers)
+        self.parse_pool: ProcessPoolExecutor | None = None
+        self.rate = AdaptiveRateController(RateLimiter(rate, burst), min_rate=min_rate,
+                                           max_rate=max_rate, adaptive=adaptive)
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.replay = replay
+        if replay and self.cache is None:
+            raise ValueError("Replay mode needs a response cache")
+        self.incremental = incremental
+        if incremental and (self.cache is None or replay):
+            raise ValueError("Incremental mode needs a response cache and the network")
+        # Cache index as of the start of an incremental crawl; pages are compared against it
+        self.baseline: ResponseCache | None = None
+        self.skip_covered = skip_covered
+        self.shard = shard  # (i, N): crawl only the i-th of N slices of the words
+        self.scraped_count = 0  # Words fetched and parsed by this run
+        self.unchanged_count = 0  # Pages found unchanged by an incremental crawl
+        self.not_modified_count = 0  # ...of which the server answered 304
         self.client: httpx.AsyncClient | None = None
-        self.entries: list[DictionaryEntry] = []
-        self.scraped_words: set[str] = set()
-        self.failed_words: set[str] = set()
-        self.checkpoint_path = Path(CHECKPOINT_FILE)
-        self.exporter = DictionaryExporter()
+        self.entries_count = 0  # Entries exported by this run
+        data_dir = Path(data_dir)
+        self.checkpoint_path = data_dir / Path(CHECKPOINT_FILE).name
+        self.reported_counts: dict[str, int] = {}
+        self.exporter = DictionaryExporter(str(data_dir), compression=compression, parquet=parquet)
+        # The JSONL is fsync'ed before any journal record that refers to it
+        self.journal = CheckpointJournal(data_dir / Path(JOURNAL_FILE).name,
+                                         before_sync=self.exporter.sync)
+        self.retries = RetryQueue()
+        self.dead_letters = DeadLetterFile(data_dir / Path(DEAD_LETTER_FILE).name)
+
+        self.metrics = Metrics()
+        self.stats_file = data_dir / METRICS_FILE
+        self.stats_interval = stats_interval
+        self.metrics_port = metrics_port
+        metrics = self.metrics
+        self.fetch_requests = metrics.counter('fetch_requests_total', "HTTP requests sent")
+        self.fetch_errors = metrics.counter(
+            'fetch_errors_total', "Requests that failed: transport errors and 4xx/5xx responses")
+        self.fetch_retries = metrics.counter('fetch_retries_total', "Failed requests scheduled for another attempt")
+        self.fetch_bytes = metrics.counter('fetch_bytes_total', "Response bytes received, as sent on the wire")
+        self.fetch_latency = metrics.histogram('fetch_latency_seconds', "Time from sending a request to its response")
+        self.rate_wait = metrics.histogram('rate_wait_seconds', "Time a request waited for the rate limiter")
+        self.page_bytes = metrics.histogram('page_bytes', "Decompressed size of fetched pages", BYTES_BUCKETS)
+        self.parse_time = metrics.histogram('parse_seconds', "Time a parser process spent on one page")
+        self.page_entries = metrics.histogram('entries_per_page', "Entries parsed from one page", COUNT_BUCKETS)
+        self.write_time = metrics.histogram('write_seconds', "Time appending one page's entries to the JSONL")
+        self.checkpoint_time = metrics.histogram('checkpoint_seconds', "Time making the journal durable")
+        self.compactions = metrics.counter('journal_compactions_total', "Journal compactions")
+        self.words_completed = metrics.counter('words_total', "Words through the pipeline, whatever the outcome")
+        self.dead_lettered = metrics.counter('dead_lettered_total', "Words given up on after their last attempt")
+        metrics.gauge('entries', "Entries exported by this run", lambda: self.entries_count)
+        metrics.gauge('words_covered', "Words skipped because another page listed them",
+                      lambda: len(self.covered_words))
+        metrics.gauge('pages_unchanged', "Pages unchanged since the incremental baseline",
+                      lambda: self.unchanged_count)
+        metrics.gauge('request_rate', "Current request rate limit (0 = unlimited)", lambda: self.rate.rate)
+        metrics.gauge('retry_queue_depth', "Failed requests waiting out their backoff", lambda: len(self.retries))
+
+    @property
+    def scraped_words(self) -> set[str]:
+        return self.journal.state.done
+
+    @property
+    def failed_words(self) -> set[str]:
+        return self.journal.state.failed
+
+    @property
+    def covered_words(self) -> set[str]:
+        return self.journal.state.covered
+
+    def is_covered(self, word: str) -> bool:
+        """Whether an earlier page already listed `word` as a headword.
+
+        An incremental crawl still re-checks words it fetched last time.
+        """
+        if not self.skip_covered or word not in self.journal.state.harvested:
+            return False
+        return self.baseline is None or self.word_url(word) not in self.baseline
 
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(
-            timeout=TIMEOUT,
-            headers={
-                "User-Agent": USER_AGENT,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            },
-            follow_redirects=True,
-        )
+        if self.parse_workers:
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+
+        if self.replay:
+            # Replay mode never touches the network
+            return self
+
+        # One pooled, keep-alive (HTTP/2 where available) client for all workers
+        self.client = create_client(max_connections=self.concurrency)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.client:
             await self.client.aclose()
-
-    async def delay(self):
-        """Polite delay between requests."""
-        delay = random.uniform(self.delay_min, self.delay_max)
-        await asyncio.sleep(delay)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
-    )
-    async def fetch(self, url: str) -> str:
-        """Fetch a URL with retry logic."""
-        await self.delay()
-        response = await self.client.get(url)
+        if self.cache is not None:
+            self.cache.close()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(cancel_futures=True)
+
+    async def fetch(self, url: str, conditional: bool = False) -> str | None:
+        """Fetch a URL once, or read it from the cache in replay mode.
+
+        With `conditional`, returns None when the page is unchanged since
+        the incremental baseline (a 304, or an identical body).
+        """
+        if self.replay:
+            html = self.cache.get(url)
+            if html is None:
+                raise CacheMiss(url)
+            return html
+
+        headers = None
+        previous = None
+        if conditional and self.baseline is not None:
+            headers = self.baseline.conditional_headers(url)
+            previous = self.baseline.index.get(url)
+
+        with self.rate_wait.time():
+            await self.rate.acquire(url)
+        self.fetch_requests.inc()
+        start = time.monotonic()
+        try:
+            response = await self.client.get(url, headers=headers)
+        except httpx.TransportError:
+            # Timeouts and connection failures count against the rate too
+            self.fetch_errors.inc()
+            self.rate.record_failure()
+            raise
+
+        latency = time.monotonic() - start
+        self.fetch_latency.observe(latency)
+        self.fetch_bytes.inc(response.num_bytes_downloaded)
+        if response.status_code >= 400:
+            self.fetch_errors.inc()
+        if response.status_code == 429 or response.status_code >= 500:
+            self.rate.record_failure(parse_retry_after(response.headers.get('Retry-After')))
+        else:
+            self.rate.record_success(latency)
+
+        if response.status_code == 304 and previous is not None:
+            self.not_modified_count += 1
+            return None
         response.raise_for_status()
+        self.page_bytes.observe(len(response.content))
+
+        if self.cache is not None:
+            digest = self.cache.put(url, response.text, etag=response.headers.get('ETag'),
+                                    last_modified=response.headers.get('Last-Modified'))
+            if conditional and digest == previous:
+                # The server ignored the validators, but the page is the same
+                return None
         return response.text
 
+    async def fetch_with_retries(self, url: str) -> str:
+        """Fetch a URL, backing off between attempts on retryable errors.
+
+        Only the calling task waits; the word pipeline retries through
+        self.retries instead.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await self.fetch(url)
+            except RETRYABLE_ERRORS:
+                if attempt >= self.retries.max_attempts:
+                    raise
+                self.fetch_retries.inc()
+                await asyncio.sleep(self.retries.backoff(attempt))
+                attempt += 1
+
+    def word_url(self, word: str) -> str:
+        """Search results URL for an index word."""
+        # URL encode the word for the request
+        encoded_word = quote(word, safe='')
+        return f"{self.base_url}/index.php?inputWord={encoded_word}"
+
     async def get_words_for_letter(self, letter: str) -> list[str]:
         """Get all words starting with a given letter."""
-        url = f"{BASE_URL}/index.php?l={letter}"
-        print(f"\nFetching index for letter '{letter.upper()}'...")
+        url = f"{self.base_url}/index.php?l={letter}"
 
         try:
-            html = await self.fetch(url)
-            words = parse_letter_index(html)
-            count = get_word_count_from_index(html)
-            print(f"  Found {len(words)} words (reported: {count})")
+            html = await self.fetch_with_retries(url)
+            words, count = await self.run_parser(parse_letter_index_page, html)
+            self.reported_counts[letter] = count
+            tqdm.write(f"Index for letter '{letter.upper()}': {len(words)} words (reported: {count})")
             return words
         except Exception as e:
-            print(f"  Error fetching letter {letter}: {e}")
+            tqdm.write(f"Error fetching letter {letter}: {e}")
             return []
 
-    async def scrape_word(self, word: str) -> list[DictionaryEntry]:
-        """Scrape a single word's dictionary entries."""
-        # URL encode the word for the request
-        encoded_word = quote(word, safe='')
-        url = f"{BASE_URL}/index.php?inputWord={encoded_word}"
-
+    def dead_letter(self, word: str, letter: str | None, error: Exception, attempts: int):
+        """Give up on a word and record it for --retry-failed."""
+        message = str(error).splitlines()[0] if str(error) else type(error).__name__
+        tqdm.write(f"  Error scraping word '{word}' after {attempts} attempt(s): {message}")
+        self.failed_words.add(word)
+        self.dead_lettered.inc()
+        self.dead_letters.append(word, letter, f"{type(error).__name__}: {message}", attempts)
+
+    async def run_parser(self, func, *args):
+        """Run a parser function in the parser pool (or inline without one)."""
+        if self.parse_pool is None:
+            result, seconds = timed_call(func, *args)
+        else:
+            loop = asyncio.get_running_loop()
+            result, seconds = await loop.run_in_executor(self.parse_pool, timed_call, func, *args)
+        self.parse_time.observe(seconds)
+        return result
+
+    async def parse_page(self, html: str, word: str, letter: str | None,
+                         attempts: int) -> list[DictionaryEntry]:
+        """Parse a word's search results page, dead-lettering the word if that fails."""
         try:
-            html = await self.fetch(url)
-            entries = parse_search_results(html, word)
-            return entries
+            return await self.run_parser(parse_search_results, html, word)
         except Exception as e:
-            print(f"  Error scraping word '{word}': {e}")
-            self.failed_words.add(word)
+            # Includes BrokenProcessPool, which fails every word still queued
+            self.dead_letter(word, letter, e, attempts)
             return []
 
-    def save_checkpoint(self, current_letter: str, current_word_idx: int):
-        """Save progress checkpoint."""
-        checkpoint = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "current_letter": current_letter,
-            "current_word_idx": current_word_idx,
-            "scraped_words": list(self.scraped_words),
-            "failed_words": list(self.failed_words),
-            "entries_count": len(self.entries),
-        }
-
-        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    def save_checkpoint(self, progress: CrawlProgress | None = None):
+        """Record the resume position (if tracked) and make the journal durable."""
+        if progress is not None:
+            self.journal.set_position(*progress.position())
+        with self.checkpoint_time.time():
+            if self.journal.needs_compaction():
+                self.compactions.inc()
+                self.journal.compact()
+            else:
+                self.journal.sync()
 
     def load_checkpoint(self) -> dict | None:
-        """Load progress from checkpoint file."""
-        if not self.checkpoint_path.exists():
+        """Load progress from the checkpoint journal."""
+        if self.journal.exists():
+            self.journal.replay()
+        elif self.checkpoint_path.exists():
+            # Migrate a checkpoint.json written by older versions
+            self.journal.state = read_legacy_checkpoint(self.checkpoint_path)
+            self.journal.compact()
+        else:
             return None
 
-        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
-            checkpoint = json.load(f)
-
-        self.scraped_words = set(checkpoint.get('scraped_words', []))
-        self.failed_words = set(checkpoint.get('failed_words', []))
-
-        # Load existing entries from JSONL
-        jsonl_path = self.exporter.output_dir / "dictionary.jsonl"
-        if jsonl_path.exists():
-            with open(jsonl_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        self.entries.append(DictionaryEntry(**data))
+        # Entries already exported stay on disk; finalize_export reads them from there
+        print(f"Resumed from checkpoint: {len(self.scraped_words)} words scraped, {len(self.failed_words)} failed")
 
-        print(f"Resumed from checkpoint: {len(self.scraped_words)} words scraped, {len(self.entries)} entries loaded")
+        checkpoint = {}
+        if self.journal.state.position:
+            checkpoint["current_letter"], checkpoint["current_word_idx"] = self.journal.state.position
         return checkpoint
 
+    def start_incremental(self, resume: bool):
+        """Pin the cache baseline that an incremental crawl compares pages against."""
+        baseline_path = self.cache.cache_dir / BASELINE_FILE
+        if resume and baseline_path.exists():
+            self.baseline = ResponseCache(self.cache.cache_dir, BASELINE_FILE)
+        else:
+            # A fresh refresh: nothing from an abandoned one carries over
+            (self.exporter.output_dir / DELTA_FILE).unlink(missing_ok=True)
+            self.baseline = self.cache.snapshot(BASELINE_FILE)
+        print(f"Incremental crawl against {len(self.baseline)} cached pages")
+
     async def scrape_letters(self, letters: list[str], resume: bool = False, test_mode: bool = False):
         """Scrape all words for the given letters."""
         start_letter_idx = 0
         start_word_idx = 0
 
-        if resume:
+        if self.incremental:
+            self.start_incremental(resume)
+
+        if not resume:
+            self.journal.reset()
+            self.dead_letters.clear()
+        else:
             checkpoint = self.load_checkpoint()
             if checkpoint:
                 # Find starting position
@@ -171,96 +454,406 @@ class DictionaryScraper:
                     start_letter_idx = letters.index(current_letter)
                     start_word_idx = checkpoint.get('current_word_idx', 0)
 
-        all_words_by_letter = {}
-
-        # First, collect all words for all letters
-        print("\n=== Phase 1: Collecting word lists ===")
-        for letter in letters:
-            words = await self.get_words_for_letter(letter)
-            all_words_by_letter[letter] = words
-
-        total_words = sum(len(words) for words in all_words_by_letter.values())
-        print(f"\nTotal words to scrape: {total_words}")
+        if self.incremental and self.skip_covered:
+            # Unchanged pages are not parsed, so start from what the last export listed
+            self.journal.state.harvested.update(self.exporter.iter_headwords(JSONL_FILE))
 
         if test_mode:
             print("\n[TEST MODE] Only scraping first 10 words per letter")
 
-        # Now scrape each word
-        print("\n=== Phase 2: Scraping entries ===")
-
-        for letter_idx, letter in enumerate(letters):
-            if letter_idx < start_letter_idx:
-                continue
-
-            words = all_words_by_letter[letter]
-
-            if test_mode:
-                words = words[:10]
-
-            # Determine starting word index
-            word_start = start_word_idx if letter_idx == start_letter_idx else 0
-
-            print(f"\n--- Letter {letter.upper()} ({len(words)} words) ---")
-
-            pbar = tqdm(enumerate(words[word_start:], start=word_start), total=len(words) - word_start, desc=f"Letter {letter.upper()}")
-
-            for word_idx, word in pbar:
-                # Skip already scraped words
-                if word in self.scraped_words:
+        progress = CrawlProgress(letters)
+        active_letters = letters[start_letter_idx:]
+        start_idx = {letter: 0 for letter in active_letters}
+        if active_letters:
+            start_idx[active_letters[0]] = start_word_idx
+        for letter in active_letters:
+            progress.open_letter(letter, start_idx[letter])
+
+        async def discover(letter: str, enqueue, words: list[str] | None = None,
+                           owned: range | None = None):
+            # Words are queued as soon as their index page is parsed, so
+            # scraping starts while other index pages are still in flight
+            if words is None:
+                words = await self.get_words_for_letter(letter)
+                if test_mode:
+                    words = words[:10]
+
+            for word_idx in range(start_idx[letter], len(words)):
+                if owned is not None and word_idx not in owned:
+                    continue
+                word = words[word_idx]
+                # Skip already scraped (or covered) words
+                if word not in self.scraped_words and word not in self.covered_words:
+                    await enqueue(letter, word_idx, word)
+
+            # A letter whose index failed keeps holding the resume position
+            if letter in self.reported_counts:
+                progress.close_letter(letter, start_idx[letter])
+
+        async def feed(enqueue):
+            if self.shard is None:
+                await asyncio.gather(*(discover(letter, enqueue) for letter in active_letters))
+                return
+
+            # Shards partition one global word sequence, so each needs every
+            # index page before it knows which words are its own
+            indexes = await asyncio.gather(*(self.get_words_for_letter(letter) for letter in letters))
+            missing = [letter for letter in letters if letter not in self.reported_counts]
+            if missing:
+                raise RuntimeError(f"Could not fetch the index for {', '.join(missing)}; "
+                                   f"shards would disagree on the partition")
+            words_by_letter = {letter: words[:10] if test_mode else words
+                               for letter, words in zip(letters, indexes)}
+            owned = shard_ranges({letter: len(words) for letter, words in words_by_letter.items()},
+                                 *self.shard)
+            print(f"Shard {self.shard[0]}/{self.shard[1]}: {sum(len(r) for r in owned.values())} "
+                  f"of {sum(len(words) for words in words_by_letter.values())} words")
+            for letter in active_letters:
+                await discover(letter, enqueue, words_by_letter[letter], owned[letter])
+
+        await self.run_pipeline(feed, progress)
+
+        print(f"Words reported by index pages: {sum(self.reported_counts.values())}")
+
+    async def retry_failed(self):
+        """Re-scrape only the words in the dead-letter file."""
+        records = self.dead_letters.read()
+        if not records:
+            print("No dead-lettered words to retry")
+            return
+
+        self.load_checkpoint()
+        print(f"\nRetrying {len(records)} dead-lettered words")
+
+        async def feed(enqueue):
+            for word_idx, record in enumerate(records):
+                await enqueue(record.get('letter'), word_idx, record['word'])
+
+        await self.run_pipeline(feed)
+
+        # Keep only the words that failed again. A word another retried page
+        # listed as a headword is covered, and so recovered too.
+        remaining = [r for r in self.dead_letters.read()
+                     if r['word'] not in self.scraped_words and r['word'] not in self.covered_words]
+        self.dead_letters.rewrite(remaining)
+        print(f"Recovered {len(records) - len(remaining)} words, {len(remaining)} still failing")
+
+    async def run_pipeline(self, feed, progress: CrawlProgress | None = None):
+        """Scrape the words that `feed` enqueues through fetch -> parse -> write.
+
+        `feed(enqueue)` calls `await enqueue(letter, word_idx, word)` for each
+        word. With a `progress` tracker the resume position is checkpointed.
+        """
+        parse_tasks = max(1, self.parse_workers)
+
+        print(f"\n=== Scraping entries ({self.concurrency} fetchers, {parse_tasks} parsers) ===")
+
+        # Bounded queues give backpressure: fetchers stall when parsing falls
+        # behind, and parsers stall when the writer falls behind.
+        word_queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=parse_tasks * 2)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=parse_tasks * 2)
+        pbar = tqdm(total=0, desc="Words")
+
+        # Where work piles up shows what the crawl is bound by
+        self.metrics.gauge('word_queue_depth', "Words waiting for a fetch worker", word_queue.qsize)
+        self.metrics.gauge('parse_queue_depth', "Fetched pages waiting for a parser", parse_queue.qsize)
+        self.metrics.gauge('result_queue_depth', "Parsed pages waiting for the writer", result_queue.qsize)
+        reporter = MetricsReporter(self.metrics, self.stats_file if self.stats_interval > 0 else None,
+                                   self.stats_interval, self.metrics_port)
+
+        # Words queued for fetching (including retries) that have not yet
+        # been handed to the parse stage
+        fetching = 0
+        fetch_idle = asyncio.Event()
+        fetch_idle.set()
+
+        async def enqueue(letter: str | None, word_idx: int, word: str):
+            nonlocal fetching
+            fetching += 1
+            fetch_idle.clear()
+            pbar.total += 1
+            if progress:
+                progress.submit(letter, word_idx)
+            await word_queue.put((letter, word_idx, word, 1))
+
+        def fetched():
+            nonlocal fetching
+            fetching -= 1
+            if fetching == 0:
+                fetch_idle.set()
+
+        async def produce():
+            await feed(enqueue)
+            # Retries re-enter the word queue, so wait for them to settle
+            await fetch_idle.wait()
+            for _ in range(self.concurrency):
+                await word_queue.put(None)
+
+        async def requeue_retries():
+            while True:
+                item = await self.retries.get()
+                await word_queue.put(item)
+
+        async def fetch_worker():
+            while True:
+                item = await word_queue.get()
+                if item is None:
+                    break
+                letter, word_idx, word, attempt = item
+
+                if self.is_covered(word):
+                    fetched()
+                    await result_queue.put((letter, word_idx, word, COVERED))
                     continue
 
-                pbar.set_postfix(word=word[:20])
-
-                entries = await self.scrape_word(word)
-
-                if entries:
-                    self.entries.extend(entries)
-                    self.scraped_words.add(word)
-
-                    # Save incrementally
-                    for entry in entries:
-                        self.exporter.export_incremental_jsonl(entry)
-
-                # Save checkpoint every 50 words
-                if (word_idx + 1) % 50 == 0:
-                    self.save_checkpoint(letter, word_idx)
-
-            # Save checkpoint after each letter
-            self.save_checkpoint(letter, len(words))
+                try:
+                    html = await self.fetch(self.word_url(word), conditional=self.incremental)
+                except RETRYABLE_ERRORS as e:
+                    retry_after = None
+                    if isinstance(e, httpx.HTTPStatusError):
+                        retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+                    if self.retries.schedule((letter, word_idx, word, attempt + 1), attempt, retry_after):
+                        self.fetch_retries.inc()
+                        continue
+                    html = None
+                    self.dead_letter(word, letter, e, attempt)
+                except Exception as e:
+                    html = None
+                    self.dead_letter(word, letter, e, attempt)
+                else:
+                    if html is None:
+                        # Unchanged since the last crawl: nothing to parse
+                        fetched()
+                        await result_queue.put((letter, word_idx, word, UNCHANGED))
+                        continue
+
+                fetched()
+                await parse_queue.put((letter, word_idx, word, html, attempt))
+
+        async def fetch_stage():
+            await asyncio.gather(*(fetch_worker() for _ in range(self.concurrency)))
+            for _ in range(parse_tasks):
+                await parse_queue.put(None)
+
+        async def parse_worker():
+            while True:
+                item = await parse_queue.get()
+                if item is None:
+                    break
+                letter, word_idx, word, html, attempt = item
+                entries = await self.parse_page(html, word, letter, attempt) if html is not None else []
+                self.page_entries.observe(len(entries))
+                await result_queue.put((letter, word_idx, word, entries))
+
+        async def parse_stage():
+            await asyncio.gather(*(parse_worker() for _ in range(parse_tasks)))
+            await result_queue.put(None)
+
+        output_file = DELTA_FILE if self.incremental else JSONL_FILE
+
+        async def write_results():
+            # Single writer: words finish out of order, but JSONL appends and
+            # checkpoints only ever happen here, one word at a time.
+            done = 0
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                letter, word_idx, word, entries = item
+                done += 1
+                self.words_completed.inc()
+
+                if entries == COVERED:
+                    self.journal.mark_covered(word)
+                elif entries == UNCHANGED:
+                    # Its entries were exported by an earlier crawl
+                    self.unchanged_count += 1
+                    self.journal.mark_done(word)
+                elif entries:
+                    self.scraped_count += 1
+                    self.entries_count += len(entries)
+
+                    # Save incrementally before marking the word as scraped
+                    with self.write_time.time():
+                        for entry in entries:
+                            self.exporter.export_incremental_jsonl(entry, output_file)
+
+                    if self.incremental:
+                        self.journal.mark_changed(word)
+                    self.journal.mark_done(word, sorted({entry.headword for entry in entries}))
+                elif word in self.failed_words:
+                    self.journal.mark_failed(word)
+                else:
+                    # Parsed, but the page lists no entries
+                    self.scraped_count += 1
+                    if self.incremental:
+                        # The page changed and no longer lists any entries
+                        self.journal.mark_changed(word)
+                        self.journal.mark_done(word)
+
+                if progress:
+                    progress.complete(letter, word_idx)
+                pbar.update(1)
+                pbar.set_postfix(word=word[:20], retrying=len(self.retries))
+
+                # Save checkpoint every N words
+                if done % CHECKPOINT_EVERY == 0:
+                    self.save_checkpoint(progress)
+
+        stages = [
+            asyncio.create_task(produce()),
+            asyncio.create_task(fetch_stage()),
+            asyncio.create_task(parse_stage()),
+        ]
+        retry_task = asyncio.create_task(requeue_retries())
+        await reporter.start()
+        try:
+            await asyncio.gather(write_results(), *stages)
+        finally:
+            for task in [*stages, retry_task]:
+                task.cancel()
+            pbar.close()
+            self.save_checkpoint(progress)
+            self.journal.close()
+            self.exporter.close()
+            await reporter.stop()
 
         print(f"\n=== Scraping complete ===")
-        print(f"Total entries: {len(self.entries)}")
+        print(f"Words scraped: {self.scraped_count} of {pbar.n} processed")
+        print(self.rate.report())
+        print(f"Total entries: {self.entries_count}")
+        if self.skip_covered:
+            print(f"Covered words (not fetched): {len(self.covered_words)}")
+        if self.incremental:
+            print(f"Unchanged pages: {self.unchanged_count} ({self.not_modified_count} answered 304 Not Modified)")
+            print(f"Changed pages: {len(self.journal.state.changed)}")
         print(f"Failed words: {len(self.failed_words)}")
 
         if self.failed_words:
             print(f"Failed words: {list(self.failed_words)[:20]}...")
+            print(f"Dead-lettered words are listed in {self.dead_letters.path}")
 
-    def finalize_export(self):
-        """Generate final export files from collected entries."""
-        print("\n=== Generating final exports ===")
-
-        # Deduplicate entries by headword + source
-        seen = set()
-        unique_entries = []
-        for entry in self.entries:
-            key = (entry.headword, entry.source or '')
-            if key not in seen:
-                seen.add(key)
-                unique_entries.append(entry)
-
-        print(f"Unique entries after deduplication: {len(unique_entries)}")
+    def merge_delta(self, jsonl_path: Path, delta_path: Path, duplicates_path: Path) -> int:
+        """Replace the entries of changed queries with those of the incremental crawl.
 
-        # Sort by headword
-        unique_entries.sort(key=lambda e: e.headword.lower())
+        Duplicates dropped by the last export take part too: when a changed
+        page no longer lists an entry, another page's copy of it survives.
+        """
+        changed_urls = {source_url(word) for word in self.journal.state.changed}
+        kept_path = jsonl_path.with_suffix('.kept.tmp')
+        replaced = 0
 
-        # Export all formats
-        self.exporter.export_json(unique_entries)
-        self.exporter.export_csv(unique_entries)
+        with open(kept_path, 'w', encoding='utf-8') as out:
+            for path in (jsonl_path, duplicates_path):
+                if not path.exists():
+                    continue
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        if json.loads(line).get('source_url') in changed_urls:
+                            replaced += 1
+                        else:
+                            out.write(line)
+
+        # Which of a set of duplicates is kept only depends on their source_url,
+        # as in a full crawl's export
+        sources = [delta_path, kept_path] if delta_path.exists() else [kept_path]
+        unique_count = sort_dedupe_jsonl(sources, jsonl_path, duplicates=duplicates_path)
+        kept_path.unlink()
+        delta_path.unlink(missing_ok=True)
+        (self.cache.cache_dir / BASELINE_FILE).unlink(missing_ok=True)
+
+        print(f"Replaced {replaced} entries from {len(changed_urls)} changed pages")
+        return unique_count
 
-        # JSONL is already written incrementally, but rewrite with deduplicated/sorted data
-        self.exporter.export_jsonl(unique_entries)
+    def finalize_export(self):
+        """Generate final export files from the incrementally written JSONL."""
+        print("\n=== Generating final exports ===")
 
-        print("\nExport complete!")
+        jsonl_path = self.exporter.output_dir / JSONL_FILE
+        delta_path = self.exporter.output_dir / DELTA_FILE
+        duplicates_path = self.exporter.output_dir / DUPLICATES_FILE
+        if self.incremental:
+            unique_count = self.merge_delta(jsonl_path, delta_path, duplicates_path)
+        elif not jsonl_path.exists():
+            print("No entries to export")
+            return
+        else:
+            # Sort by headword and deduplicate by headword + source, streaming
+            # from disk so memory stays flat however large the dictionary is
+            unique_count = sort_dedupe_jsonl([jsonl_path], jsonl_path, duplicates=duplicates_path)
+
+        print(f"Unique entries after deduplication: {unique_count}")
+        print(f"Exported {unique_count} entries to {jsonl_path}")
+
+        if self.shard is not None:
+            # A shard only sorts its part; --merge-shards writes the other formats
+            print(f"\nShard {self.shard[0]}/{self.shard[1]} complete; merge with --merge-shards")
+            return
+
+        export_formats(self.exporter, unique_count)
+
+
+def timed_call(func, *args):
+    """Return (func(*args), seconds it took); runs inside the parser processes."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def export_formats(exporter: DictionaryExporter, unique_count: int):
+    """Export JSON, CSV and the extra formats from the sorted, deduplicated JSONL, in one pass over it."""
+    exporter.export_all(exporter.iter_jsonl(), total_entries=unique_count,
+                        formats=('json', 'csv') + exporter.extra_formats)
+
+    print("\nExport complete!")
+
+
+def merge_shards(shards_dir: str = SHARDS_DIR, data_dir: str = DATA_DIR,
+                 compression: tuple[str, ...] = (), parquet: bool = False):
+    """Combine the outputs of a finished sharded crawl into `data_dir`."""
+    shards = find_shards(shards_dir)
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    print(f"\n=== Merging {len(shards)} shards from {shards_dir} ===")
+
+    # Each shard's JSONL is already sorted and deduplicated; shard duplicates
+    # are appended afterwards so incremental merges still see every copy
+    jsonl_path = data_dir / JSONL_FILE
+    duplicates_path = data_dir / DUPLICATES_FILE
+    sources = [shard / JSONL_FILE for shard in shards if (shard / JSONL_FILE).exists()]
+    unique_count = merge_sorted_jsonl(sources, jsonl_path, duplicates=duplicates_path)
+    with open(duplicates_path, 'a', encoding='utf-8') as out:
+        for shard in shards:
+            if (shard / DUPLICATES_FILE).exists():
+                with open(shard / DUPLICATES_FILE, 'r', encoding='utf-8') as f:
+                    out.writelines(f)
+
+    # One journal and dead-letter file for verify_completeness.py and --retry-failed
+    state = JournalState()
+    dead_letters = []
+    for shard in shards:
+        shard_state = CheckpointJournal(shard / Path(JOURNAL_FILE).name).replay()
+        state.done |= shard_state.done
+        state.failed |= shard_state.failed
+        state.covered |= shard_state.covered
+        state.harvested |= shard_state.harvested
+        dead_letters.extend(DeadLetterFile(shard / Path(DEAD_LETTER_FILE).name).read())
+    state.failed -= state.done
+    state.covered -= state.done
+    journal = CheckpointJournal(data_dir / Path(JOURNAL_FILE).name)
+    journal.state = state
+    journal.compact()
+    DeadLetterFile(data_dir / Path(DEAD_LETTER_FILE).name).rewrite(dead_letters)
+
+    print(f"Merged {len(state.done)} scraped words, {len(state.covered)} covered, "
+          f"{len(state.failed)} failed")
+    print(f"Unique entries after deduplication: {unique_count}")
+    print(f"Exported {unique_count} entries to {jsonl_path}")
+
+    export_formats(DictionaryExporter(str(data_dir), compression=compression, parquet=parquet), unique_count)
 
 
 async def main():
@@ -269,28 +862,112 @@ async def main():
                         help='Letters to scrape (default: all)')
     parser.add_argument('--resume', action='store_true',
                         help='Resume from last checkpoint')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Only re-scrape words from the dead-letter file')
     parser.add_argument('--test', action='store_true',
                         help='Test mode: only scrape first 10 words per letter')
-    parser.add_argument('--delay-min', type=float, default=REQUEST_DELAY_MIN,
-                        help=f'Minimum delay between requests (default: {REQUEST_DELAY_MIN})')
-    parser.add_argument('--delay-max', type=float, default=REQUEST_DELAY_MAX,
-                        help=f'Maximum delay between requests (default: {REQUEST_DELAY_MAX})')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-crawl with conditional requests; re-export only changed pages')
+    parser.add_argument('--no-skip-covered', action='store_true',
+                        help='Fetch index words even when an earlier page already listed them')
+    parser.add_argument('--shard', metavar='I/N',
+                        help='Crawl only shard I of N (1-based) into data/shards/')
+    parser.add_argument('--merge-shards', action='store_true',
+                        help='Merge the shards in data/shards/ into the final exports and exit')
+    parser.add_argument('--replay', action='store_true',
+                        help='Read pages only from the response cache (no network)')
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help=f'Response cache directory (default: {CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not store fetched pages in the response cache')
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENT,
+                        help=f'Number of concurrent fetch workers (default: {MAX_CONCURRENT})')
+    parser.add_argument('--parse-workers', type=int, default=PARSE_WORKERS,
+                        help=f'Parser processes, 0 to parse on the event loop (default: {PARSE_WORKERS})')
+    parser.add_argument('--rate', type=float, default=REQUESTS_PER_SECOND,
+                        help=f'Requests per second shared by all workers (default: {REQUESTS_PER_SECOND})')
+    parser.add_argument('--min-rate', type=float, default=MIN_REQUESTS_PER_SECOND,
+                        help=f'Lowest adaptive request rate (default: {MIN_REQUESTS_PER_SECOND})')
+    parser.add_argument('--max-rate', type=float, default=MAX_REQUESTS_PER_SECOND,
+                        help=f'Highest adaptive request rate (default: {MAX_REQUESTS_PER_SECOND})')
+    parser.add_argument('--fixed-rate', action='store_true',
+                        help='Keep --rate fixed instead of adapting it to server behaviour')
+    parser.add_argument('--burst', type=int, default=REQUEST_BURST,
+                        help=f'Maximum burst of back-to-back requests (default: {REQUEST_BURST})')
+    parser.add_argument('--stats-interval', type=float, default=STATS_INTERVAL,
+                        help=f'Seconds between {METRICS_FILE} snapshots, 0 to disable (default: {STATS_INTERVAL})')
+    parser.add_argument('--metrics-port', type=int,
+                        help='Serve Prometheus metrics on this local port while crawling')
+    parser.add_argument('--compress', nargs='+', choices=CODECS, default=[],
+                        help='Also export dictionary.jsonl compressed in seekable frames (frames.py)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also export dictionary.parquet for columnar analytics (columnar.py)')
 
     args = parser.parse_args()
 
+    try:
+        for codec in args.compress:
+            check_codec(codec)
+        if args.parquet:
+            check_parquet()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.shard:
+        try:
+            args.shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.merge_shards:
+        try:
+            merge_shards(compression=tuple(args.compress), parquet=args.parquet)
+        except ValueError as e:
+            parser.error(str(e))
+        return
+
     letters = [l.lower() for l in args.letters]
 
     print("=" * 60)
     print("Dixionline.net Dictionary Scraper")
     print("=" * 60)
     print(f"Letters to scrape: {', '.join(l.upper() for l in letters)}")
-    print(f"Request delay: {args.delay_min}-{args.delay_max}s")
+    print(f"Concurrency: {args.concurrency} workers, {args.rate} req/s (burst {args.burst})")
+    if not args.fixed_rate:
+        print(f"Adaptive rate: {args.min_rate}-{args.max_rate} req/s")
+    print(f"Parser processes: {args.parse_workers}")
     print(f"Resume mode: {args.resume}")
     print(f"Test mode: {args.test}")
+    print(f"Replay mode: {args.replay}")
+    print(f"Incremental mode: {args.incremental}")
+    if args.shard:
+        print(f"Shard: {args.shard[0]}/{args.shard[1]}")
     print("=" * 60)
 
-    async with DictionaryScraper(delay_min=args.delay_min, delay_max=args.delay_max) as scraper:
-        await scraper.scrape_letters(letters, resume=args.resume, test_mode=args.test)
+    if args.replay and args.no_cache:
+        parser.error("--replay cannot be combined with --no-cache")
+    if args.incremental and (args.replay or args.no_cache or args.retry_failed):
+        parser.error("--incremental cannot be combined with --replay, --no-cache or --retry-failed")
+    if args.incremental and args.shard:
+        parser.error("--incremental cannot be combined with --shard")
+
+    data_dir = str(shard_dir(*args.shard)) if args.shard else DATA_DIR
+
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    async with DictionaryScraper(concurrency=args.concurrency, rate=args.rate, burst=args.burst,
+                                 cache_dir=cache_dir, replay=args.replay,
+                                 parse_workers=args.parse_workers, adaptive=not args.fixed_rate,
+                                 min_rate=args.min_rate, max_rate=args.max_rate,
+                                 incremental=args.incremental,
+                                 skip_covered=not args.no_skip_covered, data_dir=data_dir,
+                                 shard=args.shard, stats_interval=args.stats_interval,
+                                 metrics_port=args.metrics_port,
+                                 compression=tuple(args.compress), parquet=args.parquet) as scraper:
+        if args.retry_failed:
+            await scraper.retry_failed()
+        else:
+            await scraper.scrape_letters(letters, resume=args.resume, test_mode=args.test)
         scraper.finalize_export()
 
 
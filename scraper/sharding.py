@@ -0,0 +1,80 @@
+"""Deterministic partitioning of a crawl across shards.
+
+Every shard fetches all letter indexes and lays their words out in one
+global sequence (letters in order, index order within a letter). The
+sequence is cut into N contiguous parts of equal size, so shards agree on
+the partition without talking to each other, big letters are split across
+shards instead of landing on one, and neighbouring words (which tend to
+cover each other's headwords) stay together.
+
+Each shard crawls into its own directory under data/shards/; a merge step
+combines them into the usual data/ outputs.
+"""
+
+import re
+from pathlib import Path
+
+
+SHARDS_DIR = "../data/shards"
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse an "i/N" shard spec (1-based) into (i, N)."""
+    match = re.fullmatch(r'\s*(\d+)\s*/\s*(\d+)\s*', spec)
+    if not match:
+        raise ValueError(f"Invalid shard {spec!r}, expected i/N such as 2/4")
+    shard, shards = int(match.group(1)), int(match.group(2))
+    if not 1 <= shard <= shards:
+        raise ValueError(f"Invalid shard {spec!r}: i must be between 1 and N")
+    return shard, shards
+
+
+def shard_ranges(counts: dict[str, int], shard: int, shards: int) -> dict[str, range]:
+    """Word index range of each letter owned by `shard` of `shards`.
+
+    `counts` maps letters, in crawl order, to their number of index words.
+    """
+    total = sum(counts.values())
+    start = (shard - 1) * total // shards
+    end = shard * total // shards
+
+    ranges = {}
+    offset = 0
+    for letter, count in counts.items():
+        lo = max(start, offset)
+        hi = min(end, offset + count)
+        ranges[letter] = range(lo - offset, hi - offset) if lo < hi else range(0)
+        offset += count
+    return ranges
+
+
+def shard_dir(shard: int, shards: int, shards_dir: str | Path = SHARDS_DIR) -> Path:
+    """Data directory of one shard."""
+    return Path(shards_dir) / f"shard-{shard}-of-{shards}"
+
+
+def find_shards(shards_dir: str | Path = SHARDS_DIR) -> list[Path]:
+    """Return the shard directories of one complete sharded crawl, in order.
+
+    Raises ValueError if shards of different crawls are mixed or some are
+    missing.
+    """
+    found: dict[int, dict[int, Path]] = {}
+    shards_dir = Path(shards_dir)
+    if shards_dir.exists():
+        for path in shards_dir.iterdir():
+            match = re.fullmatch(r'shard-(\d+)-of-(\d+)', path.name)
+            if match and path.is_dir():
+                found.setdefault(int(match.group(2)), {})[int(match.group(1))] = path
+
+    if not found:
+        raise ValueError(f"No shard directories in {shards_dir}")
+    if len(found) > 1:
+        raise ValueError(f"Shards of different crawls in {shards_dir}: "
+                         f"{', '.join(f'{n} shards' for n in sorted(found))}")
+
+    shards, paths = found.popitem()
+    missing = [i for i in range(1, shards + 1) if i not in paths]
+    if missing:
+        raise ValueError(f"Missing shards {', '.join(f'{i}/{shards}' for i in missing)} in {shards_dir}")
+    return [paths[i] for i in range(1, shards + 1)]
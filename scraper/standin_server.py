@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for dixionline.net, for load-testing the scraper.
+
+Serves the two page types the scraper requests:
+
+    /index.php?l=<letter>         letter index with word links
+    /index.php?inputWord=<word>   search results with dictionary articles
+
+Pages are generated deterministically from a seed, or served from a
+response cache recorded by an earlier crawl. Latency, jitter, error
+injection, server-side rate limiting and gzip transfer compression are
+configurable, so the fetch layer can be measured without touching the
+real site.
+
+Responses carry an ETag and honour If-None-Match with 304. --revision N
+changes the articles of a --change-rate fraction of headwords per revision,
+to exercise incremental re-crawls.
+
+GET /__stats returns the server's request, connection and byte counters.
+
+Usage:
+    python standin_server.py                       # Synthetic site on port 8765
+    python standin_server.py --words-per-letter 500 --latency 0.05 --jitter 0.02
+    python standin_server.py --error-rate 0.02 --server-rate 20
+    python standin_server.py --revision 1 --change-rate 0.05   # Some pages changed
+    python standin_server.py --from-cache ../data/cache   # Replay recorded pages
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from cache import CACHE_DIR, ResponseCache
+
+
+DEFAULT_PORT = 8765
+WORDS_PER_LETTER = 200
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+SITE_URL = "https://www.dixionline.net"  # Host of URLs in a recorded cache
+
+SOURCES = [
+    "Dictsiunar a limbãljei armãneascã (Tache Papahagi)",
+    "Dictsiunar armãnescu (T.Cunia)",
+    "Dictsiunar armãn-rumân-frãntsescu-anglicescu (Mariana Bara)",
+]
+PARTS_OF_SPEECH = ['sf', 'sm', 'sn', 'vb', 'adg', 'adv', 'prep', 'conj', 'interj', 'pron']
+SYLLABLES = ['a', 'ã', 'ba', 'ca', 'dzã', 'fi', 'gu', 'lji', 'ma', 'nu', 'pi', 'ri',
+             'sa', 'shi', 'ta', 'tsã', 'u', 'vi', 'zi', 'ãr', 'ea', 'oa']
+TEXT_WORDS = ['om', 'casã', 'lucru', 'cari', 'easti', 'tu', 'di', 'cu', 'mari', 'njic',
+              'bun', 'arãu', 'apã', 'foc', 'loc', 'dzuã', 'noapti', 'cãljuri', 'featã']
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="rup">
+<head>
+<meta charset="utf-8">
+<title>Dixionline - {title}</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+<header><nav>{nav}</nav></header>
+<div id="container">
+<div id="my_text">{intro}</div>
+{body}
+</div>
+<footer><p>dixionline.net - Dictsiunar armãnescu</p></footer>
+</body>
+</html>
+"""
+
+
+class SyntheticSite:
+    """Deterministic dixionline-style pages generated from a seed."""
+
+    def __init__(self, words_per_letter: int = WORDS_PER_LETTER, seed: int = 0,
+                 letters: str = LETTERS, revision: int = 0, change_rate: float = 0.1):
+        self.seed = seed
+        self.revision = revision
+        self.change_rate = change_rate
+        self.letters = letters
+        self.words: dict[str, list[str]] = {}
+        for letter in letters:
+            rng = random.Random(f"{seed}:{letter}")
+            words = []
+            seen = set()
+            while len(words) < words_per_letter:
+                word = letter + ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+                if word in seen:
+                    word = f"{word}{len(words)}"
+                seen.add(word)
+                words.append(word)
+            self.words[letter] = sorted(words)
+        self.nav = ''.join(f'<a href="index.php?l={l}">{l.upper()}</a> ' for l in letters)
+
+    def _page(self, title: str, intro: str, body: str) -> str:
+        return PAGE_TEMPLATE.format(title=escape(title), nav=self.nav, intro=intro, body=body)
+
+    def index_page(self, letter: str) -> str | None:
+        words = self.words.get(letter)
+        if words is None:
+            return None
+        links = ' '.join(
+            f'<a href="index.php?inputWord={escape(word)}">{escape(word)}</a>'
+            for word in words
+        )
+        intro = f"Zboarã cari ahurhescu cu '{letter.upper()}' : {len(words)}"
+        return self._page(letter.upper(), intro, f'<div id="my_text">{links}</div>')
+
+    def _text(self, rng: random.Random, n: int) -> str:
+        return ' '.join(rng.choice(TEXT_WORDS) for _ in range(n))
+
+    def _article(self, rng: random.Random, headword: str, source: str) -> str:
+        pos = rng.choice(PARTS_OF_SPEECH)
+        related = rng.choice(self.words[headword[0]]) if headword[0] in self.words else headword
+        examples = '; '.join(f"{self._text(rng, 4)} ({self._text(rng, 3)})" for _ in range(rng.randint(1, 3)))
+        db_id = rng.randint(1, 99999)
+        return (
+            f'<article class="article">'
+            f'<h2><a href="index.php?inputWord={escape(headword)}">{escape(headword)}</a></h2>'
+            f'<p><span class="highlight_pvorb">{escape(headword)}</span> '
+            f'({escape(headword)}-{rng.choice(SYLLABLES)}) {pos} {headword}i, {headword}li – '
+            f'{self._text(rng, rng.randint(5, 15))} '
+            f'<span class="highlight_similar">ex:</span> {examples} '
+            f'<span class="highlight_ex">expr: {self._text(rng, 3)}</span>; {self._text(rng, 2)} '
+            f'<span class="highlight_eng">§</span> {escape(related)} (vedz) '
+            f'{{ro: {self._text(rng, 2)}}} {{fr: {self._text(rng, 2)}}} {{en: {self._text(rng, 2)}}} '
+            f'<a class="more" href="#">{source} Data DB:{db_id}>2019-05-01 10:00:00 »</a>'
+            f'</p></article>'
+        )
+
+    def headword_revision(self, headword: str) -> int:
+        """The latest site revision that changed the articles for `headword`."""
+        for revision in range(self.revision, 0, -1):
+            if random.Random(f"{self.seed}:{headword}:r{revision}").random() < self.change_rate:
+                return revision
+        return 0
+
+    def articles(self, headword: str) -> list[str]:
+        """All articles for `headword`, one per source that defines it."""
+        revision = self.headword_revision(headword)
+        rng = random.Random(f"{self.seed}:{headword}" + (f":{revision}" if revision else ""))
+        sources = rng.sample(SOURCES, rng.randint(1, 2))
+        return [self._article(rng, headword, source) for source in sources]
+
+    def search_page(self, word: str) -> str:
+        rng = random.Random(f"{self.seed}:{word}:matches")
+        # A search also matches a few neighbouring headwords, like the real site,
+        # and always lists every article of a matched headword
+        headwords = [word]
+        letter_words = self.words.get(word[:1], [])
+        for _ in range(rng.randint(0, 2)):
+            if letter_words:
+                headwords.append(rng.choice(letter_words))
+        articles = '\n'.join(article for headword in headwords for article in self.articles(headword))
+        intro = f"Rezultate ti: {escape(word)}"
+        return self._page(word, intro, articles)
+
+
+class RecordedSite:
+    """Pages replayed from a response cache recorded by a real crawl."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, site_url: str = SITE_URL):
+        self.cache = ResponseCache(cache_dir)
+        self.site_url = site_url.rstrip('/')
+
+    def lookup(self, path: str) -> str | None:
+        return self.cache.get(self.site_url + path)
+
+
+class ServerLimits:
+    """Latency, error and rate-limit behaviour shared by all handler threads."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate: float = 0.0, retry_after: int = 1, seed: int = 0, compress: bool = True,
+                 validators: bool = True):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate = rate
+        self.retry_after = retry_after
+        self.compress = compress
+        self.validators = validators
+        self.rng = random.Random(seed)
+        self.tokens = max(1.0, rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def delay(self) -> float:
+        with self.lock:
+            jitter = self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        return max(0.0, self.latency + jitter)
+
+    def should_fail(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self.lock:
+            return self.rng.random() < self.error_rate
+
+    def allow(self) -> bool:
+        """Token bucket over all clients; False means answer 429."""
+        if self.rate <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(max(1.0, self.rate), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server for the stand-in site."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], site, limits: ServerLimits):
+        super().__init__(address, StandInHandler)
+        self.site = site
+        self.limits = limits
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "connections": 0, "bytes_sent": 0, "errors": 0,
+                      "throttled": 0, "not_modified": 0}
+
+    def count(self, key: str, amount: int = 1):
+        with self.stats_lock:
+            self.stats[key] += amount
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real site
+    server: StandInServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+
+    def send_body(self, status: int, body: str, headers: dict | None = None):
+        data = body.encode('utf-8')
+        headers = {'Content-Type': 'text/html; charset=utf-8', **(headers or {})}
+        if self.server.limits.compress and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data, compresslevel=6)
+            headers['Content-Encoding'] = 'gzip'
+        headers['Vary'] = 'Accept-Encoding'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.count("bytes_sent", len(data))
+
+    def page(self) -> str | None:
+        site = self.server.site
+        if isinstance(site, RecordedSite):
+            return site.lookup(self.path)
+
+        query = parse_qs(urlsplit(self.path).query)
+        if 'l' in query:
+            return site.index_page(query['l'][0])
+        if 'inputWord' in query:
+            return site.search_page(query['inputWord'][0])
+        return None
+
+    def do_GET(self):
+        server = self.server
+        limits = server.limits
+        if self.path == '/__stats':
+            with server.stats_lock:
+                stats = dict(server.stats)
+            self.send_body(200, json.dumps(stats), {"Content-Type": "application/json"})
+            return
+        server.count("requests")
+
+        if not limits.allow():
+            server.count("throttled")
+            self.send_body(429, "Too Many Requests", {"Retry-After": str(limits.retry_after)})
+            return
+
+        time.sleep(limits.delay())
+
+        if limits.should_fail():
+            server.count("errors")
+            self.send_body(503, "Service Unavailable")
+            return
+
+        body = self.page()
+        if body is None:
+            self.send_body(404, "Not Found")
+            return
+
+        if not limits.validators:
+            self.send_body(200, body)
+            return
+
+        etag = '"%s"' % hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]
+        if self.headers.get('If-None-Match') == etag:
+            server.count("not_modified")
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_body(200, body, {'ETag': etag})
+
+
+def start_server(site, limits: ServerLimits, host: str = '127.0.0.1', port: int = 0) -> StandInServer:
+    """Start a stand-in server on a background thread; port 0 picks a free one."""
+    server = StandInServer((host, port), site, limits)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    """Options describing the stand-in site, shared with benchmark.py."""
+    parser.add_argument('--words-per-letter', type=int, default=WORDS_PER_LETTER,
+                        help=f'Synthetic words per letter index (default: {WORDS_PER_LETTER})')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for synthetic pages and injected errors (default: 0)')
+    parser.add_argument('--from-cache', metavar='CACHE_DIR',
+                        help='Serve pages recorded in a response cache instead of synthetic ones')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Server-side delay per request in seconds (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Uniform +/- jitter added to the latency (default: 0)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with 503 (default: 0)')
+    parser.add_argument('--server-rate', type=float, default=0.0,
+                        help='Requests per second before answering 429, 0 = unlimited (default: 0)')
+    parser.add_argument('--retry-after', type=int, default=1,
+                        help='Retry-After seconds sent with 429 responses (default: 1)')
+    parser.add_argument('--revision', type=int, default=0,
+                        help='Site revision; each one changes --change-rate of the pages (default: 0)')
+    parser.add_argument('--change-rate', type=float, default=0.1,
+                        help='Fraction of headwords changed per revision (default: 0.1)')
+    parser.add_argument('--no-validators', action='store_true',
+                        help='Send no ETag and ignore If-None-Match, like servers without caching')
+    parser.add_argument('--no-compression', action='store_true',
+                        help='Send bodies uncompressed even when the client accepts gzip')
+
+
+def server_argv(args: argparse.Namespace) -> list[str]:
+    """Command-line options that recreate the site described by `args`."""
+    argv = ['--words-per-letter', str(args.words_per_letter), '--seed', str(args.seed),
+            '--latency', str(args.latency), '--jitter', str(args.jitter),
+            '--error-rate', str(args.error_rate), '--server-rate', str(args.server_rate),
+            '--retry-after', str(args.retry_after),
+            '--revision', str(args.revision), '--change-rate', str(args.change_rate)]
+    if args.no_compression:
+        argv.append('--no-compression')
+    if args.no_validators:
+        argv.append('--no-validators')
+    if args.from_cache:
+        argv += ['--from-cache', args.from_cache]
+    return argv
+
+
+def site_from_args(args: argparse.Namespace):
+    if args.from_cache:
+        return RecordedSite(args.from_cache)
+    return SyntheticSite(words_per_letter=args.words_per_letter, seed=args.seed,
+                         revision=args.revision, change_rate=args.change_rate)
+
+
+def limits_from_args(args: argparse.Namespace) -> ServerLimits:
+    return ServerLimits(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        rate=args.server_rate, retry_after=args.retry_after, seed=args.seed,
+                        compress=not args.no_compression, validators=not args.no_validators)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for dixionline.net")
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT,
+                        help=f'Port to listen on, 0 for any free port (default: {DEFAULT_PORT})')
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    server = StandInServer((args.host, args.port), site_from_args(args), limits_from_args(args))
+    print(f"Serving stand-in site on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Shared HTTP client setup for every script that talks to dixionline.net.
+
+One factory keeps the transport consistent: HTTP/2 when the h2 package is
+installed (requests multiplex over a single connection), explicit pool
+limits, keep-alive so connections are reused across requests instead of
+paying TCP/TLS setup each time, and compressed transfer encodings.
+"""
+
+import httpx
+
+
+TIMEOUT = 30.0
+CONNECT_TIMEOUT = 10.0
+MAX_CONNECTIONS = 8  # Upper bound on open connections (HTTP/1.1 needs one per in-flight request)
+KEEPALIVE_EXPIRY = 60.0  # Seconds an idle connection is kept for reuse
+USER_AGENT = "Mozilla/5.0 (compatible; AromanianDictBot/1.0; +https://github.com/your-repo)"
+
+try:
+    import h2  # noqa: F401  (installed by httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+def accept_encoding() -> str:
+    """Content codings httpx can decode in this environment."""
+    return "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+
+def create_client(max_connections: int = MAX_CONNECTIONS, http2: bool = True,
+                  timeout: float = TIMEOUT, keepalive_expiry: float = KEEPALIVE_EXPIRY,
+                  **kwargs) -> httpx.AsyncClient:
+    """Create the AsyncClient used for all dixionline.net requests.
+
+    `max_connections` should cover the number of concurrent requests; over
+    HTTP/2 they share one connection anyway. Extra keyword arguments are
+    passed to httpx.AsyncClient.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": accept_encoding(),
+        **kwargs.pop('headers', {}),
+    }
+    return httpx.AsyncClient(
+        http2=http2 and HTTP2_AVAILABLE,
+        limits=limits,
+        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT),
+        headers=headers,
+        follow_redirects=True,
+        **kwargs,
+    )
@@ -4,7 +4,8 @@ Verification script to ensure no entries are missed during scraping.
 
 This script:
 1. Fetches the word count for each letter from the source website
-2. Compares against what we have in our checkpoint/scraped data
+2. Compares against what we have in our checkpoint/scraped data (words
+   skipped because an earlier page already listed them count as covered)
 3. Reports any discrepancies
 """
 
@@ -12,12 +13,14 @@ import asyncio
 import json
 import re
 from pathlib import Path
-import httpx
 from bs4 import BeautifulSoup
 
+from journal import JOURNAL_FILE, load_journal_state
+from transport import create_client
+
 
 BASE_URL = "https://www.dixionline.net"
-CHECKPOINT_FILE = Path("../data/checkpoint.json")
+CHECKPOINT_FILE = Path("../data/checkpoint.json")  # Legacy, read if no journal exists
 JSONL_FILE = Path("../data/dictionary.jsonl")
 
 
@@ -25,7 +28,7 @@ async def get_expected_word_counts() -> dict[str, int]:
     """Fetch expected word counts for each letter from the source."""
     counts = {}
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    async with create_client(max_connections=1) as client:
         for letter in 'abcdefghijklmnopqrstuvwxyz':
             try:
                 url = f"{BASE_URL}/index.php?l={letter}"
@@ -55,19 +58,16 @@ async def get_expected_word_counts() -> dict[str, int]:
     return counts
 
 
-def get_scraped_word_counts() -> dict[str, int]:
-    """Count words scraped per letter from checkpoint."""
-    if not CHECKPOINT_FILE.exists():
-        return {}
-
-    with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-        checkpoint = json.load(f)
+def get_scraped_word_counts() -> tuple[dict[str, int], dict[str, int]]:
+    """Count words scraped and words covered per letter from the checkpoint journal."""
+    state = load_journal_state(JOURNAL_FILE, CHECKPOINT_FILE)
+    return count_by_letter(state.done), count_by_letter(state.covered)
 
-    scraped_words = checkpoint.get('scraped_words', [])
 
-    # Count by first letter
+def count_by_letter(words: set[str]) -> dict[str, int]:
+    """Count words by first letter."""
     counts = {}
-    for word in scraped_words:
+    for word in words:
         if word:
             first_letter = word[0].lower()
             # Handle special characters - map to closest letter
@@ -121,8 +121,8 @@ async def main():
     print("\n1. Fetching expected word counts from source...")
     expected = await get_expected_word_counts()
 
-    print("\n2. Getting scraped word counts from checkpoint...")
-    scraped = get_scraped_word_counts()
+    print("\n2. Getting scraped word counts from checkpoint journal...")
+    scraped, covered = get_scraped_word_counts()
 
     print("\n3. Getting unique headwords from JSONL...")
     headwords = get_unique_headwords_from_jsonl()
@@ -130,22 +130,28 @@ async def main():
     print("\n" + "=" * 60)
     print("COMPARISON REPORT")
     print("=" * 60)
-    print(f"{'Letter':<8} {'Expected':<12} {'Scraped':<12} {'Headwords':<12} {'Status'}")
-    print("-" * 60)
+    print(f"{'Letter':<8} {'Expected':<12} {'Scraped':<12} {'Covered':<12} {'Headwords':<12} {'Status'}")
+    print("-" * 72)
 
     total_expected = 0
     total_scraped = 0
+    total_covered = 0
     total_headwords = 0
 
     for letter in 'abcdefghijklmnopqrstuvwxyz':
         exp = expected.get(letter, 0)
+        cov = covered.get(letter, 0)
         scr = scraped.get(letter, 0)
         hwd = headwords.get(letter, 0)
 
         total_expected += exp if exp > 0 else 0
         total_scraped += scr
+        total_covered += cov
         total_headwords += hwd
 
+        # Covered words were listed on another word's page, so they count as done
+        scr += cov
+
         if exp < 0:
             status = "ERROR"
         elif scr == 0 and exp > 0:
@@ -157,18 +163,15 @@ async def main():
         else:
             status = "N/A"
 
-        print(f"{letter.upper():<8} {exp:<12} {scr:<12} {hwd:<12} {status}")
+        print(f"{letter.upper():<8} {exp:<12} {scr - cov:<12} {cov:<12} {hwd:<12} {status}")
 
-    print("-" * 60)
-    print(f"{'TOTAL':<8} {total_expected:<12} {total_scraped:<12} {total_headwords:<12}")
-    print("=" * 60)
+    print("-" * 72)
+    print(f"{'TOTAL':<8} {total_expected:<12} {total_scraped:<12} {total_covered:<12} {total_headwords:<12}")
+    print("=" * 72)
 
     # Check for failed words
-    if CHECKPOINT_FILE.exists():
-        with open(CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
-            checkpoint = json.load(f)
-
-        failed = checkpoint.get('failed_words', [])
+    if Path(JOURNAL_FILE).exists() or CHECKPOINT_FILE.exists():
+        failed = sorted(load_journal_state(JOURNAL_FILE, CHECKPOINT_FILE).failed)
         if failed:
             print(f"\nWARNING: {len(failed)} failed words:")
             for word in failed[:20]:
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Check the search results parser against recorded expected output.
+
+bench_corpus/expected/ holds, one JSONL line per page, the entries that
+parse_search_results must return for:
+
+    edge_cases.jsonl    the hand-written articles below, covering the
+                        format variants and edge cases
+    results.jsonl       every recorded page in bench_corpus/results/
+
+Each entry must serialize byte for byte as recorded. The expected output
+was produced by the original BeautifulSoup parser, before the rule table,
+so a rule that extracts the wrong thing shows up here even though both
+current parsers share it. Mismatches are printed and make the script exit
+with status 1.
+
+After an intended change to the parser's output, --update re-records the
+expected files from the current parser; review their diff before
+committing it.
+
+Usage:
+    python verify_parser.py
+    python verify_parser.py --update       # Re-record the expected output
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from urllib.parse import unquote
+
+from parser import parse_search_results
+
+
+CORPUS_DIR = Path(__file__).with_name("bench_corpus")
+EXPECTED_DIR = CORPUS_DIR / "expected"
+EDGE_CASE_QUERY = "casã"
+MAX_REPORTED = 10
+
+
+def article(body: str, headword: str = "casã", classes: str = "article") -> str:
+    return (f'<article class="{classes}"><h2><a href="index.php?inputWord={headword}">{headword}</a></h2>'
+            f'<p>{body}</p></article>')
+
+
+def page(*articles: str) -> str:
+    return f'<!DOCTYPE html><html><body><div id="my_text">Rezultate</div>{"".join(articles)}</body></html>'
+
+
+EDGE_CASES = {
+    "curly translations": page(article(
+        '<span class="highlight_pvorb">casã</span> (cá-sã) sf casi – loc iu bãneadzã oaminjlji '
+        '{ro: casă} {fr: maison} {en: house} Et: lat. casa Context: arhit.')),
+    "span translations": page(article(
+        '<span class="highlight_pvorb">casã</span> sf RO: <span class="highlight_ro">casă, locuință</span> '
+        'EN: <span class="highlight_eng">house</span> FR: <span class="highlight_fran">maison</span>')),
+    "span translations in braces": page(article(
+        '<span class="highlight_ro">{fr: nu}</span><span class="highlight_eng">{x}</span>'
+        '<span class="highlight_fran">{y}</span>')),
+    "definition fallback": page(article(
+        '<span class="highlight_arm">loc di bãnare</span> <span class="highlight_arm">altu</span>')),
+    "definition fallback in braces": page(article('<span class="highlight_arm">{ro: casă}</span>')),
+    "vedz tu": page(article('casã sf – vedz tu cãsicã {ro: casă}')),
+    "short definition": page(article('casã sf – om {ro: casă}')),
+    "definition with examples": page(article('casã sf – loc di bãnare ex: tu casã {en: house}')),
+    "examples": page(article(
+        '<span class="highlight_similar">ex:</span> easti-un farmazon (un mason, maltean; icã fig: om arãu); '
+        'alt exemplu; al treilea')),
+    "examples in an element": page(article(
+        '<span class="highlight_similar">ex:</span><i>tu casã; di casã</i> tail')),
+    "examples in an empty element": page(article('<span class="highlight_similar">ex:</span><b></b>')),
+    "examples after a comment": page(article(
+        '<span class="highlight_similar">ex:</span><!-- tu casã; di casã --><i>x</i>')),
+    "examples after an empty comment": page(article(
+        '<span class="highlight_similar">ex:</span><!----><i>x; y</i>')),
+    "examples missing": page(article('<span class="highlight_similar">ex:</span>')),
+    "many examples": page(article(
+        '<span class="highlight_similar">ex:</span> ' + '; '.join(f"exemplu {i}" for i in range(15)))),
+    "pronunciation after a comment": page(article(
+        '<span class="highlight_pvorb">casã</span><!-- (cá-sã) sm -->')),
+    "pronunciation after an element": page(article(
+        '<span class="highlight_pvorb">casã</span><i>(cá-sã) sf</i>')),
+    "part of speech from expr": page(article(
+        '<span class="highlight_pvorb">casã</span> fãrã <span class="highlight_expr">Vb. ADG</span>')),
+    "related terms": page(article(
+        '<span class="highlight_eng">§</span> cãsicã (vedz) <span class="highlight_eng">§</span> cãsoanji '
+        '<span class="highlight_eng">§</span><b>nu</b> <span class="highlight_eng"> § </span>cãsar-/ã')),
+    "expressions": page(article(
+        '<span class="highlight_ex">expr: fac casã</span>; alt <span class="highlight_ex">EXPR: ved</span> '
+        '<b><span class="highlight_ex">expr: nested; tail</span></b> <span class="highlight_ex">nu</span>')),
+    "sources": page(article(
+        '<a class="more" href="#">Altu »</a> <a class="more other" href="#">Dictsiunar armãnescu '
+        '(T.Cunia) Data DB:123>2019-05-01 10:00:00 »</a>')),
+    "test entry headword": page(article('{ro: rom}', headword="aaaa1")),
+    "test entry translation": page(article('casã sf {en: test}')),
+    "no paragraph": page('<article class="article"><h2>casã</h2><div>text</div></article>'),
+    "no headword": page('<article class="article"><p>casã sf</p></article>'),
+    "empty headword": page('<article class="article"><h2><a href="#"> </a></h2><p>x</p></article>'),
+    "headword without a link": page('<article class="article"><h2> casã <b>mari</b></h2><p>x</p></article>'),
+    "headword with a comment": page('<article class="article"><h2><a>ca<!--x-->sã</a></h2><p>x</p></article>'),
+    "other article classes": page(article('casã sf {ro: casă}', classes="big article"),
+                                  article('casã sf {ro: casã}', classes="articles")),
+    "script and style": page(article(
+        'casã sf <script>var x = "{ro: nu}";</script>– loc di bãnare <style>.a{}</style>'
+        '<span class="highlight_arm">def<script>x()</script>init</span> {ro: casă}')),
+    "ruby text": page(article('casã sf – loc <ruby>di<rt>ignored</rt></ruby> bãnare {ro: casă}')),
+    "entities and whitespace": page(article(
+        'casã&nbsp;sf\n\t– loc&hellip; di &amp; bãnare &unknown; {ro:\n casă } {en: }')),
+    "nested paragraphs": page(article('casã <p>sf – loc di bãnare {ro: casă}</p>')),
+    "several articles": page(*(article(f'casã{i} sf – loc di bãnare {{ro: casă}}', headword=f"casã{i}")
+                               for i in range(5))),
+    "no articles": page(),
+    "empty page": "",
+    "whitespace page": " \n ",
+    "fragment": '<article class="article"><h2>casã</h2><p>casã sf – loc di bãnare</p>',
+}
+
+
+def corpus(corpus_dir: Path = CORPUS_DIR) -> dict[str, list[tuple[str, str, str]]]:
+    """(page name, html, query word) of each page, by expected file name."""
+    results = [(path.name, path.read_text(encoding='utf-8'), unquote(path.stem))
+               for path in sorted((corpus_dir / "results").glob("*.html"))]
+    return {
+        "edge_cases.jsonl": [(name, html, EDGE_CASE_QUERY) for name, html in EDGE_CASES.items()],
+        "results.jsonl": results,
+    }
+
+
+def parse(html: str, query: str) -> list[str]:
+    """The entries parse_search_results returns, serialized."""
+    return [entry.to_json() for entry in parse_search_results(html, query)]
+
+
+def read_expected(path: Path) -> dict[str, list[str]]:
+    """Serialized expected entries by page name."""
+    expected = {}
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                expected[record["page"]] = [json.dumps(entry, ensure_ascii=False)
+                                            for entry in record["entries"]]
+    return expected
+
+
+def write_expected(path: Path, pages: list[tuple[str, str, str]]):
+    with open(path, 'w', encoding='utf-8') as f:
+        for name, html, query in pages:
+            entries = [json.loads(entry) for entry in parse(html, query)]
+            f.write(json.dumps({"page": name, "query": query, "entries": entries}, ensure_ascii=False) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the results parser against recorded expected output")
+    parser.add_argument('--update', action='store_true',
+                        help='Re-record the expected output from the current parser')
+    args = parser.parse_args()
+
+    if args.update:
+        EXPECTED_DIR.mkdir(exist_ok=True)
+        for filename, pages in corpus().items():
+            write_expected(EXPECTED_DIR / filename, pages)
+            print(f"Recorded {len(pages)} pages to {EXPECTED_DIR / filename}")
+        return
+
+    pages = 0
+    entries = 0
+    mismatches = 0
+    for filename, corpus_pages in corpus().items():
+        expected = read_expected(EXPECTED_DIR / filename)
+        for name, html, query in corpus_pages:
+            pages += 1
+            actual = parse(html, query)
+            entries += len(actual)
+            if name not in expected:
+                mismatches += 1
+                print(f"\nNO EXPECTED OUTPUT {filename}: {name} (record it with --update)")
+            elif actual != expected[name]:
+                mismatches += 1
+                if mismatches <= MAX_REPORTED:
+                    print(f"\nMISMATCH {filename}: {name}")
+                    for line in expected[name]:
+                        if line not in actual:
+                            print(f"  - {line}")
+                    for line in actual:
+                        if line not in expected[name]:
+                            print(f"  + {line}")
+                    if sorted(actual) == sorted(expected[name]):
+                        print("  (same entries, different order)")
+
+    print(f"\n{pages} pages, {entries} entries, {mismatches} mismatches")
+    if mismatches:
+        sys.exit(1)
+    print("The parser matches the expected output on every page.")
+
+
+if __name__ == "__main__":
+    main()